@@ -0,0 +1,151 @@
+"""
+Микробенчмарк стоимости одной строки на списочных эндпоинтах.
+
+Сравнивает прежний путь (валидирующий конструктор схемы в to_read_model,
+затем повторная валидация response_model, dump_python и json.dumps в FastAPI)
+с доверенным путём (construct_trusted + предкомпилированный TypeAdapter.dump_json).
+Для сравнения печатается и вариант на model_construct. БД не нужна: ORM-объекты
+создаются в памяти.
+
+    python -m benchmarks.bench_hydration --questions 1000 --answers 5
+"""
+
+import argparse
+import json
+import time
+from datetime import UTC, datetime
+
+from pydantic import TypeAdapter
+
+from src.db.models.answer_model import AnswerOrm
+from src.db.models.question_model import QuestionOrm
+from src.schemas import AnswerSchema, QuestionSchema
+from src.schemas.pagination_schema import PageSchema
+from src.utils.serialization import QUESTIONS_PAGE_ADAPTER
+
+
+def make_rows(questions: int, answers: int) -> list[QuestionOrm]:
+    created_at = datetime(2026, 1, 1, 12, 0, 0, 123456, tzinfo=UTC)
+    rows = []
+    answer_id = 0
+    for question_id in range(1, questions + 1):
+        question = QuestionOrm(
+            id=question_id,
+            text=f"Вопрос {question_id}",
+            created_at=created_at,
+            answer_count=answers,
+            last_answered_at=created_at if answers else None,
+        )
+        for _ in range(answers):
+            answer_id += 1
+            question.answers.append(
+                AnswerOrm(
+                    id=answer_id,
+                    question_id=question_id,
+                    user_id="e2b50b32-76ae-42f9-a012-4e5ae315645b",
+                    text=f"Ответ {answer_id}",
+                    created_at=created_at,
+                )
+            )
+        rows.append(question)
+    return rows
+
+
+def validated_read_model(question: QuestionOrm) -> QuestionSchema:
+    # так to_read_model работал до перехода на model_construct
+    return QuestionSchema(
+        id=question.id,
+        text=question.text,
+        created_at=question.created_at,
+        answer_count=question.answer_count,
+        last_answered_at=question.last_answered_at,
+        answers=[
+            AnswerSchema(
+                user_id=answer.user_id,
+                text=answer.text,
+                id=answer.id,
+                question_id=answer.question_id,
+                created_at=answer.created_at,
+            )
+            for answer in question.answers
+        ],
+    )
+
+
+_response_field = TypeAdapter(PageSchema[QuestionSchema])
+
+
+def before(rows: list[QuestionOrm]) -> bytes:
+    page = PageSchema[QuestionSchema](items=[validated_read_model(r) for r in rows])
+    # FastAPI: response_model валидирует ещё раз, затем dump_python + json.dumps
+    value = _response_field.validate_python(page.model_dump())
+    return json.dumps(_response_field.dump_python(value, mode="json")).encode()
+
+
+def model_construct_read_model(question: QuestionOrm) -> QuestionSchema:
+    return QuestionSchema.model_construct(
+        id=question.id,
+        text=question.text,
+        created_at=question.created_at,
+        answer_count=question.answer_count,
+        last_answered_at=question.last_answered_at,
+        answers=[
+            AnswerSchema.model_construct(
+                user_id=answer.user_id,
+                text=answer.text,
+                id=answer.id,
+                question_id=answer.question_id,
+                created_at=answer.created_at,
+            )
+            for answer in question.answers
+        ],
+    )
+
+
+def with_model_construct(rows: list[QuestionOrm]) -> bytes:
+    page = PageSchema[QuestionSchema](
+        items=[model_construct_read_model(r) for r in rows]
+    )
+    return QUESTIONS_PAGE_ADAPTER.dump_json(page)
+
+
+def after(rows: list[QuestionOrm]) -> bytes:
+    page = PageSchema[QuestionSchema](items=[row.to_read_model() for row in rows])
+    return QUESTIONS_PAGE_ADAPTER.dump_json(page)
+
+
+def measure(fn, rows, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--questions", type=int, default=1000)
+    parser.add_argument("--answers", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.questions, args.answers)
+    assert json.loads(before(rows)) == json.loads(after(rows))
+
+    variants = (
+        ("before", before),
+        ("model_construct", with_model_construct),
+        ("after", after),
+    )
+    for name, fn in variants:
+        best = measure(fn, rows, args.repeat)
+        print(
+            f"{name:>15}: {best * 1000:8.2f} ms total, "
+            f"{best / args.questions * 1e6:7.2f} us/question "
+            f"({args.answers} answers each)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Стоимость сериализации ответа: стандартный путь FastAPI против PydanticJSONResponse.
+
+Одна и та же страница вопросов отдаётся через минимальное приложение
+FastAPI, вызываемое напрямую по ASGI (без сети):
+
+- default — эндпоинт возвращает модель: FastAPI валидирует её по
+  response_model, превращает в dict и кодирует json.dumps;
+- to_json — эндпоинт возвращает PydanticJSONResponse(page);
+- adapter — json_response с предкомпилированным TypeAdapter.
+
+БД не нужна: модели строятся в памяти.
+
+    python -m benchmarks.bench_json_response --questions 1000 10000 --answers 3
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from fastapi import FastAPI
+
+from benchmarks.bench_hydration import make_rows
+from src.schemas import QuestionSchema
+from src.schemas.pagination_schema import PageSchema
+from src.utils.serialization import (
+    QUESTIONS_PAGE_ADAPTER,
+    PydanticJSONResponse,
+    json_response,
+)
+
+
+def make_app(page: PageSchema[QuestionSchema]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=PageSchema[QuestionSchema])
+    async def default():
+        return page
+
+    @app.get("/to_json", response_model=PageSchema[QuestionSchema])
+    async def fast():
+        return PydanticJSONResponse(page)
+
+    @app.get("/adapter", response_model=PageSchema[QuestionSchema])
+    async def adapter():
+        return json_response(QUESTIONS_PAGE_ADAPTER, page)
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 1),
+        "server": ("127.0.0.1", 80),
+    }
+    body = bytearray()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return bytes(body)
+
+
+async def measure(app: FastAPI, path: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call(app, path)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--questions", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--answers", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for questions in args.questions:
+        page = PageSchema[QuestionSchema](
+            items=[row.to_read_model() for row in make_rows(questions, args.answers)]
+        )
+        app = make_app(page)
+        expected = json.loads(await call(app, "/default"))
+        for path in ("/to_json", "/adapter"):
+            assert json.loads(await call(app, path)) == expected
+
+        baseline = None
+        for path in ("/default", "/to_json", "/adapter"):
+            elapsed = await measure(app, path, args.repeat)
+            baseline = baseline or elapsed
+            print(
+                f"{questions:>6} questions {path[1:]:>8}: "
+                f"{elapsed * 1000:8.1f} ms  x{baseline / elapsed:4.1f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -8,6 +8,8 @@ from sqlalchemy import engine_from_config, pool
 from src.core.config import DbConfig
 from src.db.models.answer_model import AnswerOrm  # noqa
 from src.db.models.base_model import Base  # noqa
+from src.db.models.change_model import ChangeOrm  # noqa
+from src.db.models.idempotency_model import IdempotencyKeyOrm  # noqa
 from src.db.models.question_model import QuestionOrm  # noqa
 
 os.environ.setdefault("DB_PORT", "5432")
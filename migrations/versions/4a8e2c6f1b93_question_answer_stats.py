@@ -0,0 +1,115 @@
+"""question answer stats
+
+Revision ID: 4a8e2c6f1b93
+Revises: c7d41a2f8e63
+Create Date: 2026-10-18 13:02:44.918210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a8e2c6f1b93'
+down_revision: Union[str, Sequence[str], None] = 'c7d41a2f8e63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# замороженная копия src/db/triggers.py на момент ревизии
+ANSWER_STATS_DDL = (
+    """
+CREATE OR REPLACE FUNCTION answers_stats_after_insert() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM 1 FROM questions
+    WHERE id IN (SELECT question_id FROM new_answers)
+    ORDER BY id
+    FOR UPDATE;
+
+    UPDATE questions AS q
+    SET answer_count = q.answer_count + n.added,
+        last_answered_at = GREATEST(q.last_answered_at, n.last_created_at)
+    FROM (
+        SELECT question_id, count(*) AS added, max(created_at) AS last_created_at
+        FROM new_answers
+        GROUP BY question_id
+    ) AS n
+    WHERE q.id = n.question_id;
+    RETURN NULL;
+END;
+$$
+""",
+    """
+CREATE OR REPLACE FUNCTION answers_stats_after_delete() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM 1 FROM questions
+    WHERE id IN (SELECT question_id FROM old_answers)
+    ORDER BY id
+    FOR UPDATE;
+
+    -- последний ответ мог быть удалён: берём max по индексу
+    -- (question_id, created_at, id) среди оставшихся
+    UPDATE questions AS q
+    SET answer_count = q.answer_count - o.removed,
+        last_answered_at = (
+            SELECT max(a.created_at) FROM answers AS a WHERE a.question_id = q.id
+        )
+    FROM (
+        SELECT question_id, count(*) AS removed
+        FROM old_answers
+        GROUP BY question_id
+    ) AS o
+    WHERE q.id = o.question_id;
+    RETURN NULL;
+END;
+$$
+""",
+    """
+CREATE TRIGGER answers_stats_insert
+AFTER INSERT ON answers
+REFERENCING NEW TABLE AS new_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_stats_after_insert()
+""",
+    """
+CREATE TRIGGER answers_stats_delete
+AFTER DELETE ON answers
+REFERENCING OLD TABLE AS old_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_stats_after_delete()
+""",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('questions', sa.Column('answer_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('questions', sa.Column('last_answered_at', sa.DateTime(timezone=True), nullable=True))
+    # заполняем по уже существующим ответам; триггеры ниже ведут поля дальше
+    op.execute("""
+        UPDATE questions AS q
+        SET answer_count = a.answer_count, last_answered_at = a.last_answered_at
+        FROM (
+            SELECT question_id, count(*) AS answer_count, max(created_at) AS last_answered_at
+            FROM answers
+            GROUP BY question_id
+        ) AS a
+        WHERE q.id = a.question_id
+    """)
+    op.create_index('ix_questions_answer_count_id', 'questions', ['answer_count', 'id'], unique=False)
+    op.create_index('ix_questions_last_activity_at_id', 'questions', [sa.text('coalesce(last_answered_at, created_at)'), 'id'], unique=False)
+    for statement in ANSWER_STATS_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER IF EXISTS answers_stats_delete ON answers')
+    op.execute('DROP TRIGGER IF EXISTS answers_stats_insert ON answers')
+    op.execute('DROP FUNCTION IF EXISTS answers_stats_after_delete()')
+    op.execute('DROP FUNCTION IF EXISTS answers_stats_after_insert()')
+    op.drop_index('ix_questions_last_activity_at_id', table_name='questions')
+    op.drop_index('ix_questions_answer_count_id', table_name='questions')
+    op.drop_column('questions', 'last_answered_at')
+    op.drop_column('questions', 'answer_count')
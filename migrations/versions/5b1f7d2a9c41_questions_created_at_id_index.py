@@ -0,0 +1,28 @@
+"""questions created_at id index
+
+Revision ID: 5b1f7d2a9c41
+Revises: c032eca8759a
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1f7d2a9c41'
+down_revision: Union[str, Sequence[str], None] = 'c032eca8759a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_questions_created_at_id', 'questions', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_questions_created_at_id', table_name='questions')
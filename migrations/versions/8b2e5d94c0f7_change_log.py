@@ -0,0 +1,113 @@
+"""change log
+
+Revision ID: 8b2e5d94c0f7
+Revises: d51f07b3a2c4
+Create Date: 2026-10-18 13:58:27.660391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e5d94c0f7'
+down_revision: Union[str, Sequence[str], None] = 'd51f07b3a2c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# замороженная копия src/db/triggers.py на момент ревизии
+CHANGE_LOG_DDL = (
+    """
+CREATE OR REPLACE FUNCTION questions_change_log() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO change_log (txid, entity, entity_id, question_id, op)
+    SELECT pg_current_xact_id()::text::bigint, 'question', id, id,
+           lower(TG_OP)
+    FROM changed_rows
+    ORDER BY id;
+    RETURN NULL;
+END;
+$$
+""",
+    """
+CREATE TRIGGER questions_change_log_insert
+AFTER INSERT ON questions
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT EXECUTE FUNCTION questions_change_log()
+""",
+    """
+CREATE TRIGGER questions_change_log_delete
+AFTER DELETE ON questions
+REFERENCING OLD TABLE AS changed_rows
+FOR EACH STATEMENT EXECUTE FUNCTION questions_change_log()
+""",
+    """
+CREATE OR REPLACE FUNCTION answers_change_log() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO change_log (txid, entity, entity_id, question_id, op)
+    SELECT pg_current_xact_id()::text::bigint, 'answer', id, question_id,
+           lower(TG_OP)
+    FROM changed_rows
+    ORDER BY id;
+    RETURN NULL;
+END;
+$$
+""",
+    """
+CREATE TRIGGER answers_change_log_insert
+AFTER INSERT ON answers
+REFERENCING NEW TABLE AS changed_rows
+FOR EACH STATEMENT EXECUTE FUNCTION answers_change_log()
+""",
+    """
+CREATE TRIGGER answers_change_log_delete
+AFTER DELETE ON answers
+REFERENCING OLD TABLE AS changed_rows
+FOR EACH STATEMENT EXECUTE FUNCTION answers_change_log()
+""",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('change_log',
+    sa.Column('id', sa.BigInteger(), sa.Identity(always=False), nullable=False),
+    sa.Column('txid', sa.BigInteger(), nullable=False),
+    sa.Column('entity', sa.String(length=16), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('op', sa.String(length=16), nullable=False),
+    sa.Column('changed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_change_log_txid_id', 'change_log', ['txid', 'id'], unique=False)
+    # существующие строки — вставками этой транзакции: лента с начала
+    # даёт клиенту полный набор данных
+    op.execute("""
+        INSERT INTO change_log (txid, entity, entity_id, question_id, op, changed_at)
+        SELECT pg_current_xact_id()::text::bigint, 'question', id, id, 'insert', created_at
+        FROM questions
+        ORDER BY id
+    """)
+    op.execute("""
+        INSERT INTO change_log (txid, entity, entity_id, question_id, op, changed_at)
+        SELECT pg_current_xact_id()::text::bigint, 'answer', id, question_id, 'insert', created_at
+        FROM answers
+        ORDER BY id
+    """)
+    for statement in CHANGE_LOG_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('answers', 'questions'):
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_change_log_delete ON {table}')
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_change_log_insert ON {table}')
+        op.execute(f'DROP FUNCTION IF EXISTS {table}_change_log()')
+    op.drop_index('ix_change_log_txid_id', table_name='change_log')
+    op.drop_table('change_log')
@@ -0,0 +1,31 @@
+"""answers question_id created_at id index
+
+Revision ID: 9e3a61c0d7b5
+Revises: 5b1f7d2a9c41
+Create Date: 2026-10-18 11:04:52.771093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e3a61c0d7b5'
+down_revision: Union[str, Sequence[str], None] = '5b1f7d2a9c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # составной индекс начинается с question_id, поэтому заменяет одиночный
+    op.create_index('ix_answers_question_id_created_at_id', 'answers', ['question_id', 'created_at', 'id'], unique=False)
+    op.drop_index(op.f('ix_answers_question_id'), table_name='answers')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_answers_question_id'), 'answers', ['question_id'], unique=False)
+    op.drop_index('ix_answers_question_id_created_at_id', table_name='answers')
@@ -0,0 +1,62 @@
+"""answers notify skips bulk load
+
+Revision ID: a4c81e6d3f25
+Revises: f2a8c5d19e47
+Create Date: 2026-10-18 17:40:12.604913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c81e6d3f25'
+down_revision: Union[str, Sequence[str], None] = 'f2a8c5d19e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# замороженная копия src/db/triggers.py на момент ревизии
+ANSWER_NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION answers_notify_after_insert() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF current_setting('app.bulk_load', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+    PERFORM pg_notify(
+        'answers_created',
+        json_build_object('id', id, 'question_id', question_id)::text
+    )
+    FROM new_answers
+    ORDER BY id;
+    RETURN NULL;
+END;
+$$
+"""
+
+# функция из e6c93a17d842
+PREVIOUS_ANSWER_NOTIFY_FUNCTION = """
+CREATE OR REPLACE FUNCTION answers_notify_after_insert() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_notify(
+        'answers_created',
+        json_build_object('id', id, 'question_id', question_id)::text
+    )
+    FROM new_answers
+    ORDER BY id;
+    RETURN NULL;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(ANSWER_NOTIFY_FUNCTION)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(PREVIOUS_ANSWER_NOTIFY_FUNCTION)
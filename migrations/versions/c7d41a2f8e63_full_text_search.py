@@ -0,0 +1,37 @@
+"""full text search
+
+Revision ID: c7d41a2f8e63
+Revises: 9e3a61c0d7b5
+Create Date: 2026-10-18 12:41:09.318554
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d41a2f8e63'
+down_revision: Union[str, Sequence[str], None] = '9e3a61c0d7b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # STORED-колонка переписывает таблицу под ACCESS EXCLUSIVE: на больших
+    # таблицах накатывать в окно обслуживания
+    op.add_column('questions', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('simple', text)", persisted=True), nullable=True))
+    op.add_column('answers', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed("to_tsvector('simple', text)", persisted=True), nullable=True))
+    op.create_index('ix_questions_search_vector', 'questions', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_answers_search_vector', 'answers', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_answers_search_vector', table_name='answers', postgresql_using='gin')
+    op.drop_index('ix_questions_search_vector', table_name='questions', postgresql_using='gin')
+    op.drop_column('answers', 'search_vector')
+    op.drop_column('questions', 'search_vector')
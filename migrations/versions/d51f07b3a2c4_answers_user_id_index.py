@@ -0,0 +1,28 @@
+"""answers user_id index
+
+Revision ID: d51f07b3a2c4
+Revises: 4a8e2c6f1b93
+Create Date: 2026-10-18 13:31:52.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd51f07b3a2c4'
+down_revision: Union[str, Sequence[str], None] = '4a8e2c6f1b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_answers_user_id_created_at_id', 'answers', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_answers_user_id_created_at_id', table_name='answers')
@@ -0,0 +1,53 @@
+"""answers notify trigger
+
+Revision ID: e6c93a17d842
+Revises: 8b2e5d94c0f7
+Create Date: 2026-10-18 14:26:03.118470
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6c93a17d842'
+down_revision: Union[str, Sequence[str], None] = '8b2e5d94c0f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# замороженная копия src/db/triggers.py на момент ревизии
+ANSWER_NOTIFY_DDL = (
+    """
+CREATE OR REPLACE FUNCTION answers_notify_after_insert() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_notify(
+        'answers_created',
+        json_build_object('id', id, 'question_id', question_id)::text
+    )
+    FROM new_answers
+    ORDER BY id;
+    RETURN NULL;
+END;
+$$
+""",
+    """
+CREATE TRIGGER answers_notify_insert
+AFTER INSERT ON answers
+REFERENCING NEW TABLE AS new_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_notify_after_insert()
+""",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for statement in ANSWER_NOTIFY_DDL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER IF EXISTS answers_notify_insert ON answers')
+    op.execute('DROP FUNCTION IF EXISTS answers_notify_after_insert()')
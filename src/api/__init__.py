@@ -1,8 +1,11 @@
 from fastapi import APIRouter
 
 from .health import router as health_router
+from .v1.admin import router as admin_router
 from .v1.answers import router as answers_router
+from .v1.changes import router as changes_router
 from .v1.questions import router as questions_router
+from .v1.search import router as search_router
 
 api_router = APIRouter(prefix="/api")
 
@@ -10,3 +13,6 @@ api_router.include_router(health_router, prefix="/health", tags=["health"])
 # Версия v1
 api_router.include_router(questions_router, prefix="/v1", tags=["questions"])
 api_router.include_router(answers_router, prefix="/v1", tags=["answers"])
+api_router.include_router(search_router, prefix="/v1", tags=["search"])
+api_router.include_router(changes_router, prefix="/v1", tags=["changes"])
+api_router.include_router(admin_router, prefix="/v1", tags=["admin"])
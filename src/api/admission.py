@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+from fastapi import FastAPI
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import AdmissionConfig
+from src.core.metrics import ADMISSION_QUEUED, ADMISSION_REJECTED, ADMISSION_WAIT
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ConcurrencyLimiter:
+    """
+    Не больше limit одновременных запросов; остальные ждут слот не дольше max_wait.
+
+    Ждущих не больше max_queue. При переполнении очереди или по таймауту
+    acquire возвращает причину отказа, и запрос получает 503 сразу, а не
+    висит в очереди к пулу соединений.
+    """
+
+    def __init__(self, name: str, limit: int, max_wait: float, max_queue: int):
+        self.name = name
+        self.limit = limit
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self.active = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    async def acquire(self) -> str | None:
+        """None — слот получен, иначе причина отказа: queue_full или timeout."""
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            self.active += 1
+            return None
+        if self.waiting >= self.max_queue:
+            return "queue_full"
+        ADMISSION_QUEUED.inc(self.name)
+        self.waiting += 1
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.max_wait):
+                await self._semaphore.acquire()
+        except TimeoutError:
+            return "timeout"
+        finally:
+            self.waiting -= 1
+            ADMISSION_WAIT.observe(time.perf_counter() - started, self.name)
+        self.active += 1
+        return None
+
+    def release(self) -> None:
+        self.active -= 1
+        self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_queue": self.max_queue,
+        }
+
+
+class AdmissionController:
+    """Лимитеры чтений и записей и выбор лимитера для запроса."""
+
+    def __init__(self, config: AdmissionConfig):
+        self.config = config
+        max_wait = config.max_wait_ms / 1000
+        self.limiters = {
+            "read": ConcurrencyLimiter(
+                "read", config.read_limit, max_wait, config.max_queue
+            ),
+            "write": ConcurrencyLimiter(
+                "write", config.write_limit, max_wait, config.max_queue
+            ),
+        }
+        self._exempt_paths = tuple(config.exempt_paths)
+
+    def limiter_for(self, scope: Scope) -> ConcurrencyLimiter | None:
+        if scope["path"].startswith(self._exempt_paths):
+            return None
+        if scope["method"] in READ_METHODS:
+            return self.limiters["read"]
+        return self.limiters["write"]
+
+    def stats(self) -> dict:
+        return {name: limiter.stats() for name, limiter in self.limiters.items()}
+
+
+class AdmissionMiddleware:
+    """
+    Ограничивает число одновременных запросов к API отдельно для чтений и записей.
+
+    Когда Postgres тормозит, запросы копятся в ожидании соединения из пула,
+    и задержка растёт у всех. Здесь лишние запросы ждут слот не дольше
+    max_wait_ms, а дальше получают 503 с Retry-After — клиент повторит
+    позже, а event loop не забивается зависшими корутинами. Пути из
+    exempt_paths (health, metrics) лимитам не подчиняются.
+
+    Слот держится до конца ответа: потоковая выгрузка читает курсор всё
+    это время. Исключение — text/event-stream: SSE-поток ходит в БД только
+    до заголовков, а живёт сколько угодно долго. Лимитеры берутся из
+    app.state.admission (см. lifespan); без них запросы проходят как есть.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        controller: AdmissionController | None = getattr(
+            scope["app"].state, "admission", None
+        )
+        limiter = controller.limiter_for(scope) if controller is not None else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        rejection = await limiter.acquire()
+        if rejection is not None:
+            ADMISSION_REJECTED.inc(limiter.name, rejection)
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "Server is overloaded"},
+                headers={"Retry-After": str(controller.config.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                limiter.release()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                content_type = Headers(raw=message["headers"]).get("content-type", "")
+                if content_type.startswith("text/event-stream"):
+                    release()
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            release()
+
+
+def setup_admission_control(app: FastAPI) -> None:
+    app.add_middleware(AdmissionMiddleware)
@@ -1,3 +1,4 @@
+import functools
 import logging
 
 from fastapi import APIRouter, FastAPI
@@ -5,9 +6,18 @@ from starlette import status
 from starlette.responses import JSONResponse
 
 from src.core.domain_exceptions import (
+    AdminDisabledException,
     AnswerNotFoundException,
+    AnswerStreamUnavailableException,
+    BatchQuestionNotFoundException,
+    DatasetImportException,
+    IdempotencyKeyMismatchException,
+    IngestionQueueFullException,
+    InvalidCursorException,
     QuestionNotFoundException,
+    TicketNotFoundException,
 )
+from src.core.metrics import APP_ERRORS
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +44,85 @@ async def answer_not_found_handler(request, exc):
     )
 
 
+async def batch_question_not_found_handler(request, exc):
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND,
+        content={"detail": "Question not found", "items": exc.items},
+    )
+
+
+async def invalid_cursor_handler(request, exc):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST, content={"detail": "Invalid cursor"}
+    )
+
+
+async def ingestion_queue_full_handler(request, exc):
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Ingestion queue is full"},
+        headers={"Retry-After": "1"},
+    )
+
+
+async def ticket_not_found_handler(request, exc):
+    return JSONResponse(
+        status_code=status.HTTP_404_NOT_FOUND, content={"detail": "Ticket not found"}
+    )
+
+
+async def answer_stream_unavailable_handler(request, exc):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Answer stream is disabled"},
+    )
+
+
+async def dataset_import_handler(request, exc):
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        content={"detail": exc.detail},
+    )
+
+
+async def admin_disabled_handler(request, exc):
+    return JSONResponse(
+        status_code=status.HTTP_403_FORBIDDEN,
+        content={"detail": "Admin endpoints are disabled"},
+    )
+
+
+async def idempotency_key_mismatch_handler(request, exc):
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+        content={"detail": "Idempotency-Key was used with a different request"},
+    )
+
+
+def counted(handler):
+    """Считает обработанные исключения в APP_ERRORS по имени класса."""
+
+    @functools.wraps(handler)
+    async def wrapper(request, exc):
+        APP_ERRORS.inc(type(exc).__name__)
+        return await handler(request, exc)
+
+    return wrapper
+
+
 def setup_exception_handlers(app: FastAPI) -> None:
-    app.add_exception_handler(AnswerNotFoundException, answer_not_found_handler)
-    app.add_exception_handler(QuestionNotFoundException, question_not_found_handler)
-    app.add_exception_handler(Exception, global_exception_handler)
+    handlers = {
+        AnswerNotFoundException: answer_not_found_handler,
+        QuestionNotFoundException: question_not_found_handler,
+        InvalidCursorException: invalid_cursor_handler,
+        BatchQuestionNotFoundException: batch_question_not_found_handler,
+        IngestionQueueFullException: ingestion_queue_full_handler,
+        TicketNotFoundException: ticket_not_found_handler,
+        AnswerStreamUnavailableException: answer_stream_unavailable_handler,
+        DatasetImportException: dataset_import_handler,
+        AdminDisabledException: admin_disabled_handler,
+        IdempotencyKeyMismatchException: idempotency_key_mismatch_handler,
+        Exception: global_exception_handler,
+    }
+    for exc_class, handler in handlers.items():
+        app.add_exception_handler(exc_class, counted(handler))
@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 router = APIRouter(tags=["health"])
 
@@ -11,3 +11,39 @@ router = APIRouter(tags=["health"])
 )
 async def health():
     return {"status": "ok"}
+
+
+@router.get(
+    "/cache",
+    status_code=200,
+    summary="Статистика кэша вопросов",
+    responses={200: {"description": "Questions cache counters"}},
+)
+async def cache_stats(request: Request):
+    cache = getattr(request.app.state, "questions_cache", None)
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@router.get(
+    "/admission",
+    status_code=200,
+    summary="Состояние admission control",
+    responses={200: {"description": "Admission slots in use and waiting requests"}},
+)
+async def admission_stats(request: Request):
+    admission = getattr(request.app.state, "admission", None)
+    if admission is None:
+        return {"enabled": False}
+    return {"enabled": True, **admission.stats()}
+
+
+@router.get(
+    "/pool",
+    status_code=200,
+    summary="Состояние пула соединений",
+    responses={200: {"description": "Connection pool gauges and wait times"}},
+)
+async def pool_stats(request: Request):
+    return request.app.state.db.pool_status()
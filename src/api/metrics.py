@@ -0,0 +1,67 @@
+import time
+
+from fastapi import APIRouter, FastAPI
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS, REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+# запросы, не попавшие ни в один маршрут, не должны плодить метки
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Считает запросы и их длительность по шаблону маршрута.
+
+    Шаблон (например, /api/v1/questions/{question_id}) берётся из
+    scope["route"], который роутер Starlette заполняет при сопоставлении,
+    поэтому число меток ограничено числом маршрутов, а не URL.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            template = getattr(route, "path_format", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            HTTP_REQUESTS.inc(method, template, str(status_code))
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started, method, template
+            )
+
+
+@router.get(
+    "/metrics",
+    status_code=200,
+    summary="Метрики в формате Prometheus",
+    include_in_schema=False,
+)
+async def metrics():
+    return Response(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+def setup_metrics(app: FastAPI) -> None:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(router)
@@ -0,0 +1,62 @@
+import logging
+
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import QueryStatsConfig
+from src.db.query_stats import QueryStats, start_query_stats, stop_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    Собирает число SQL-запросов и время в БД за HTTP-запрос.
+
+    Итог уходит в заголовок Server-Timing и в debug-лог. У потоковых ответов
+    заголовок отправляется до конца выборки, поэтому в нём только запросы,
+    выполненные до первого чанка; лог пишется по завершении ответа.
+    Настройки берутся из app.state.query_stats_config (см. lifespan).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        config = getattr(scope["app"].state, "query_stats_config", QueryStatsConfig())
+        if not config.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(
+            repeat_threshold=config.repeat_threshold,
+            raise_on_repeat=config.raise_on_repeat,
+        )
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        token = start_query_stats(stats)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            stop_query_stats(token)
+            logger.debug(
+                "%s %s: %d queries, %.1f ms in DB",
+                scope["method"],
+                scope["path"],
+                stats.count,
+                stats.duration * 1000,
+            )
+
+
+def setup_query_stats(app: FastAPI) -> None:
+    app.add_middleware(QueryStatsMiddleware)
@@ -0,0 +1,75 @@
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from src.api.v1.deps import get_dataset_service
+from src.schemas.dataset_schema import DatasetImportResultSchema
+from src.services.dataset_service import DatasetService
+from src.utils.dataset import DatasetFormat
+from src.utils.streaming import ClosingStreamingResponse, start_stream
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin/dataset", tags=["admin"])
+
+_DATASET_CONTENT = {
+    "application/x-ndjson": {},
+    "text/csv": {},
+}
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Выгрузка всех вопросов и ответов",
+    description=(
+        "Отдаёт весь набор потоком по мере чтения серверного курсора: NDJSON "
+        "(запись на строку) или CSV. Записи вопросов и ответов различаются "
+        "полем type; файл принимает POST этого же адреса."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"description": "Dataset", "content": _DATASET_CONTENT},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin endpoints are disabled"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+    },
+)
+async def export_dataset_endpoint(
+    dataset_service: Annotated[DatasetService, Depends(get_dataset_service)],
+    format: Annotated[DatasetFormat, Query()] = DatasetFormat.ndjson,
+):
+    chunks = dataset_service.export_dataset(format)
+    return ClosingStreamingResponse(
+        await start_stream(chunks),
+        media_type=format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="dataset.{format}"'},
+    )
+
+
+@router.post(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Загрузка вопросов и ответов",
+    description=(
+        "Принимает файл выгрузки телом запроса и загружает его в одной "
+        "транзакции. Вопросы получают новые id, question_id ответов "
+        "переводится на них. При любой ошибке не загружается ничего."
+    ),
+    response_model=DatasetImportResultSchema,
+    responses={
+        status.HTTP_200_OK: {"description": "Dataset imported"},
+        status.HTTP_403_FORBIDDEN: {"description": "Admin endpoints are disabled"},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"description": "Invalid dataset"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+    },
+    openapi_extra={"requestBody": {"required": True, "content": _DATASET_CONTENT}},
+)
+async def import_dataset_endpoint(
+    request: Request,
+    dataset_service: Annotated[DatasetService, Depends(get_dataset_service)],
+    format: Annotated[DatasetFormat, Query()] = DatasetFormat.ndjson,
+):
+    # тело читается потоком, целиком в памяти не оказывается
+    return await dataset_service.import_dataset(request.stream(), format)
@@ -1,25 +1,72 @@
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Header, Path, Query, status
+from fastapi.responses import StreamingResponse
 
-from src.api.v1.deps import get_answers_service
-from src.schemas.answers_schema import AnswerCreateSchema, AnswerSchema
+from src.api.v1.deps import (
+    get_answer_event_hub,
+    get_answers_service,
+    get_questions_service,
+)
+from src.core.domain_exceptions import AnswerStreamUnavailableException
+from src.schemas.answers_schema import (
+    AnswerBatchCreateSchema,
+    AnswerCreateSchema,
+    AnswerSchema,
+    AnswerTicketSchema,
+)
+from src.schemas.pagination_schema import PageSchema
+from src.services.answer_events import AnswerEventHub, iter_answer_events
 from src.services.answers_service import AnswersService
+from src.services.questions_service import QuestionsService
+from src.utils.serialization import (
+    ANSWERS_PAGE_ADAPTER,
+    PydanticJSONResponse,
+    json_response,
+)
+from src.utils.streaming import (
+    ClosingStreamingResponse,
+    StreamFormat,
+    encode_stream,
+    start_stream,
+)
 
 logger = logging.getLogger(__name__)
-router = APIRouter(tags=["answers"])
+router = APIRouter(tags=["answers"], default_response_class=PydanticJSONResponse)
+
+
+def prefers_async(prefer: str | None) -> bool:
+    # RFC 7240: Prefer: respond-async[, wait=...]
+    if not prefer:
+        return False
+    return any(
+        token.split("=", 1)[0].strip().lower() == "respond-async"
+        for token in prefer.split(",")
+    )
 
 
 @router.post(
     "/questions/{question_id}/answers",
     status_code=status.HTTP_201_CREATED,
     summary="Создать ответ на вопрос",
-    description="Создаёт новый ответ на существующий вопрос и возвращает его идентификатор.",
-    response_model=int,
+    description=(
+        "Создаёт новый ответ на существующий вопрос и возвращает его идентификатор. "
+        "С заголовком Prefer: respond-async (если очередь включена) ответ ставится "
+        "в очередь: возвращается 202 с тикетом, статус — по ссылке из Location. "
+        "Повтор запроса с тем же заголовком Idempotency-Key возвращает тот же "
+        "идентификатор, не создавая ответ заново; такие запросы всегда "
+        "выполняются синхронно."
+    ),
+    response_model=int | AnswerTicketSchema,
     responses={
         status.HTTP_201_CREATED: {"description": "Answer created"},
+        status.HTTP_202_ACCEPTED: {"description": "Answer queued"},
         status.HTTP_404_NOT_FOUND: {"description": "Question not found"},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {
+            "description": "Idempotency-Key was used with a different request"
+        },
+        status.HTTP_429_TOO_MANY_REQUESTS: {"description": "Ingestion queue is full"},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
     },
 )
@@ -27,8 +74,191 @@ async def create_answer_endpoint(
     question_id: int,
     answer: AnswerCreateSchema,
     answers_service: Annotated[AnswersService, Depends(get_answers_service)],
+    prefer: Annotated[str | None, Header()] = None,
+    idempotency_key: Annotated[str | None, Header(min_length=1, max_length=255)] = None,
+):
+    # ключ сохраняется в транзакции вставки, а у очереди транзакции нет
+    async_write = idempotency_key is None and answers_service.accepts_async
+    if prefers_async(prefer) and async_write:
+        ticket = answers_service.enqueue_answer(answer=answer, question_id=question_id)
+        return PydanticJSONResponse(
+            ticket,
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={
+                "Location": f"/api/v1/answers/tickets/{ticket.ticket_id}",
+                "Preference-Applied": "respond-async",
+            },
+        )
+    answer_id = await answers_service.add_answer(
+        answer=answer, question_id=question_id, idempotency_key=idempotency_key
+    )
+    return PydanticJSONResponse(answer_id, status_code=status.HTTP_201_CREATED)
+
+
+@router.get(
+    "/answers/tickets/{ticket_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Статус ответа из очереди",
+    description="Статус ответа, принятого с Prefer: respond-async.",
+    response_model=AnswerTicketSchema,
+    responses={
+        status.HTTP_200_OK: {"description": "Ticket status"},
+        status.HTTP_404_NOT_FOUND: {"description": "Ticket not found"},
+    },
+)
+async def get_answer_ticket_endpoint(
+    ticket_id: str,
+    answers_service: Annotated[AnswersService, Depends(get_answers_service)],
+):
+    return PydanticJSONResponse(answers_service.get_answer_ticket(ticket_id))
+
+
+@router.post(
+    "/answers/batch",
+    status_code=status.HTTP_201_CREATED,
+    summary="Создать ответы пачкой",
+    description=(
+        "Создаёт до 1000 ответов (в том числе к разным вопросам) одним INSERT "
+        "в одной транзакции и возвращает их идентификаторы в порядке входного "
+        "массива. Если каких-то вопросов нет, не создаётся ничего, а в ответе 404 "
+        "перечислены позиции с несуществующим question_id."
+    ),
+    response_model=list[int],
+    responses={
+        status.HTTP_201_CREATED: {"description": "Answers created"},
+        status.HTTP_404_NOT_FOUND: {"description": "Question not found"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+    },
+)
+async def create_answers_batch_endpoint(
+    answers: Annotated[
+        list[AnswerBatchCreateSchema], Body(min_length=1, max_length=1000)
+    ],
+    answers_service: Annotated[AnswersService, Depends(get_answers_service)],
+):
+    answer_ids = await answers_service.add_answers(answers)
+    return PydanticJSONResponse(answer_ids, status_code=status.HTTP_201_CREATED)
+
+
+@router.get(
+    "/questions/{question_id}/answers",
+    status_code=status.HTTP_200_OK,
+    summary="Ответы на вопрос",
+    description=(
+        "Возвращает страницу ответов на вопрос (новые первыми). "
+        "Для следующей страницы передайте next_cursor из ответа в параметр cursor."
+    ),
+    response_model=PageSchema[AnswerSchema],
+    responses={
+        status.HTTP_200_OK: {"description": "Answers page"},
+        status.HTTP_400_BAD_REQUEST: {"description": "Invalid cursor"},
+        status.HTTP_404_NOT_FOUND: {"description": "Question not found"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+    },
+)
+async def get_question_answers_endpoint(
+    question_id: int,
+    answers_service: Annotated[AnswersService, Depends(get_answers_service)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[str | None, Query()] = None,
+):
+    page = await answers_service.get_question_answers(
+        question_id=question_id, limit=limit, cursor=cursor
+    )
+    return json_response(ANSWERS_PAGE_ADAPTER, page)
+
+
+@router.get(
+    "/questions/{question_id}/answers/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Новые ответы на вопрос (SSE)",
+    description=(
+        "Server-Sent Events: каждый новый ответ на вопрос приходит событием "
+        "answer (id события — id ответа) сразу после коммита. Клиент, который "
+        "не успевает читать, получает событие overflow и отключается; после "
+        "переподключения пропущенное дочитывается через GET "
+        "/questions/{question_id}/answers."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {"content": {"text/event-stream": {}}},
+        status.HTTP_404_NOT_FOUND: {"description": "Question not found"},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {
+            "description": "Answer stream is disabled"
+        },
+    },
+)
+async def stream_question_answers_endpoint(
+    question_id: int,
+    questions_service: Annotated[QuestionsService, Depends(get_questions_service)],
+    answer_events: Annotated[AnswerEventHub | None, Depends(get_answer_event_hub)],
+):
+    if answer_events is None:
+        raise AnswerStreamUnavailableException()
+    # 404 до открытия потока, пока ещё можно вернуть статус
+    await questions_service.get_question(question_id, include_answers=False)
+    return StreamingResponse(
+        iter_answer_events(answer_events, question_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/users/{user_id}/answers",
+    status_code=status.HTTP_200_OK,
+    summary="Ответы пользователя",
+    description=(
+        "Возвращает страницу ответов пользователя (новые первыми). "
+        "Для следующей страницы передайте next_cursor из ответа в параметр cursor."
+    ),
+    response_model=PageSchema[AnswerSchema],
+    responses={
+        status.HTTP_200_OK: {"description": "Answers page"},
+        status.HTTP_400_BAD_REQUEST: {"description": "Invalid cursor"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+    },
+)
+async def get_user_answers_endpoint(
+    user_id: Annotated[str, Path(min_length=1, max_length=200)],
+    answers_service: Annotated[AnswersService, Depends(get_answers_service)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[str | None, Query()] = None,
+):
+    page = await answers_service.get_user_answers(
+        user_id=user_id, limit=limit, cursor=cursor
+    )
+    return json_response(ANSWERS_PAGE_ADAPTER, page)
+
+
+@router.get(
+    "/answers/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Выгрузка всех ответов потоком",
+    description=(
+        "Отдаёт все ответы потоком по мере чтения из БД: "
+        "NDJSON (по объекту на строку) или JSON-массив."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Answers stream",
+            "content": {
+                "application/x-ndjson": {},
+                "application/json": {},
+            },
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+    },
+)
+async def stream_answers_endpoint(
+    answers_service: Annotated[AnswersService, Depends(get_answers_service)],
+    format: Annotated[StreamFormat, Query()] = StreamFormat.ndjson,
 ):
-    return await answers_service.add_answer(answer=answer, question_id=question_id)
+    chunks = encode_stream(answers_service.stream_answers(), format)
+    return ClosingStreamingResponse(
+        await start_stream(chunks), media_type=format.media_type
+    )
 
 
 @router.get(
@@ -47,7 +277,8 @@ async def get_answer_endpoint(
     answer_id: int,
     answers_service: Annotated[AnswersService, Depends(get_answers_service)],
 ):
-    return await answers_service.get_answer(answer_id=answer_id)
+    answer = await answers_service.get_answer(answer_id=answer_id)
+    return PydanticJSONResponse(answer)
 
 
 @router.delete(
@@ -0,0 +1,39 @@
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+
+from src.api.v1.deps import get_changes_service
+from src.schemas.change_schema import ChangesPageSchema
+from src.services.changes_service import ChangesService
+from src.utils.serialization import CHANGES_PAGE_ADAPTER, json_response
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Лента изменений",
+    description=(
+        "Вставки и удаления (tombstone) вопросов и ответов в порядке коммита. "
+        "Без since лента читается с начала; дальше передавайте next_since из "
+        "ответа. has_more=true — можно сразу запрашивать следующую страницу, "
+        "иначе лента прочитана и её стоит опросить позже с тем же next_since."
+    ),
+    response_model=ChangesPageSchema,
+    responses={
+        status.HTTP_200_OK: {"description": "Changes page"},
+        status.HTTP_400_BAD_REQUEST: {"description": "Invalid cursor"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+    },
+)
+async def get_changes_endpoint(
+    changes_service: Annotated[ChangesService, Depends(get_changes_service)],
+    since: Annotated[str | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+):
+    page = await changes_service.get_changes(limit=limit, since=since)
+    return json_response(CHANGES_PAGE_ADAPTER, page)
@@ -3,27 +3,155 @@ from typing import Annotated
 
 from fastapi import Depends, Request
 
+from src.core.config import AdminConfig
+from src.core.domain_exceptions import AdminDisabledException
+from src.services.answer_events import AnswerEventHub
+from src.services.answer_ingestion import AnswerIngestionQueue
+from src.services.answer_write_coalescer import AnswerWriteCoalescer
 from src.services.answers_service import AnswersService
+from src.services.changes_service import ChangesService
+from src.services.dataset_service import DatasetService
+from src.services.idempotency import IdempotencyKeys
 from src.services.questions_service import QuestionsService
-from src.utils.unitofwork import IUnitOfWork, UnitOfWork
+from src.services.search_service import SearchService
+from src.utils.cache import QuestionsCache
+from src.utils.unitofwork import (
+    IUnitOfWork,
+    ReadOnlyUnitOfWork,
+    UnitOfWork,
+    primary_uow_factory,
+)
 
 
-def get_uow_factory(request: Request) -> Callable[[], IUnitOfWork]:
-    session_maker = request.app.state.db.session_maker
+def get_client_key(request: Request) -> str | None:
+    # по этому ключу запоминаем недавние записи клиента (read-your-writes).
+    # Адрес пира не годится: за прокси или NAT все клиенты слились бы в один
+    # ключ. Без заголовка клиент не получает read-your-writes
+    return request.headers.get("X-Client-Id") or None
 
-    def _factory() -> IUnitOfWork:
-        return UnitOfWork(session_maker)
+
+def get_write_marker(
+    request: Request,
+    client_key: Annotated[str | None, Depends(get_client_key)],
+) -> Callable[[], None] | None:
+    # вызывается после коммита записи: клиент на время читает с primary
+    router = request.app.state.db.read_router
+    if not router.tracks_writes:
+        return None
+    return lambda: router.mark_write(client_key)
+
+
+def get_uow_factory(
+    request: Request,
+    client_key: Annotated[str | None, Depends(get_client_key)],
+    mark_write: Annotated[Callable[[], None] | None, Depends(get_write_marker)],
+) -> Callable[..., IUnitOfWork]:
+    db = request.app.state.db
+    router = db.read_router
+
+    def _factory(read_only: bool = False, prefer_primary: bool = False) -> IUnitOfWork:
+        if read_only:
+            session_maker = (
+                router.primary if prefer_primary else router.choose(client_key)
+            )
+            # упавшая реплика выводится из ротации, чтение уходит на primary
+            on_replica = session_maker is not router.primary
+            return ReadOnlyUnitOfWork(
+                session_maker,
+                statement_timeout_ms=db.db_config.read_statement_timeout_ms,
+                fallback=router.fallback if on_replica else None,
+            )
+        uow = UnitOfWork(db.session_maker)
+        if mark_write is not None:
+            uow.after_commit(mark_write)
+        return uow
 
     return _factory
 
 
+def get_primary_uow_factory(request: Request) -> Callable[..., IUnitOfWork]:
+    # для долгих выгрузок: primary без statement_timeout API-чтений,
+    # как у CLI (src/tools/dataset.py)
+    return primary_uow_factory(request.app.state.db.session_maker)
+
+
+def get_questions_cache(request: Request) -> QuestionsCache | None:
+    # кэш создаётся в lifespan и может быть выключен конфигом
+    return getattr(request.app.state, "questions_cache", None)
+
+
+def get_answer_write_coalescer(request: Request) -> AnswerWriteCoalescer | None:
+    # включается конфигом, создаётся в lifespan
+    return getattr(request.app.state, "answer_coalescer", None)
+
+
+def get_answer_ingestion_queue(request: Request) -> AnswerIngestionQueue | None:
+    # включается конфигом, создаётся и запускается в lifespan
+    return getattr(request.app.state, "answer_ingestion", None)
+
+
+def get_answer_event_hub(request: Request) -> AnswerEventHub | None:
+    # включается конфигом, создаётся и запускается в lifespan
+    return getattr(request.app.state, "answer_events", None)
+
+
+def get_idempotency_keys(request: Request) -> IdempotencyKeys | None:
+    # включается конфигом, создаётся в lifespan
+    return getattr(request.app.state, "idempotency", None)
+
+
 def get_answers_service(
-    uow_factory: Annotated[Callable[[], IUnitOfWork], Depends(get_uow_factory)],
+    uow_factory: Annotated[Callable[..., IUnitOfWork], Depends(get_uow_factory)],
+    questions_cache: Annotated[QuestionsCache | None, Depends(get_questions_cache)],
+    write_coalescer: Annotated[
+        AnswerWriteCoalescer | None, Depends(get_answer_write_coalescer)
+    ],
+    ingestion_queue: Annotated[
+        AnswerIngestionQueue | None, Depends(get_answer_ingestion_queue)
+    ],
+    idempotency: Annotated[IdempotencyKeys | None, Depends(get_idempotency_keys)],
+    mark_write: Annotated[Callable[[], None] | None, Depends(get_write_marker)],
 ) -> AnswersService:
-    return AnswersService(uow_factory=uow_factory)
+    return AnswersService(
+        uow_factory=uow_factory,
+        questions_cache=questions_cache,
+        write_coalescer=write_coalescer,
+        ingestion_queue=ingestion_queue,
+        idempotency=idempotency,
+        mark_write=mark_write,
+    )
 
 
 def get_questions_service(
-    uow_factory: Annotated[Callable[[], IUnitOfWork], Depends(get_uow_factory)],
+    uow_factory: Annotated[Callable[..., IUnitOfWork], Depends(get_uow_factory)],
+    questions_cache: Annotated[QuestionsCache | None, Depends(get_questions_cache)],
+    idempotency: Annotated[IdempotencyKeys | None, Depends(get_idempotency_keys)],
 ) -> QuestionsService:
-    return QuestionsService(uow_factory=uow_factory)
+    return QuestionsService(
+        uow_factory=uow_factory, cache=questions_cache, idempotency=idempotency
+    )
+
+
+def get_search_service(
+    uow_factory: Annotated[Callable[..., IUnitOfWork], Depends(get_uow_factory)],
+) -> SearchService:
+    return SearchService(uow_factory=uow_factory)
+
+
+def get_changes_service(
+    uow_factory: Annotated[Callable[..., IUnitOfWork], Depends(get_uow_factory)],
+) -> ChangesService:
+    return ChangesService(uow_factory=uow_factory)
+
+
+def get_dataset_service(
+    request: Request,
+    uow_factory: Annotated[
+        Callable[..., IUnitOfWork], Depends(get_primary_uow_factory)
+    ],
+) -> DatasetService:
+    # эндпоинты без аутентификации: по умолчанию выключены
+    config = getattr(request.app.state, "admin_config", AdminConfig())
+    if not config.enabled:
+        raise AdminDisabledException()
+    return DatasetService(uow_factory=uow_factory, batch_size=config.import_batch_size)
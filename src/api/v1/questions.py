@@ -1,58 +1,203 @@
 import logging
+from enum import StrEnum
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Body, Depends, Header, Query, Request, status
+from fastapi.responses import StreamingResponse
 
 from src.api.v1.deps import get_questions_service
-from src.schemas.question_schema import QuestionCreateSchema, QuestionSchema
+from src.schemas.question_schema import (
+    QuestionCreateSchema,
+    QuestionSchema,
+    QuestionSort,
+    QuestionSummarySchema,
+)
 from src.services.questions_service import QuestionsService
+from src.utils.serialization import (
+    QUESTIONS_ADAPTER,
+    PydanticJSONResponse,
+    json_response,
+)
+from src.utils.streaming import (
+    ClosingStreamingResponse,
+    StreamFormat,
+    encode_stream,
+    start_stream,
+)
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/questions", tags=["questions"])
+router = APIRouter(
+    prefix="/questions",
+    tags=["questions"],
+    default_response_class=PydanticJSONResponse,
+)
+
+
+class RenderMode(StrEnum):
+    # orm — модели через ORM и pydantic; db — JSON целиком собирает Postgres
+    orm = "orm"
+    db = "db"
 
 
 @router.get(
     "",
     status_code=status.HTTP_200_OK,
     summary="Список вопросов",
-    description="Возвращает список всех вопросов с вложенными ответами.",
+    description=(
+        "Возвращает страницу вопросов с вложенными ответами — массив, как и раньше. "
+        "sort: created — новые первыми, answers — больше всего ответов, activity — "
+        "недавняя активность (последний ответ или создание). Если есть следующая "
+        'страница, её адрес приходит в заголовке Link (rel="next"), а курсор — '
+        "в X-Next-Cursor: передайте его в параметр cursor (с тем же sort). "
+        "render=db собирает JSON в Postgres одним запросом."
+    ),
     response_model=list[QuestionSchema],
     responses={
-        status.HTTP_200_OK: {"description": "Questions list"},
+        status.HTTP_200_OK: {
+            "description": "Questions page",
+            "headers": {
+                "Link": {
+                    "description": 'URL of the next page, rel="next"',
+                    "schema": {"type": "string"},
+                },
+                "X-Next-Cursor": {
+                    "description": "Cursor of the next page",
+                    "schema": {"type": "string"},
+                },
+            },
+        },
+        status.HTTP_400_BAD_REQUEST: {"description": "Invalid cursor"},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
     },
 )
 async def get_questions_endpoint(
+    request: Request,
+    questions_service: Annotated[QuestionsService, Depends(get_questions_service)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[str | None, Query()] = None,
+    render: Annotated[RenderMode, Query()] = RenderMode.orm,
+    sort: Annotated[QuestionSort, Query()] = QuestionSort.created,
+):
+    if render is RenderMode.db:
+        content, next_cursor = await questions_service.get_questions_page_json(
+            limit=limit, cursor=cursor, sort=sort
+        )
+        return PydanticJSONResponse(
+            content.encode(), headers=_next_page_headers(request, next_cursor)
+        )
+    page = await questions_service.get_questions_page(
+        limit=limit, cursor=cursor, sort=sort
+    )
+    return json_response(
+        QUESTIONS_ADAPTER,
+        page.items,
+        headers=_next_page_headers(request, page.next_cursor),
+    )
+
+
+def _next_page_headers(request: Request, next_cursor: str | None) -> dict[str, str]:
+    # тело осталось массивом, как до пагинации: курсор едет в заголовках
+    if next_cursor is None:
+        return {}
+    next_url = request.url.include_query_params(cursor=next_cursor)
+    return {"Link": f'<{next_url}>; rel="next"', "X-Next-Cursor": next_cursor}
+
+
+@router.get(
+    "/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Выгрузка всех вопросов потоком",
+    description=(
+        "Отдаёт все вопросы с вложенными ответами потоком по мере чтения из БД: "
+        "NDJSON (по объекту на строку) или JSON-массив."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Questions stream",
+            "content": {
+                "application/x-ndjson": {},
+                "application/json": {},
+            },
+        },
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+    },
+)
+async def stream_questions_endpoint(
     questions_service: Annotated[QuestionsService, Depends(get_questions_service)],
+    format: Annotated[StreamFormat, Query()] = StreamFormat.ndjson,
 ):
-    return await questions_service.get_questions()
+    chunks = encode_stream(questions_service.stream_questions(), format)
+    return ClosingStreamingResponse(
+        await start_stream(chunks), media_type=format.media_type
+    )
 
 
 @router.post(
     "",
     status_code=status.HTTP_201_CREATED,
     summary="Создать вопрос",
-    description="Создаёт новый вопрос и возвращает его идентификатор.",
+    description=(
+        "Создаёт новый вопрос и возвращает его идентификатор. Повтор запроса "
+        "с тем же заголовком Idempotency-Key возвращает тот же идентификатор, "
+        "не создавая вопрос заново."
+    ),
     response_model=int,
     responses={
         status.HTTP_201_CREATED: {"description": "Question created"},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {
+            "description": "Idempotency-Key was used with a different request"
+        },
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
     },
 )
 async def create_question_endpoint(
     question: QuestionCreateSchema,
     questions_service: Annotated[QuestionsService, Depends(get_questions_service)],
+    idempotency_key: Annotated[str | None, Header(min_length=1, max_length=255)] = None,
+):
+    question_id = await questions_service.add_question(
+        question, idempotency_key=idempotency_key
+    )
+    return PydanticJSONResponse(question_id, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_201_CREATED,
+    summary="Создать вопросы пачкой",
+    description=(
+        "Создаёт до 1000 вопросов одним INSERT в одной транзакции "
+        "и возвращает их идентификаторы в порядке входного массива."
+    ),
+    response_model=list[int],
+    responses={
+        status.HTTP_201_CREATED: {"description": "Questions created"},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal Server Error"},
+    },
+)
+async def create_questions_batch_endpoint(
+    questions: Annotated[
+        list[QuestionCreateSchema], Body(min_length=1, max_length=1000)
+    ],
+    questions_service: Annotated[QuestionsService, Depends(get_questions_service)],
 ):
-    return await questions_service.add_question(question)
+    question_ids = await questions_service.add_questions(questions)
+    return PydanticJSONResponse(question_ids, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
     "/{question_id}",
     status_code=status.HTTP_200_OK,
     summary="Получить вопрос",
-    description="Возвращает вопрос по идентификатору с вложенными ответами.",
-    response_model=QuestionSchema,
+    description=(
+        "Возвращает вопрос по идентификатору с вложенными ответами. "
+        "С include_answers=false ответы не загружаются — их можно получить "
+        "постранично через /questions/{question_id}/answers. "
+        "render=db собирает JSON вопроса с ответами в Postgres одним запросом."
+    ),
+    response_model=QuestionSchema | QuestionSummarySchema,
     responses={
         status.HTTP_200_OK: {"description": "Question found"},
         status.HTTP_404_NOT_FOUND: {"description": "Question not found"},
@@ -62,8 +207,20 @@ async def create_question_endpoint(
 async def get_question_with_answers_endpoint(
     question_id: int,
     questions_service: Annotated[QuestionsService, Depends(get_questions_service)],
+    include_answers: Annotated[bool, Query()] = True,
+    render: Annotated[RenderMode, Query()] = RenderMode.orm,
 ):
-    return await questions_service.get_question(question_id)
+    if render is RenderMode.db and include_answers:
+        content = await questions_service.get_question_json(question_id)
+        return PydanticJSONResponse(content.encode())
+    if include_answers:
+        return PydanticJSONResponse(
+            await questions_service.get_question_payload(question_id)
+        )
+    question = await questions_service.get_question(
+        question_id, include_answers=include_answers
+    )
+    return PydanticJSONResponse(question)
 
 
 @router.delete(
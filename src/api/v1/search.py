@@ -0,0 +1,50 @@
+import logging
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, status
+
+from src.api.v1.deps import get_search_service
+from src.schemas.pagination_schema import PageSchema
+from src.schemas.search_schema import SearchHitSchema, SearchSource
+from src.services.search_service import SearchService
+from src.utils.serialization import SEARCH_PAGE_ADAPTER, json_response
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    summary="Полнотекстовый поиск",
+    description=(
+        "Ищет по текстам вопросов и ответов (синтаксис websearch: слова, "
+        '"точная фраза", OR, -исключение). Результаты упорядочены по релевантности; '
+        "для следующей страницы передайте next_cursor в параметр cursor. "
+        "highlight=true добавляет фрагменты с совпадениями в <mark>...</mark>: "
+        "snippet — готовый HTML, символы &, < и > исходного текста в нём уже "
+        "заменены на &amp;, &lt; и &gt;."
+    ),
+    response_model=PageSchema[SearchHitSchema],
+    responses={
+        status.HTTP_200_OK: {"description": "Search results"},
+        status.HTTP_400_BAD_REQUEST: {"description": "Invalid cursor"},
+    },
+)
+async def search_endpoint(
+    search_service: Annotated[SearchService, Depends(get_search_service)],
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[str | None, Query()] = None,
+    highlight: Annotated[bool, Query()] = False,
+    source: Annotated[list[SearchSource] | None, Query()] = None,
+):
+    page = await search_service.search(
+        q,
+        limit=limit,
+        cursor=cursor,
+        highlight=highlight,
+        sources=set(source) if source else None,
+    )
+    return json_response(SEARCH_PAGE_ADAPTER, page)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from environs import Env
 
@@ -10,6 +10,25 @@ class DbConfig:
     user: str
     database: str
     port: int = 5432
+    # server-side statement_timeout для read-only транзакций; None — не менять
+    read_statement_timeout_ms: int | None = None
+    # DSN реплик (postgresql+asyncpg://...), на которые уходят read-only транзакции
+    replica_urls: list[str] = field(default_factory=list)
+    replica_strategy: str = "round_robin"
+    # сколько секунд после записи клиент читает с primary; 0 — не следим
+    read_your_writes_seconds: float = 0.0
+    # на сколько секунд недоступная или отставшая реплика выходит из ротации
+    replica_retry_seconds: float = 30.0
+    # период фоновой проверки реплик; 0 — не проверять
+    replica_check_interval: float = 5.0
+    # допустимый лаг реплики в секундах; None — лаг не проверять
+    replica_max_lag_seconds: float | None = None
+    # пул соединений (одинаковый для primary и каждой реплики)
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
 
     @property
     def database_url(self):
@@ -26,12 +45,305 @@ class DbConfig:
         user = env.str("POSTGRES_USER")
         database = env.str("POSTGRES_DB")
         port = env.int("DB_PORT", 5432)
+        read_statement_timeout_ms = env.int("DB_READ_STATEMENT_TIMEOUT_MS", None)
+        replica_urls = env.list("DB_REPLICA_URLS", [])
+        replica_strategy = env.str("DB_REPLICA_STRATEGY", "round_robin")
+        read_your_writes_seconds = env.float("DB_READ_YOUR_WRITES_SECONDS", 0.0)
+        replica_retry_seconds = env.float("DB_REPLICA_RETRY_SECONDS", 30.0)
+        replica_check_interval = env.float("DB_REPLICA_CHECK_INTERVAL", 5.0)
+        replica_max_lag_seconds = env.float("DB_REPLICA_MAX_LAG_SECONDS", None)
+        pool_size = env.int("DB_POOL_SIZE", 5)
+        max_overflow = env.int("DB_MAX_OVERFLOW", 10)
+        pool_timeout = env.float("DB_POOL_TIMEOUT", 30.0)
+        pool_recycle = env.int("DB_POOL_RECYCLE", -1)
+        pool_pre_ping = env.bool("DB_POOL_PRE_PING", False)
         return DbConfig(
             host=host,
             password=password,
             user=user,
             database=database,
             port=port,
+            read_statement_timeout_ms=read_statement_timeout_ms,
+            replica_urls=replica_urls,
+            replica_strategy=replica_strategy,
+            read_your_writes_seconds=read_your_writes_seconds,
+            replica_retry_seconds=replica_retry_seconds,
+            replica_check_interval=replica_check_interval,
+            replica_max_lag_seconds=replica_max_lag_seconds,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
+
+
+@dataclass
+class CacheConfig:
+    """
+    Settings of the in-process questions cache.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether question detail reads go through the cache.
+    max_entries : int
+        Maximum number of cached questions.
+    max_bytes : int
+        Approximate upper bound of the serialized payloads held in memory.
+    ttl : float
+        Seconds an entry stays valid even without invalidation.
+    """
+
+    enabled: bool = True
+    max_entries: int = 10_000
+    max_bytes: int = 64 * 1024 * 1024
+    ttl: float = 30.0
+
+    @staticmethod
+    def from_env(env: Env):
+        return CacheConfig(
+            enabled=env.bool("QUESTIONS_CACHE_ENABLED", True),
+            max_entries=env.int("QUESTIONS_CACHE_MAX_ENTRIES", 10_000),
+            max_bytes=env.int("QUESTIONS_CACHE_MAX_BYTES", 64 * 1024 * 1024),
+            ttl=env.float("QUESTIONS_CACHE_TTL", 30.0),
+        )
+
+
+@dataclass
+class QueryStatsConfig:
+    """
+    Settings of the per-request SQL instrumentation.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether statement counts and DB time are collected per request and
+        reported in the ``Server-Timing`` header.
+    repeat_threshold : int
+        How many times one request may run the same statement before it is
+        reported as a likely N+1 query.
+    raise_on_repeat : bool
+        Raise instead of logging a warning when the threshold is exceeded;
+        meant for tests and local development.
+    """
+
+    enabled: bool = True
+    repeat_threshold: int = 10
+    raise_on_repeat: bool = False
+
+    @staticmethod
+    def from_env(env: Env):
+        return QueryStatsConfig(
+            enabled=env.bool("SQL_STATS_ENABLED", True),
+            repeat_threshold=env.int("SQL_REPEAT_THRESHOLD", 10),
+            raise_on_repeat=env.bool("SQL_REPEAT_RAISE", False),
+        )
+
+
+@dataclass
+class AnswerCoalescerConfig:
+    """
+    Settings of the group-commit coalescer for answer creation.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether single-answer writes are batched across concurrent requests.
+    window_ms : float
+        How long the first answer of a batch waits for others to join.
+    max_batch : int
+        Batch size that triggers a write without waiting for the window.
+    """
+
+    enabled: bool = False
+    window_ms: float = 2.0
+    max_batch: int = 200
+
+    @staticmethod
+    def from_env(env: Env):
+        return AnswerCoalescerConfig(
+            enabled=env.bool("ANSWER_COALESCER_ENABLED", False),
+            window_ms=env.float("ANSWER_COALESCER_WINDOW_MS", 2.0),
+            max_batch=env.int("ANSWER_COALESCER_MAX_BATCH", 200),
+        )
+
+
+@dataclass
+class AnswerIngestionConfig:
+    """
+    Settings of the asynchronous answer ingestion queue.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether ``Prefer: respond-async`` answers are queued (202 Accepted).
+        Tickets live in process memory, so only one process per database
+        may run the queue; a second one fails at startup.
+    max_queue : int
+        Queue capacity; further answers are rejected with 429.
+    batch_size : int
+        Maximum number of answers written by the worker in one transaction.
+    """
+
+    enabled: bool = False
+    max_queue: int = 10_000
+    batch_size: int = 500
+
+    @staticmethod
+    def from_env(env: Env):
+        return AnswerIngestionConfig(
+            enabled=env.bool("ANSWER_INGESTION_ENABLED", False),
+            max_queue=env.int("ANSWER_INGESTION_MAX_QUEUE", 10_000),
+            batch_size=env.int("ANSWER_INGESTION_BATCH_SIZE", 500),
+        )
+
+
+@dataclass
+class AnswerEventsConfig:
+    """
+    Settings of the Server-Sent Events stream of new answers.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the worker holds a LISTEN connection and serves the stream.
+    buffer_size : int
+        Answers buffered per subscriber; a subscriber that falls this far
+        behind is disconnected.
+    heartbeat : float
+        Seconds between keep-alive comments on an idle stream.
+    max_pending : int
+        Notifications waiting to be loaded and fanned out; when full, the
+        subscribers of the dropped answer's question are disconnected.
+    """
+
+    enabled: bool = False
+    buffer_size: int = 100
+    heartbeat: float = 15.0
+    max_pending: int = 10_000
+
+    @staticmethod
+    def from_env(env: Env):
+        return AnswerEventsConfig(
+            enabled=env.bool("ANSWER_EVENTS_ENABLED", False),
+            buffer_size=env.int("ANSWER_EVENTS_BUFFER_SIZE", 100),
+            heartbeat=env.float("ANSWER_EVENTS_HEARTBEAT", 15.0),
+            max_pending=env.int("ANSWER_EVENTS_MAX_PENDING", 10_000),
+        )
+
+
+@dataclass
+class IdempotencyConfig:
+    """
+    Settings of ``Idempotency-Key`` handling for create endpoints.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the header is honoured; when off it is ignored.
+    ttl : float
+        Seconds a key is kept in the database before the purge task may
+        delete it; a retry after that creates a new row.
+    cache_max_entries : int
+        Keys kept in the in-process front cache for replays without a query.
+    cache_ttl : float
+        Seconds a key stays in the front cache.
+    purge_interval : float
+        Seconds between purges of expired keys.
+    purge_batch_size : int
+        Keys deleted per purge transaction.
+    """
+
+    enabled: bool = True
+    ttl: float = 24 * 60 * 60
+    cache_max_entries: int = 10_000
+    cache_ttl: float = 60.0
+    purge_interval: float = 300.0
+    purge_batch_size: int = 10_000
+
+    @staticmethod
+    def from_env(env: Env):
+        return IdempotencyConfig(
+            enabled=env.bool("IDEMPOTENCY_ENABLED", True),
+            ttl=env.float("IDEMPOTENCY_TTL", 24 * 60 * 60),
+            cache_max_entries=env.int("IDEMPOTENCY_CACHE_MAX_ENTRIES", 10_000),
+            cache_ttl=env.float("IDEMPOTENCY_CACHE_TTL", 60.0),
+            purge_interval=env.float("IDEMPOTENCY_PURGE_INTERVAL", 300.0),
+            purge_batch_size=env.int("IDEMPOTENCY_PURGE_BATCH_SIZE", 10_000),
+        )
+
+
+@dataclass
+class AdmissionConfig:
+    """
+    Settings of per-route-class admission control in front of the DB pool.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether API requests pass through the concurrency limiters.
+    read_limit : int
+        Concurrent GET/HEAD requests; further ones wait for a slot.
+    write_limit : int
+        Concurrent POST/PUT/PATCH/DELETE requests.
+    max_wait_ms : float
+        How long a request may wait for a slot before it is rejected with
+        503; keep it well below the pool timeout.
+    max_queue : int
+        Requests allowed to wait per route class; beyond that new ones are
+        rejected immediately.
+    retry_after : int
+        Seconds sent in the ``Retry-After`` header of rejections.
+    exempt_paths : list[str]
+        Path prefixes that bypass admission (health checks, metrics).
+    """
+
+    enabled: bool = False
+    read_limit: int = 10
+    write_limit: int = 5
+    max_wait_ms: float = 100.0
+    max_queue: int = 100
+    retry_after: int = 1
+    exempt_paths: list[str] = field(default_factory=lambda: ["/api/health", "/metrics"])
+
+    @staticmethod
+    def from_env(env: Env):
+        return AdmissionConfig(
+            enabled=env.bool("ADMISSION_ENABLED", False),
+            read_limit=env.int("ADMISSION_READ_LIMIT", 10),
+            write_limit=env.int("ADMISSION_WRITE_LIMIT", 5),
+            max_wait_ms=env.float("ADMISSION_MAX_WAIT_MS", 100.0),
+            max_queue=env.int("ADMISSION_MAX_QUEUE", 100),
+            retry_after=env.int("ADMISSION_RETRY_AFTER", 1),
+            exempt_paths=env.list(
+                "ADMISSION_EXEMPT_PATHS", ["/api/health", "/metrics"]
+            ),
+        )
+
+
+@dataclass
+class AdminConfig:
+    """
+    Settings of the administrative dataset import/export endpoints.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether ``/api/v1/admin/dataset`` is served. The endpoints are not
+        authenticated, so enable them only behind a trusted network.
+    import_batch_size : int
+        Records buffered per COPY into the import staging tables.
+    """
+
+    enabled: bool = False
+    import_batch_size: int = 10_000
+
+    @staticmethod
+    def from_env(env: Env):
+        return AdminConfig(
+            enabled=env.bool("ADMIN_ENABLED", False),
+            import_batch_size=env.int("ADMIN_IMPORT_BATCH_SIZE", 10_000),
         )
 
 
@@ -69,10 +381,34 @@ class Config:
         Holds the values for miscellaneous settings.
     db : Optional[DbConfig]
         Holds the settings specific to the database (default is None).
+    cache : CacheConfig
+        Holds the settings of the questions cache.
+    query_stats : QueryStatsConfig
+        Holds the settings of the per-request SQL instrumentation.
+    answer_coalescer : AnswerCoalescerConfig
+        Holds the settings of the answer write coalescer.
+    answer_ingestion : AnswerIngestionConfig
+        Holds the settings of the asynchronous answer ingestion queue.
+    answer_events : AnswerEventsConfig
+        Holds the settings of the stream of new answers.
+    admin : AdminConfig
+        Holds the settings of the dataset import/export endpoints.
+    idempotency : IdempotencyConfig
+        Holds the settings of Idempotency-Key handling.
+    admission : AdmissionConfig
+        Holds the settings of admission control and load shedding.
     """
 
     db: DbConfig
     misc: Miscellaneous
+    cache: CacheConfig
+    query_stats: QueryStatsConfig
+    answer_coalescer: AnswerCoalescerConfig
+    answer_ingestion: AnswerIngestionConfig
+    answer_events: AnswerEventsConfig
+    admin: AdminConfig
+    idempotency: IdempotencyConfig
+    admission: AdmissionConfig
 
 
 def load_config(env: Env | None = None, path: str | None = None) -> Config:
@@ -84,4 +420,12 @@ def load_config(env: Env | None = None, path: str | None = None) -> Config:
     return Config(
         db=DbConfig.from_env(env),
         misc=Miscellaneous.from_env(env),
+        cache=CacheConfig.from_env(env),
+        query_stats=QueryStatsConfig.from_env(env),
+        answer_coalescer=AnswerCoalescerConfig.from_env(env),
+        answer_ingestion=AnswerIngestionConfig.from_env(env),
+        answer_events=AnswerEventsConfig.from_env(env),
+        admin=AdminConfig.from_env(env),
+        idempotency=IdempotencyConfig.from_env(env),
+        admission=AdmissionConfig.from_env(env),
     )
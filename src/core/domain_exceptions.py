@@ -8,3 +8,41 @@ class QuestionNotFoundException(QuestionsAnswersBaseException):
 
 class AnswerNotFoundException(QuestionsAnswersBaseException):
     pass
+
+
+class InvalidCursorException(QuestionsAnswersBaseException):
+    pass
+
+
+class BatchQuestionNotFoundException(QuestionsAnswersBaseException):
+    def __init__(self, items: list[dict]):
+        super().__init__(items)
+        # [{"index": позиция в батче, "question_id": ...}, ...]
+        self.items = items
+
+
+class IngestionQueueFullException(QuestionsAnswersBaseException):
+    pass
+
+
+class TicketNotFoundException(QuestionsAnswersBaseException):
+    pass
+
+
+class AnswerStreamUnavailableException(QuestionsAnswersBaseException):
+    pass
+
+
+class DatasetImportException(QuestionsAnswersBaseException):
+    def __init__(self, detail: str):
+        super().__init__(detail)
+        # что именно не так с файлом, для клиента
+        self.detail = detail
+
+
+class AdminDisabledException(QuestionsAnswersBaseException):
+    pass
+
+
+class IdempotencyKeyMismatchException(QuestionsAnswersBaseException):
+    pass
@@ -0,0 +1,222 @@
+"""
+Метрики процесса в формате Prometheus без внешних зависимостей.
+
+Значения хранятся в памяти процесса и отдаются эндпоинтом /metrics.
+Обновление метрики — поиск в dict и bisect по границам бакетов, без
+блокировок: всё выполняется в одном event loop, а редкие гонки между
+потоками допустимы для счётчиков такого рода.
+"""
+
+import functools
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Iterable
+
+# границы бакетов по умолчанию, секунды
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [
+        f'{name}="{_escape(str(value))}"'
+        for name, value in zip(names, values, strict=True)
+    ]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labelvalues, amount: float = 1) -> None:
+        self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def value(self, *labelvalues) -> float:
+        return self._values.get(labelvalues, 0)
+
+    def samples(self):
+        for labelvalues, value in sorted(self._values.items()):
+            yield (
+                f"{self.name}_total"
+                f"{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}"
+            )
+
+
+class Histogram:
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # на набор меток: [счётчики по бакетам (+Inf последним), сумма, количество]
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, *labelvalues) -> None:
+        state = self._values.get(labelvalues)
+        if state is None:
+            state = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        # верхние границы включительные: bisect_left по отсортированным границам
+        state[0][bisect_left(self.buckets, value)] += 1
+        state[1] += value
+        state[2] += 1
+
+    def count(self, *labelvalues) -> int:
+        state = self._values.get(labelvalues)
+        return state[2] if state else 0
+
+    def samples(self):
+        bounds = (*self.buckets, math.inf)
+        labelnames = (*self.labelnames, "le")
+        for labelvalues, (counts, total, count) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts, strict=True):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    labelnames, (*labelvalues, _format_value(bound))
+                )
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, labelvalues)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, Counter | Histogram] = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Текстовый формат экспозиции Prometheus (version 0.0.4)."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests",
+    "HTTP requests by method, route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template.",
+    ("method", "route"),
+)
+REPOSITORY_CALL_DURATION = REGISTRY.histogram(
+    "repository_call_duration_seconds",
+    "Repository method latency.",
+    ("repository", "method"),
+)
+UOW_TRANSACTIONS = REGISTRY.counter(
+    "uow_transactions",
+    "Unit of Work transactions by outcome (commit/rollback).",
+    ("outcome",),
+)
+APP_ERRORS = REGISTRY.counter(
+    "app_errors",
+    "Exceptions turned into HTTP responses by exception handlers.",
+    ("error",),
+)
+IDEMPOTENCY_REPLAYS = REGISTRY.counter(
+    "idempotency_replays",
+    "Requests answered from a stored Idempotency-Key response, by scope and source.",
+    ("scope", "source"),
+)
+ANSWER_EVENTS_DROPPED = REGISTRY.counter(
+    "answer_events_dropped",
+    "Answer notifications dropped because the hub's pending queue was full.",
+)
+ADMISSION_QUEUED = REGISTRY.counter(
+    "admission_queued",
+    "Requests that had to wait for an admission slot, by route class.",
+    ("route_class",),
+)
+ADMISSION_REJECTED = REGISTRY.counter(
+    "admission_rejected",
+    "Requests shed with 503 by admission control, by route class and reason.",
+    ("route_class", "reason"),
+)
+ADMISSION_WAIT = REGISTRY.histogram(
+    "admission_wait_seconds",
+    "Time queued requests waited for an admission slot.",
+    ("route_class",),
+)
+
+
+def observe_repository_call(func):
+    """Декоратор async-метода репозитория: время вызова в REPOSITORY_CALL_DURATION."""
+    method = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await func(self, *args, **kwargs)
+        finally:
+            REPOSITORY_CALL_DURATION.observe(
+                time.perf_counter() - started, type(self).__name__, method
+            )
+
+    return wrapper
@@ -1,25 +1,154 @@
+import asyncio
 import logging
 
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from src.core.config import DbConfig
+from src.db.pool_metrics import (
+    InstrumentedAsyncQueuePool,
+    PoolStats,
+    instrument_pool,
+    pool_status,
+)
+from src.db.query_stats import instrument_engine
+from src.db.routing import ReadRouter, ReplicaStrategy
 
 logger = logging.getLogger(__name__)
 
+# отставание реплики в секундах: 0, если всё полученное уже применено
+# (на простаивающей реплике now() - replay_timestamp растёт без лага);
+# на не-реплике функции возвращают NULL
+REPLICA_LAG_SQL = text(
+    "SELECT COALESCE(CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+    "THEN 0 ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END, 0)"
+)
+
 
 class Database:
-    def __init__(
-        self,
-        db_config: DbConfig | None,
-        echo=True,
-        pool_size=5,
-        max_overflow=10,
-    ):
+    def __init__(self, db_config: DbConfig | None, echo=True):
         self.db_config = db_config
-        self.engine = create_async_engine(
-            url=self.db_config.database_url,
-            echo=echo,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
-        )
+        self.echo = echo
+        self.pool_stats: dict[AsyncEngine, PoolStats] = {}
+        self.engine = self._create_engine(self.db_config.database_url)
         self.session_maker: async_sessionmaker = async_sessionmaker(self.engine)
+        self.read_session_maker = self._read_session_maker(self.engine)
+
+        # у каждой реплики свой engine и свой пул
+        self.replica_engines: list[AsyncEngine] = [
+            self._create_engine(url) for url in self.db_config.replica_urls
+        ]
+        self.read_router = ReadRouter(
+            primary=self.read_session_maker,
+            replicas=[
+                (engine, self._read_session_maker(engine))
+                for engine in self.replica_engines
+            ],
+            strategy=ReplicaStrategy(self.db_config.replica_strategy),
+            sticky_seconds=self.db_config.read_your_writes_seconds,
+            retry_seconds=self.db_config.replica_retry_seconds,
+        )
+        self._health_task: asyncio.Task | None = None
+        if self.replica_engines:
+            logger.info(
+                "Read replicas: %d (%s)",
+                len(self.replica_engines),
+                self.db_config.replica_strategy,
+            )
+
+    def _create_engine(self, url) -> AsyncEngine:
+        engine = create_async_engine(
+            url=url,
+            echo=self.echo,
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=self.db_config.pool_size,
+            max_overflow=self.db_config.max_overflow,
+            pool_timeout=self.db_config.pool_timeout,
+            pool_recycle=self.db_config.pool_recycle,
+            pool_pre_ping=self.db_config.pool_pre_ping,
+        )
+        self.pool_stats[engine] = instrument_pool(engine)
+        instrument_engine(engine)
+        return engine
+
+    @staticmethod
+    def _read_session_maker(engine: AsyncEngine) -> async_sessionmaker:
+        # BEGIN READ ONLY уходит тем же запросом, что и обычный BEGIN;
+        # flush в read-only транзакции не нужен
+        return async_sessionmaker(
+            engine.execution_options(postgresql_readonly=True),
+            autoflush=False,
+        )
+
+    def pool_status(self) -> dict:
+        return {
+            "primary": pool_status(self.engine, self.pool_stats[self.engine]),
+            "replicas": [
+                {
+                    "host": engine.url.host,
+                    **pool_status(engine, self.pool_stats[engine]),
+                }
+                for engine in self.replica_engines
+            ],
+        }
+
+    async def connect_primary(self) -> asyncpg.Connection:
+        """
+        Отдельное соединение asyncpg с primary в обход пула.
+
+        Для LISTEN: такое соединение занято всё время жизни процесса,
+        и держать его в пуле значило бы отнять место у запросов.
+        """
+        url = self.engine.url.set(drivername="postgresql")
+        return await asyncpg.connect(url.render_as_string(hide_password=False))
+
+    def start_replica_checks(self) -> None:
+        if not self.replica_engines or self.db_config.replica_check_interval <= 0:
+            return
+        self._health_task = asyncio.create_task(
+            self._check_replicas_periodically(), name="replica-health"
+        )
+
+    async def _check_replicas_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.db_config.replica_check_interval)
+            await self.check_replicas()
+
+    async def check_replicas(self) -> None:
+        """
+        Выводит из ротации реплики, которые не отвечают или отстали больше
+        replica_max_lag_seconds, и возвращает те, что снова в порядке.
+        """
+        interval = self.db_config.replica_check_interval
+        max_lag = self.db_config.replica_max_lag_seconds
+        # до следующей проверки реплика точно не должна вернуться в ротацию
+        down_seconds = max(self.db_config.replica_retry_seconds, 2 * interval)
+        for engine, session_maker in self.read_router.replicas:
+            try:
+                lag = await asyncio.wait_for(
+                    self._replica_lag(engine), timeout=interval or None
+                )
+            except Exception:
+                logger.warning("Read replica %s is unavailable", engine.url.host)
+                self.read_router.mark_down(session_maker, down_seconds)
+                continue
+            if max_lag is not None and lag > max_lag:
+                logger.warning(
+                    "Read replica %s lags %.1fs behind", engine.url.host, lag
+                )
+                self.read_router.mark_down(session_maker, down_seconds)
+            else:
+                self.read_router.mark_up(session_maker)
+
+    @staticmethod
+    async def _replica_lag(engine: AsyncEngine) -> float:
+        async with engine.connect() as conn:
+            return float(await conn.scalar(REPLICA_LAG_SQL))
+
+    async def dispose(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            await asyncio.gather(self._health_task, return_exceptions=True)
+        for engine in (self.engine, *self.replica_engines):
+            await engine.dispose()
@@ -0,0 +1,108 @@
+"""
+Выгрузка и загрузка всего набора вопросов и ответов.
+
+Выгрузка — один UNION ALL: один запрос видит один снимок, поэтому в файле
+нет ответов на вопросы, созданные между чтением двух таблиц.
+
+Загрузка идёт через временные таблицы (ON COMMIT DROP) в транзакции
+UnitOfWork: строки файла копируются туда COPY, затем вопросам выдаются
+новые id из последовательности, и обе таблицы заполняются
+INSERT ... SELECT с переводом question_id ответов на новые id.
+Транзакция помечена как массовая загрузка (app.bulk_load): триггер NOTIFY
+новых ответов её пропускает, остальные триггеры работают.
+"""
+
+from sqlalchemy import Integer, String, cast, literal, null, select, text, union_all
+
+from src.db.models.answer_model import AnswerOrm
+from src.db.models.question_model import QuestionOrm
+from src.db.triggers import BULK_LOAD_SETTING
+
+STAGING_QUESTIONS = "import_questions"
+STAGING_ANSWERS = "import_answers"
+STAGING_QUESTION_COLUMNS = ("source_id", "text", "created_at")
+STAGING_ANSWER_COLUMNS = (
+    "source_id",
+    "source_question_id",
+    "user_id",
+    "text",
+    "created_at",
+)
+
+
+def dataset_export():
+    """(type, id, question_id, user_id, text, created_at): вопросы, затем ответы."""
+    questions = select(
+        literal("question").label("type"),
+        QuestionOrm.id,
+        cast(null(), Integer).label("question_id"),
+        cast(null(), String).label("user_id"),
+        QuestionOrm.text,
+        QuestionOrm.created_at,
+    ).order_by(QuestionOrm.id)
+    answers = select(
+        literal("answer"),
+        AnswerOrm.id,
+        AnswerOrm.question_id,
+        AnswerOrm.user_id,
+        AnswerOrm.text,
+        AnswerOrm.created_at,
+    ).order_by(AnswerOrm.id)
+    return union_all(questions, answers)
+
+
+# asyncpg не выполняет несколько команд в одном запросе — по команде на text()
+# set_config(..., true) — то же, что SET LOCAL: действует до конца транзакции
+MARK_BULK_LOAD = text(f"SELECT set_config('{BULK_LOAD_SETTING}', 'on', true)")
+
+CREATE_STAGING = (
+    text(f"""
+        CREATE TEMP TABLE {STAGING_QUESTIONS} (
+            source_id bigint NOT NULL,
+            text text NOT NULL,
+            created_at timestamptz NOT NULL
+        ) ON COMMIT DROP
+    """),
+    text(f"""
+        CREATE TEMP TABLE {STAGING_ANSWERS} (
+            source_id bigint NOT NULL,
+            source_question_id bigint NOT NULL,
+            user_id text NOT NULL,
+            text text NOT NULL,
+            created_at timestamptz NOT NULL
+        ) ON COMMIT DROP
+    """),
+)
+
+# новые id выдаются в порядке исходных, чтобы сохранить их относительный порядок
+ALLOCATE_QUESTION_IDS = (
+    text("""
+        CREATE TEMP TABLE import_question_ids ON COMMIT DROP AS
+        SELECT source_id, nextval(pg_get_serial_sequence('questions', 'id'))::int AS id
+        FROM (SELECT source_id FROM import_questions ORDER BY source_id) AS s
+    """),
+    # заодно ловит повторяющиеся id вопросов в файле
+    text("CREATE UNIQUE INDEX ON import_question_ids (source_id)"),
+    # автовакуум временные таблицы не анализирует, а без статистики
+    # планировщик считает их пустыми
+    text("ANALYZE import_question_ids"),
+    text(f"ANALYZE {STAGING_QUESTIONS}"),
+    text(f"ANALYZE {STAGING_ANSWERS}"),
+)
+
+INSERT_QUESTIONS = text(f"""
+    INSERT INTO questions (id, text, created_at)
+    SELECT m.id, q.text, q.created_at
+    FROM {STAGING_QUESTIONS} AS q
+    JOIN import_question_ids AS m USING (source_id)
+    ORDER BY m.id
+""")
+
+# ответы без своего вопроса в наборе отсекаются join'ом; их число сверяет сервис
+INSERT_ANSWERS = text(f"""
+    INSERT INTO answers (question_id, user_id, text, created_at)
+    SELECT m.id, a.user_id, a.text, a.created_at
+    FROM {STAGING_ANSWERS} AS a
+    JOIN import_question_ids AS m ON m.source_id = a.source_question_id
+    ORDER BY a.source_id
+""")
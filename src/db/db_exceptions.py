@@ -32,3 +32,14 @@ def map_integrity_error(e: IntegrityError):
 
     # неизвестная ошибка целостности
     return e
+
+
+class RepeatedStatementError(QADatabaseBaseException):
+    """Один запрос выполнил одну и ту же SQL-форму слишком много раз (N+1)."""
+
+    def __init__(self, statement: str, count: int):
+        super().__init__(
+            f"Statement executed {count} times in one request: {statement}"
+        )
+        self.statement = statement
+        self.count = count
@@ -0,0 +1,90 @@
+"""
+Выражения, которые собирают JSON вопросов прямо в Postgres.
+
+Форма и форматирование полей совпадают с QuestionSchema/AnswerSchema после
+pydantic-сериализации, поэтому результат можно отдавать клиенту как есть.
+"""
+
+from sqlalchemy import Text, case, cast, func, literal_column, select, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from src.db.models.answer_model import AnswerOrm
+from src.db.models.question_model import QuestionOrm
+
+
+def iso_utc(column):
+    # pydantic пишет aware-datetime в UTC как 2026-01-01T10:00:00[.ffffff]Z:
+    # дробная часть опускается, если микросекунд нет
+    utc = func.timezone("UTC", column)
+    return func.concat(
+        func.to_char(utc, 'YYYY-MM-DD"T"HH24:MI:SS'),
+        case((func.to_char(utc, "US") == "000000", ""), else_=func.to_char(utc, ".US")),
+        "Z",
+    )
+
+
+def iso_utc_or_null(column):
+    # concat пропускает NULL, поэтому без проверки получился бы "Z"
+    return case((column.is_(None), None), else_=iso_utc(column))
+
+
+def answer_json():
+    return func.json_build_object(
+        "user_id",
+        AnswerOrm.user_id,
+        "text",
+        AnswerOrm.text,
+        "id",
+        AnswerOrm.id,
+        "question_id",
+        AnswerOrm.question_id,
+        "created_at",
+        iso_utc(AnswerOrm.created_at),
+    )
+
+
+def question_json():
+    # тот же порядок, что у relationship QuestionOrm.answers
+    answers = (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(answer_json(), AnswerOrm.id)),
+                literal_column("'[]'::json"),
+            )
+        )
+        .where(AnswerOrm.question_id == QuestionOrm.id)
+        .scalar_subquery()
+    )
+    return func.json_build_object(
+        "text",
+        QuestionOrm.text,
+        "id",
+        QuestionOrm.id,
+        "created_at",
+        iso_utc(QuestionOrm.created_at),
+        "answer_count",
+        QuestionOrm.answer_count,
+        "last_answered_at",
+        iso_utc_or_null(QuestionOrm.last_answered_at),
+        "answers",
+        answers,
+    )
+
+
+def question_json_by_id(question_id: int):
+    return select(cast(question_json(), Text)).where(QuestionOrm.id == question_id)
+
+
+def questions_json_page(
+    limit: int, after: tuple | None = None, sort_key: tuple | None = None
+):
+    """sort_key — колонки keyset-ключа, по умолчанию (created_at, id)."""
+    sort_key = sort_key or (QuestionOrm.created_at, QuestionOrm.id)
+    stmt = (
+        select(*sort_key, cast(question_json(), Text))
+        .order_by(*(column.desc() for column in sort_key))
+        .limit(limit)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(*sort_key) < after)
+    return stmt
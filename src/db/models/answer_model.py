@@ -1,11 +1,22 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, column, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.models.base_model import Base
+
+# таблица журнала должна быть в metadata вместе с триггерами, которые в неё пишут
+from src.db.models.change_model import ChangeOrm  # noqa: F401
+from src.db.models.search_vector import search_vector_column
+from src.db.triggers import (
+    ANSWER_CHANGE_LOG_DDL,
+    ANSWER_NOTIFY_DDL,
+    ANSWER_STATS_DDL,
+    attach_ddl,
+)
 from src.schemas import AnswerSchema
+from src.utils.serialization import construct_trusted
 
 if TYPE_CHECKING:
     from src.db.models.question_model import QuestionOrm
@@ -13,13 +24,29 @@ if TYPE_CHECKING:
 
 class AnswerOrm(Base):
     __tablename__ = "answers"
+    __table_args__ = (
+        # ответы вопроса страницами: WHERE question_id = ? ORDER BY created_at DESC, id DESC;
+        # заодно покрывает FK-поиск при каскадном удалении вопроса
+        Index(
+            "ix_answers_question_id_created_at_id", "question_id", "created_at", "id"
+        ),
+        # ответы пользователя страницами (модерация):
+        # WHERE user_id = ? ORDER BY created_at DESC, id DESC
+        Index(
+            "ix_answers_user_id_created_at_id",
+            "user_id",
+            column("created_at").desc(),
+            column("id").desc(),
+        ),
+        Index("ix_answers_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
     question_id: Mapped[int] = mapped_column(
         ForeignKey("questions.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
 
     user_id: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -27,15 +54,28 @@ class AnswerOrm(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    # полнотекстовый поиск: см. SearchableRepository.search
+    search_vector = search_vector_column("text")
 
     # связи
     question: Mapped["QuestionOrm"] = relationship(back_populates="answers")
 
     def to_read_model(self) -> AnswerSchema:
-        return AnswerSchema(
+        # строка из нашей БД уже удовлетворяет схеме (NOT NULL, длины),
+        # поэтому собираем модель без повторной валидации
+        return construct_trusted(
+            AnswerSchema,
             user_id=self.user_id,
             text=self.text,
             id=self.id,
             question_id=self.question_id,
             created_at=self.created_at,
         )
+
+
+# answer_count / last_answered_at вопросов поддерживаются триггерами
+attach_ddl(AnswerOrm.__table__, *ANSWER_STATS_DDL)
+# вставки и удаления (в том числе каскадные) — в журнал изменений
+attach_ddl(AnswerOrm.__table__, *ANSWER_CHANGE_LOG_DDL)
+# NOTIFY для SSE-подписчиков, см. AnswerEventHub
+attach_ddl(AnswerOrm.__table__, *ANSWER_NOTIFY_DDL)
@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.models.base_model import Base
+from src.schemas.change_schema import ChangeEntity, ChangeOp, ChangeSchema
+from src.utils.serialization import construct_trusted
+
+
+class ChangeOrm(Base):
+    """
+    Журнал вставок и удалений вопросов и ответов.
+
+    Строки пишут только триггеры (src/db/triggers.py) в транзакции самого
+    изменения; приложение журнал лишь читает.
+    """
+
+    __tablename__ = "change_log"
+    __table_args__ = (
+        # чтение журнала: WHERE (txid, id) > (?, ?) ORDER BY txid, id
+        Index("ix_change_log_txid_id", "txid", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    # pg_current_xact_id() транзакции, сделавшей изменение
+    txid: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    entity: Mapped[str] = mapped_column(String(16), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    question_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    op: Mapped[str] = mapped_column(String(16), nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def to_read_model(self) -> ChangeSchema:
+        return construct_trusted(
+            ChangeSchema,
+            entity=ChangeEntity(self.entity),
+            entity_id=self.entity_id,
+            question_id=self.question_id,
+            op=ChangeOp(self.op),
+            changed_at=self.changed_at,
+        )
@@ -0,0 +1,39 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.db.models.base_model import Base
+from src.schemas.idempotency_schema import IdempotencyRecordSchema
+from src.utils.serialization import construct_trusted
+
+
+class IdempotencyKeyOrm(Base):
+    """
+    Ответы на запросы с Idempotency-Key.
+
+    Строка пишется в транзакции самой вставки, поэтому ключ есть тогда
+    и только тогда, когда запись создана.
+    """
+
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        # очистка по TTL: WHERE created_at < ?
+        Index("ix_idempotency_keys_created_at", "created_at"),
+    )
+
+    # эндпоинт: один и тот же ключ в разных эндпоинтах — разные запросы
+    scope: Mapped[str] = mapped_column(String(64), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    response: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def to_read_model(self) -> IdempotencyRecordSchema:
+        return construct_trusted(
+            IdempotencyRecordSchema,
+            fingerprint=self.fingerprint,
+            response=self.response,
+        )
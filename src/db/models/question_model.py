@@ -1,11 +1,17 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Integer, String, func
+from sqlalchemy import DateTime, Index, Integer, String, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.models.base_model import Base
+from src.db.models.change_model import ChangeOrm  # noqa: F401
+from src.db.models.search_vector import search_vector_column
+from src.db.triggers import QUESTION_CHANGE_LOG_DDL, attach_ddl
 from src.schemas import QuestionSchema
+from src.schemas.question_schema import QuestionSummarySchema
+from src.utils.serialization import construct_trusted
 
 if TYPE_CHECKING:
     from src.db.models.answer_model import AnswerOrm
@@ -13,23 +19,75 @@ if TYPE_CHECKING:
 
 class QuestionOrm(Base):
     __tablename__ = "questions"
+    __table_args__ = (
+        # keyset-пагинация списка вопросов: ORDER BY created_at DESC, id DESC
+        Index("ix_questions_created_at_id", "created_at", "id"),
+        Index("ix_questions_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     text: Mapped[str] = mapped_column(String(10_000), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    # полнотекстовый поиск: см. SearchableRepository.search
+    search_vector = search_vector_column("text")
+    # денормализация по ответам, поддерживается триггерами (src/db/triggers.py)
+    answer_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    last_answered_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
 
     # связи
     answers: Mapped[list["AnswerOrm"]] = relationship(
         back_populates="question",
         passive_deletes=True,
+        order_by="AnswerOrm.id",
     )
 
+    @hybrid_property
+    def last_activity_at(self) -> datetime:
+        # последний ответ, а у вопроса без ответов — время создания
+        return self.last_answered_at or self.created_at
+
+    @last_activity_at.inplace.expression
+    @classmethod
+    def _last_activity_at_expression(cls):
+        return func.coalesce(cls.last_answered_at, cls.created_at)
+
     def to_read_model(self) -> QuestionSchema:
-        return QuestionSchema(
-            id=self.id,
+        # см. AnswerOrm.to_read_model: данные из нашей БД не валидируем повторно
+        return construct_trusted(
+            QuestionSchema,
             text=self.text,
+            id=self.id,
             created_at=self.created_at,
+            answer_count=self.answer_count,
+            last_answered_at=self.last_answered_at,
             answers=[answer.to_read_model() for answer in self.answers],
         )
+
+    def to_summary_model(self) -> QuestionSummarySchema:
+        return construct_trusted(
+            QuestionSummarySchema,
+            text=self.text,
+            id=self.id,
+            created_at=self.created_at,
+            answer_count=self.answer_count,
+            last_answered_at=self.last_answered_at,
+        )
+
+
+# сортировки списка вопросов (keyset, см. SqlAlchemyQuestionsRepository.find_page)
+Index("ix_questions_answer_count_id", QuestionOrm.answer_count, QuestionOrm.id)
+Index(
+    "ix_questions_last_activity_at_id",
+    QuestionOrm.last_activity_at,
+    QuestionOrm.id,
+)
+
+# вставки и удаления — в журнал изменений
+attach_ddl(QuestionOrm.__table__, *QUESTION_CHANGE_LOG_DDL)
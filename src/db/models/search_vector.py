@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Computed, literal_column
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# simple: без стемминга и стоп-слов — одинаково ведёт себя на русском и английском
+SEARCH_CONFIG = "simple"
+
+
+def search_config():
+    return literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+
+
+def search_vector_column(source_column: str) -> Column:
+    """
+    Сохраняемая генерируемая колонка tsvector по source_column.
+
+    Её считает Postgres при INSERT/UPDATE; из маппера колонку нужно исключить
+    (exclude_properties), иначе ORM будет забирать её в RETURNING каждой вставки.
+    """
+    return Column(
+        TSVECTOR,
+        Computed(f"to_tsvector('{SEARCH_CONFIG}', {source_column})", persisted=True),
+    )
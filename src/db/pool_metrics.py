@@ -0,0 +1,108 @@
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Сколько последних ожиданий храним для перцентилей
+WAIT_SAMPLES = 2048
+
+
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    invalidations: int = 0
+    timeouts: int = 0
+    wait_times: deque = field(default_factory=lambda: deque(maxlen=WAIT_SAMPLES))
+
+    def wait_percentiles(self) -> dict:
+        waits = sorted(self.wait_times)
+        if not waits:
+            return {"samples": 0}
+
+        def percentile(p: float) -> float:
+            index = min(len(waits) - 1, round(p * (len(waits) - 1)))
+            return round(waits[index] * 1000, 3)
+
+        return {
+            "samples": len(waits),
+            "p50_ms": percentile(0.50),
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(waits[-1] * 1000, 3),
+        }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool, который замеряет, сколько запрос ждал соединение.
+
+    Время считается от запроса соединения у пула до получения готового
+    (включая ожидание в очереди, открытие нового соединения и pre-ping).
+    """
+
+    stats: PoolStats | None = None
+
+    def connect(self):
+        if self.stats is None:
+            return super().connect()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        self.stats.wait_times.append(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() пересоздаёт пул — статистика должна пережить это
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+def instrument_pool(engine: AsyncEngine) -> PoolStats:
+    stats = PoolStats()
+    sync_engine = engine.sync_engine
+    if isinstance(sync_engine.pool, InstrumentedAsyncQueuePool):
+        sync_engine.pool.stats = stats
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.checkouts += 1
+
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        stats.checkins += 1
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        stats.connects += 1
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        stats.invalidations += 1
+
+    return stats
+
+
+def pool_status(engine: AsyncEngine, stats: PoolStats) -> dict:
+    pool = engine.sync_engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # до заполнения основного пула QueuePool.overflow() отрицателен
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": stats.checkouts,
+        "checkins": stats.checkins,
+        "connects": stats.connects,
+        "invalidations": stats.invalidations,
+        "timeouts": stats.timeouts,
+        "wait": stats.wait_percentiles(),
+    }
@@ -0,0 +1,94 @@
+"""
+Счётчики SQL на время одного HTTP-запроса.
+
+Хуки before/after_cursor_execute вешаются на engine один раз; куда писать,
+они узнают из contextvar, который выставляет middleware. Контекст asyncio
+доходит до greenlet, в котором SQLAlchemy вызывает драйвер, поэтому
+параллельные запросы не смешиваются.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.db.db_exceptions import RepeatedStatementError
+
+logger = logging.getLogger(__name__)
+
+# $1, %(name)s, ? — всё приводим к "?", а списки "?, ?, ?" схлопываем,
+# чтобы IN (...) и VALUES разной длины считались одной формой
+_PARAM_RE = re.compile(r"\$\d+|%\(\w+\)s|\?")
+_PARAM_LIST_RE = re.compile(r"\?(?:\s*,\s*\?)+")
+
+
+def statement_shape(statement: str) -> str:
+    shape = _PARAM_RE.sub("?", statement)
+    shape = _PARAM_LIST_RE.sub("?", shape)
+    return " ".join(shape.split())
+
+
+@dataclass
+class QueryStats:
+    repeat_threshold: int = 10
+    raise_on_repeat: bool = False
+    count: int = 0
+    duration: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+    # о каждой форме предупреждаем один раз на запрос
+    reported: set[str] = field(default_factory=set)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        repeats = self.shapes[shape]
+        if repeats <= self.repeat_threshold or shape in self.reported:
+            return
+        if self.raise_on_repeat:
+            raise RepeatedStatementError(shape, repeats)
+        self.reported.add(shape)
+        logger.warning("Possible N+1: statement executed %d times: %s", repeats, shape)
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.1f};desc="{self.count} queries"'
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current.get()
+
+
+def start_query_stats(stats: QueryStats):
+    """Начинает сбор для текущего контекста; возвращает токен для reset."""
+    return _current.set(stats)
+
+
+def stop_query_stats(token) -> None:
+    _current.reset(token)
+
+
+def instrument_engine(engine: AsyncEngine | Engine) -> None:
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    # время старта храним в контексте исполнения: он свой у каждого
+    # statement, и упавший запрос ничего не оставляет за собой
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            context.query_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = _current.get()
+        started = getattr(context, "query_started", None)
+        if stats is not None and started is not None:
+            stats.record(statement, time.perf_counter() - started)
@@ -1,6 +1,6 @@
 from src.db.models.answer_model import AnswerOrm
-from src.utils.repository import SqlAlchemyRepository
+from src.utils.repository import SqlAlchemyAnswersRepository
 
 
-class AnswersRepository(SqlAlchemyRepository):
+class AnswersRepository(SqlAlchemyAnswersRepository):
     model = AnswerOrm
@@ -0,0 +1,6 @@
+from src.db.models.change_model import ChangeOrm
+from src.utils.repository import SqlAlchemyChangesRepository
+
+
+class ChangesRepository(SqlAlchemyChangesRepository):
+    model = ChangeOrm
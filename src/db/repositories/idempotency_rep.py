@@ -0,0 +1,6 @@
+from src.db.models.idempotency_model import IdempotencyKeyOrm
+from src.utils.repository import SqlAlchemyIdempotencyRepository
+
+
+class IdempotencyRepository(SqlAlchemyIdempotencyRepository):
+    model = IdempotencyKeyOrm
@@ -0,0 +1,143 @@
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from enum import StrEnum
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Верхняя граница числа клиентов, которых помним после записи
+MAX_STICKY_CLIENTS = 100_000
+
+
+class ReplicaStrategy(StrEnum):
+    round_robin = "round_robin"
+    least_busy = "least_busy"
+
+
+class ReadRouter:
+    """
+    Выбирает, куда отправить read-only транзакцию: на реплику или на primary.
+
+    Клиент, который недавно писал, в течение sticky_seconds читает с primary,
+    чтобы видеть свои записи несмотря на лаг репликации (read-your-writes).
+
+    Реплика, до которой не удалось достучаться или которая отстала, на
+    retry_seconds выводится из ротации (mark_down); если живых реплик
+    не осталось, чтение уходит на primary.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replicas: list[tuple[AsyncEngine, async_sessionmaker]],
+        strategy: ReplicaStrategy = ReplicaStrategy.round_robin,
+        sticky_seconds: float = 0.0,
+        retry_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary = primary
+        self.replicas = replicas
+        self.strategy = strategy
+        self.sticky_seconds = sticky_seconds
+        self.retry_seconds = retry_seconds
+        self._clock = clock
+        self._next = itertools.cycle(range(len(replicas))) if replicas else None
+        # client_key -> момент, до которого читаем с primary; порядок вставки
+        # совпадает с порядком истечения, поэтому чистим с начала
+        self._sticky: OrderedDict[Hashable, float] = OrderedDict()
+        # session_maker реплики -> момент, до которого она вне ротации
+        self._down_until: dict[async_sessionmaker, float] = {}
+
+    @property
+    def tracks_writes(self) -> bool:
+        return bool(self.replicas) and self.sticky_seconds > 0
+
+    def choose(self, client_key: Hashable | None = None) -> async_sessionmaker:
+        if not self.replicas or self._is_sticky(client_key):
+            return self.primary
+        if self.strategy is ReplicaStrategy.least_busy:
+            available = [
+                replica for replica in self.replicas if self.is_available(replica[1])
+            ]
+            if not available:
+                return self.primary
+            _, session_maker = min(
+                available, key=lambda replica: replica[0].pool.checkedout()
+            )
+            return session_maker
+        for _ in range(len(self.replicas)):
+            _, session_maker = self.replicas[next(self._next)]
+            if self.is_available(session_maker):
+                return session_maker
+        return self.primary
+
+    def is_available(self, session_maker: async_sessionmaker) -> bool:
+        if not self._down_until:
+            return True
+        down_until = self._down_until.get(session_maker)
+        if down_until is None:
+            return True
+        if down_until <= self._clock():
+            # срок вышел: даём реплике ещё попытку
+            del self._down_until[session_maker]
+            return True
+        return False
+
+    def mark_down(
+        self, session_maker: async_sessionmaker, seconds: float | None = None
+    ) -> None:
+        if session_maker is self.primary:
+            return
+        if self.is_available(session_maker):
+            logger.warning(
+                "Read replica #%d is out of rotation", self._index(session_maker)
+            )
+        self._down_until[session_maker] = self._clock() + (
+            self.retry_seconds if seconds is None else seconds
+        )
+
+    def mark_up(self, session_maker: async_sessionmaker) -> None:
+        if self._down_until.pop(session_maker, None) is not None:
+            logger.info(
+                "Read replica #%d is back in rotation", self._index(session_maker)
+            )
+
+    def fallback(self, session_maker: async_sessionmaker) -> async_sessionmaker:
+        """Выводит недоступную реплику из ротации и возвращает primary."""
+        self.mark_down(session_maker)
+        return self.primary
+
+    def mark_write(self, client_key: Hashable | None) -> None:
+        if client_key is None or not self.tracks_writes:
+            return
+        now = self._clock()
+        self._sticky.pop(client_key, None)
+        self._sticky[client_key] = now + self.sticky_seconds
+        self._prune(now)
+
+    def _index(self, session_maker: async_sessionmaker) -> int:
+        return next(
+            i for i, (_, maker) in enumerate(self.replicas) if maker is session_maker
+        )
+
+    def _is_sticky(self, client_key: Hashable | None) -> bool:
+        if client_key is None or not self._sticky:
+            return False
+        expires_at = self._sticky.get(client_key)
+        if expires_at is None:
+            return False
+        if expires_at <= self._clock():
+            del self._sticky[client_key]
+            return False
+        return True
+
+    def _prune(self, now: float) -> None:
+        while self._sticky:
+            key, expires_at = next(iter(self._sticky.items()))
+            if expires_at > now and len(self._sticky) <= MAX_STICKY_CLIENTS:
+                break
+            del self._sticky[key]
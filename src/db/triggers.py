@@ -0,0 +1,180 @@
+"""
+Триггеры, которые в той же транзакции поддерживают денормализованные поля,
+журнал изменений и уведомления о новых ответах.
+
+DDL живёт здесь и вешается на after_create таблиц, поэтому create_all
+(интеграционные тесты) создаёт их вместе со схемой; миграции содержат
+замороженную копию этого текста.
+"""
+
+from sqlalchemy import DDL, Table, event
+
+# answer_count / last_answered_at вопроса. Триггеры уровня оператора
+# с transition tables: пачка из N ответов — одно обновление на вопрос,
+# а не N построчных. Строки вопросов блокируются в порядке id, чтобы
+# параллельные пачки по пересекающимся вопросам не ловили deadlock.
+# asyncpg не выполняет несколько команд в одном запросе — по DDL на команду
+ANSWER_STATS_INSERT_FUNCTION = DDL(
+    """
+CREATE OR REPLACE FUNCTION answers_stats_after_insert() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM 1 FROM questions
+    WHERE id IN (SELECT question_id FROM new_answers)
+    ORDER BY id
+    FOR UPDATE;
+
+    UPDATE questions AS q
+    SET answer_count = q.answer_count + n.added,
+        last_answered_at = GREATEST(q.last_answered_at, n.last_created_at)
+    FROM (
+        SELECT question_id, count(*) AS added, max(created_at) AS last_created_at
+        FROM new_answers
+        GROUP BY question_id
+    ) AS n
+    WHERE q.id = n.question_id;
+    RETURN NULL;
+END;
+$$
+"""
+)
+
+ANSWER_STATS_DELETE_FUNCTION = DDL(
+    """
+CREATE OR REPLACE FUNCTION answers_stats_after_delete() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM 1 FROM questions
+    WHERE id IN (SELECT question_id FROM old_answers)
+    ORDER BY id
+    FOR UPDATE;
+
+    -- последний ответ мог быть удалён: берём max по индексу
+    -- (question_id, created_at, id) среди оставшихся
+    UPDATE questions AS q
+    SET answer_count = q.answer_count - o.removed,
+        last_answered_at = (
+            SELECT max(a.created_at) FROM answers AS a WHERE a.question_id = q.id
+        )
+    FROM (
+        SELECT question_id, count(*) AS removed
+        FROM old_answers
+        GROUP BY question_id
+    ) AS o
+    WHERE q.id = o.question_id;
+    RETURN NULL;
+END;
+$$
+"""
+)
+
+ANSWER_STATS_INSERT_TRIGGER = DDL(
+    """
+CREATE TRIGGER answers_stats_insert
+AFTER INSERT ON answers
+REFERENCING NEW TABLE AS new_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_stats_after_insert()
+"""
+)
+
+ANSWER_STATS_DELETE_TRIGGER = DDL(
+    """
+CREATE TRIGGER answers_stats_delete
+AFTER DELETE ON answers
+REFERENCING OLD TABLE AS old_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_stats_after_delete()
+"""
+)
+
+
+ANSWER_STATS_DDL = (
+    ANSWER_STATS_INSERT_FUNCTION,
+    ANSWER_STATS_DELETE_FUNCTION,
+    ANSWER_STATS_INSERT_TRIGGER,
+    ANSWER_STATS_DELETE_TRIGGER,
+)
+
+
+# Журнал изменений (change_log) для инкрементальной синхронизации клиентов.
+# Пишется триггером, а не из UnitOfWork: так в журнал попадают и ответы,
+# удалённые каскадом ON DELETE CASCADE вместе с вопросом. txid — номер
+# транзакции: по нему GET /changes отдаёт только записи завершённых
+# транзакций (см. SqlAlchemyChangesRepository.find_since).
+def _change_log_ddl(table: str, entity: str, question_id: str) -> tuple[DDL, ...]:
+    function = DDL(
+        f"""
+CREATE OR REPLACE FUNCTION {table}_change_log() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO change_log (txid, entity, entity_id, question_id, op)
+    SELECT pg_current_xact_id()::text::bigint, '{entity}', id, {question_id},
+           lower(TG_OP)
+    FROM changed_rows
+    ORDER BY id;
+    RETURN NULL;
+END;
+$$
+"""
+    )
+    triggers = tuple(
+        DDL(
+            f"""
+CREATE TRIGGER {table}_change_log_{op.lower()}
+AFTER {op} ON {table}
+REFERENCING {transition} TABLE AS changed_rows
+FOR EACH STATEMENT EXECUTE FUNCTION {table}_change_log()
+"""
+        )
+        for op, transition in (("INSERT", "NEW"), ("DELETE", "OLD"))
+    )
+    return (function, *triggers)
+
+
+QUESTION_CHANGE_LOG_DDL = _change_log_ddl("questions", "question", "id")
+ANSWER_CHANGE_LOG_DDL = _change_log_ddl("answers", "answer", "question_id")
+
+
+# NOTIFY о каждом новом ответе; доставляется слушателям только после COMMIT
+# (откаченная транзакция ничего не отправит). Текст ответа в payload
+# (лимит 8000 байт) не помещается — только ключи, см. AnswerEventHub.
+ANSWERS_CHANNEL = "answers_created"
+# транзакция массовой загрузки выставляет SET LOCAL app.bulk_load = on:
+# уведомлять по ответу на каждую из миллиона строк некому и незачем;
+# счётчики и журнал изменений при этом работают как обычно
+BULK_LOAD_SETTING = "app.bulk_load"
+
+ANSWER_NOTIFY_FUNCTION = DDL(
+    f"""
+CREATE OR REPLACE FUNCTION answers_notify_after_insert() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF current_setting('{BULK_LOAD_SETTING}', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+    PERFORM pg_notify(
+        '{ANSWERS_CHANNEL}',
+        json_build_object('id', id, 'question_id', question_id)::text
+    )
+    FROM new_answers
+    ORDER BY id;
+    RETURN NULL;
+END;
+$$
+"""
+)
+
+ANSWER_NOTIFY_TRIGGER = DDL(
+    """
+CREATE TRIGGER answers_notify_insert
+AFTER INSERT ON answers
+REFERENCING NEW TABLE AS new_answers
+FOR EACH STATEMENT EXECUTE FUNCTION answers_notify_after_insert()
+"""
+)
+
+ANSWER_NOTIFY_DDL = (ANSWER_NOTIFY_FUNCTION, ANSWER_NOTIFY_TRIGGER)
+
+
+def attach_ddl(table: Table, *ddl: DDL) -> None:
+    for statement in ddl:
+        event.listen(table, "after_create", statement.execute_if(dialect="postgresql"))
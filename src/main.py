@@ -5,10 +5,20 @@ import uvicorn
 from fastapi import FastAPI
 
 from src.api import api_router
+from src.api.admission import AdmissionController, setup_admission_control
 from src.api.exception_handlers import setup_exception_handlers
+from src.api.metrics import setup_metrics
+from src.api.query_stats import setup_query_stats
 from src.core.config import Config, load_config
 from src.core.logging import setup_logging
 from src.db.database import Database
+from src.services.answer_events import AnswerEventHub
+from src.services.answer_ingestion import AnswerIngestionQueue
+from src.services.answer_write_coalescer import AnswerWriteCoalescer
+from src.services.answers_service import AnswersService
+from src.services.idempotency import IdempotencyKeys
+from src.utils.cache import QuestionsCache
+from src.utils.unitofwork import primary_uow_factory
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +31,95 @@ async def lifespan(app: FastAPI):
     config: Config = load_config(path=".env")
     db = Database(db_config=config.db, echo=False)
     app.state.db = db
+    db.start_replica_checks()
+    app.state.query_stats_config = config.query_stats
+    app.state.admin_config = config.admin
+    app.state.admission = (
+        AdmissionController(config.admission) if config.admission.enabled else None
+    )
+    app.state.questions_cache = (
+        QuestionsCache(
+            max_entries=config.cache.max_entries,
+            max_bytes=config.cache.max_bytes,
+            ttl=config.cache.ttl,
+        )
+        if config.cache.enabled
+        else None
+    )
+    background_uow_factory = primary_uow_factory(
+        db.session_maker, db.read_session_maker
+    )
+    app.state.answer_coalescer = (
+        AnswerWriteCoalescer(
+            AnswersService(uow_factory=background_uow_factory),
+            window=config.answer_coalescer.window_ms / 1000,
+            max_batch=config.answer_coalescer.max_batch,
+        )
+        if config.answer_coalescer.enabled
+        else None
+    )
+    app.state.answer_ingestion = None
+    if config.answer_ingestion.enabled:
+        app.state.answer_ingestion = AnswerIngestionQueue(
+            AnswersService(
+                uow_factory=background_uow_factory,
+                questions_cache=app.state.questions_cache,
+            ),
+            max_size=config.answer_ingestion.max_queue,
+            batch_size=config.answer_ingestion.batch_size,
+        )
+        # тикеты в памяти процесса: второй процесс с очередью не запустится
+        await app.state.answer_ingestion.claim(db.connect_primary)
+        app.state.answer_ingestion.start()
+    app.state.answer_events = None
+    if config.answer_events.enabled:
+        # ответ читается с primary: реплика могла ещё не получить строку,
+        # о которой пришло уведомление
+        app.state.answer_events = AnswerEventHub(
+            db.connect_primary,
+            AnswersService(uow_factory=primary_uow_factory(db.session_maker)),
+            buffer_size=config.answer_events.buffer_size,
+            heartbeat=config.answer_events.heartbeat,
+            max_pending=config.answer_events.max_pending,
+        )
+        app.state.answer_events.start()
+    app.state.idempotency = None
+    if config.idempotency.enabled:
+        app.state.idempotency = IdempotencyKeys(
+            ttl=config.idempotency.ttl,
+            cache_max_entries=config.idempotency.cache_max_entries,
+            cache_ttl=config.idempotency.cache_ttl,
+        )
+        app.state.idempotency.start_purge(
+            background_uow_factory,
+            interval=config.idempotency.purge_interval,
+            batch_size=config.idempotency.purge_batch_size,
+        )
     try:
         yield
     finally:
         logger.info("🛑 Stopping Q&A API...")
 
-    await app.state.db.engine.dispose()
+    if app.state.answer_events is not None:
+        await app.state.answer_events.close()
+    if app.state.idempotency is not None:
+        await app.state.idempotency.close()
+    # принятые ответы дописываются до закрытия пулов
+    if app.state.answer_ingestion is not None:
+        await app.state.answer_ingestion.drain()
+    if app.state.answer_coalescer is not None:
+        await app.state.answer_coalescer.close()
+    await app.state.db.dispose()
 
 
 def create_app() -> FastAPI:
     app = FastAPI(title="Q&A API", lifespan=lifespan)
     app.include_router(api_router, tags=["Q&A API"])
     setup_exception_handlers(app)
+    # внутри метрик: время ожидания слота входит в задержку запроса
+    setup_admission_control(app)
+    setup_metrics(app)
+    setup_query_stats(app)
     return app
 
 
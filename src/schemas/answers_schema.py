@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import StrEnum
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -12,9 +13,28 @@ class AnswerCreateSchema(AnswerBaseSchema):
     pass
 
 
+class AnswerBatchCreateSchema(AnswerCreateSchema):
+    question_id: int
+
+
 class AnswerSchema(AnswerBaseSchema):
     id: int
     question_id: int
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TicketStatus(StrEnum):
+    pending = "pending"
+    done = "done"
+    failed = "failed"
+
+
+class AnswerTicketSchema(BaseModel):
+    ticket_id: str
+    status: TicketStatus
+    # заполняется, когда ответ записан
+    answer_id: int | None = None
+    # причина, если status=failed
+    detail: str | None = None
@@ -0,0 +1,32 @@
+from datetime import datetime
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class ChangeEntity(StrEnum):
+    question = "question"
+    answer = "answer"
+
+
+class ChangeOp(StrEnum):
+    insert = "insert"
+    # tombstone: сущности больше нет, клиент удаляет её у себя
+    delete = "delete"
+
+
+class ChangeSchema(BaseModel):
+    entity: ChangeEntity
+    entity_id: int
+    # для вопроса — его собственный id
+    question_id: int
+    op: ChangeOp
+    changed_at: datetime
+
+
+class ChangesPageSchema(BaseModel):
+    items: list[ChangeSchema]
+    # токен для следующего запроса (since); есть всегда, кроме пустого журнала
+    next_since: str | None = None
+    # журнал прочитан не до конца — можно сразу запрашивать дальше
+    has_more: bool = False
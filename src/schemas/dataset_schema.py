@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, Field
+
+from src.schemas.answers_schema import AnswerBaseSchema
+from src.schemas.question_schema import QuestionBaseSchema
+
+
+class DatasetQuestionSchema(QuestionBaseSchema):
+    type: Literal["question"] = "question"
+    # id в исходной базе; при импорте выдаётся новый
+    id: int
+    created_at: datetime
+
+
+class DatasetAnswerSchema(AnswerBaseSchema):
+    type: Literal["answer"] = "answer"
+    id: int
+    # ссылается на id вопроса из того же набора, а не целевой базы
+    question_id: int
+    created_at: datetime
+
+
+DatasetRecord = Annotated[
+    DatasetQuestionSchema | DatasetAnswerSchema, Field(discriminator="type")
+]
+
+
+class DatasetImportResultSchema(BaseModel):
+    questions: int
+    answers: int
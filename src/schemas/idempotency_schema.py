@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class IdempotencyRecordSchema(BaseModel):
+    # sha256 тела запроса: тот же ключ с другим телом — ошибка клиента
+    fingerprint: str
+    # JSON сохранённого ответа
+    response: str
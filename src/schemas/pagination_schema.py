@@ -0,0 +1,10 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+ItemT = TypeVar("ItemT")
+
+
+class PageSchema(BaseModel, Generic[ItemT]):
+    items: list[ItemT]
+    next_cursor: str | None = None
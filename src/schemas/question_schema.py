@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import StrEnum
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -13,9 +14,23 @@ class QuestionCreateSchema(QuestionBaseSchema):
     pass
 
 
-class QuestionSchema(QuestionBaseSchema):
+class QuestionSummarySchema(QuestionBaseSchema):
     id: int
     created_at: datetime
-    answers: list[AnswerSchema]
+    answer_count: int = 0
+    last_answered_at: datetime | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class QuestionSchema(QuestionSummarySchema):
+    answers: list[AnswerSchema]
+
+
+class QuestionSort(StrEnum):
+    # новые первыми
+    created = "created"
+    # больше всего ответов
+    answers = "answers"
+    # недавняя активность: последний ответ или создание
+    activity = "activity"
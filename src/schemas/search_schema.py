@@ -0,0 +1,23 @@
+from datetime import datetime
+from enum import StrEnum
+
+from pydantic import BaseModel
+
+
+class SearchSource(StrEnum):
+    # значения совпадают с именами таблиц
+    questions = "questions"
+    answers = "answers"
+
+
+class SearchHitSchema(BaseModel):
+    source: SearchSource
+    id: int
+    # для вопроса — его собственный id
+    question_id: int
+    text: str
+    created_at: datetime
+    rank: float
+    # фрагменты текста с совпадениями в <mark>...</mark>, если запрошены;
+    # HTML: текст экранирован, сырые теги в нём — только <mark>
+    snippet: str | None = None
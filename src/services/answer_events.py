@@ -0,0 +1,225 @@
+import asyncio
+import contextlib
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+
+from src.core.metrics import ANSWER_EVENTS_DROPPED
+from src.db.triggers import ANSWERS_CHANNEL
+from src.schemas.answers_schema import AnswerSchema
+from src.services.answers_service import AnswersService
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerSubscription:
+    def __init__(self, question_id: int, buffer_size: int):
+        self.question_id = question_id
+        # None в очереди — подписка закрыта хабом
+        self.queue: asyncio.Queue[AnswerSchema | None] = asyncio.Queue(
+            maxsize=buffer_size
+        )
+        self.overflowed = False
+
+
+class AnswerEventHub:
+    """
+    Раздача новых ответов SSE-подписчикам процесса через одно LISTEN-соединение.
+
+    Триггер на answers шлёт NOTIFY с (id, question_id) после коммита; хаб
+    загружает ответ один раз и кладёт его в буфер каждого подписчика этого
+    вопроса. Накопившиеся уведомления загружаются одним запросом на пачку.
+    Уведомления о вопросах без подписчиков отбрасываются без запроса в БД.
+    Подписчик, чей буфер заполнен (клиент не успевает читать), отключается:
+    очередь к медленному клиенту не растёт без ограничений. Очередь
+    уведомлений тоже ограничена max_pending: если хаб не успевает за БД,
+    подписчики вопроса с потерянным уведомлением отключаются так же.
+
+    При потере соединения хаб переподключается; ответы, закоммиченные
+    в этот промежуток, подписчикам не придут — клиент дочитывает их
+    через GET /questions/{id}/answers.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable],
+        answers_service: AnswersService,
+        buffer_size: int = 100,
+        heartbeat: float = 15.0,
+        reconnect_delay: float = 1.0,
+        max_pending: int = 10_000,
+    ):
+        self._connect = connect
+        self._answers_service = answers_service
+        self._buffer_size = buffer_size
+        self.heartbeat = heartbeat
+        self._reconnect_delay = reconnect_delay
+        self._subscribers: dict[int, set[AnswerSubscription]] = {}
+        self._pending: asyncio.Queue[tuple[int, int]] = asyncio.Queue(
+            maxsize=max_pending
+        )
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._listen(), name="answer-events-listen"),
+            asyncio.create_task(self._dispatch(), name="answer-events-dispatch"),
+        ]
+
+    @contextlib.contextmanager
+    def subscribe(self, question_id: int) -> Iterator[AnswerSubscription]:
+        subscription = AnswerSubscription(question_id, self._buffer_size)
+        self._subscribers.setdefault(question_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._unsubscribe(subscription)
+
+    def subscriber_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    def _unsubscribe(self, subscription: AnswerSubscription) -> None:
+        subscribers = self._subscribers.get(subscription.question_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.question_id]
+
+    def _disconnect_overflowed(self, subscription: AnswerSubscription) -> None:
+        # клиент пропустит ответ: пусть узнает об этом и дочитает через GET
+        subscription.overflowed = True
+        self._unsubscribe(subscription)
+        self._close(subscription)
+
+    @staticmethod
+    def _close(subscription: AnswerSubscription) -> None:
+        # буфер больше не нужен: освобождаем место под сигнал закрытия
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+            question_id, answer_id = int(event["question_id"]), int(event["id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Malformed %s payload: %r", channel, payload)
+            return
+        if question_id not in self._subscribers:
+            return
+        try:
+            self._pending.put_nowait((question_id, answer_id))
+        except asyncio.QueueFull:
+            ANSWER_EVENTS_DROPPED.inc()
+            logger.warning(
+                "Answer event queue is full, dropping answer %d (question %d)",
+                answer_id,
+                question_id,
+            )
+            for subscription in list(self._subscribers[question_id]):
+                self._disconnect_overflowed(subscription)
+
+    async def _dispatch(self) -> None:
+        # один обработчик: ответы уходят подписчикам в порядке уведомлений
+        while True:
+            batch = [await self._pending.get()]
+            while not self._pending.empty():
+                batch.append(self._pending.get_nowait())
+            batch = [event for event in batch if event[0] in self._subscribers]
+            if not batch:
+                continue
+            try:
+                answers = await self._answers_service.get_answers_by_ids(
+                    [answer_id for _, answer_id in batch]
+                )
+            except Exception:
+                logger.exception(
+                    "Failed to load %d answers for subscribers", len(batch)
+                )
+                continue
+            # удалённые раньше, чем мы их прочитали, просто отсутствуют
+            by_id = {answer.id: answer for answer in answers}
+            for question_id, answer_id in batch:
+                if answer_id in by_id:
+                    self._publish(question_id, by_id[answer_id])
+
+    def _publish(self, question_id: int, answer: AnswerSchema) -> None:
+        for subscription in list(self._subscribers.get(question_id, ())):
+            try:
+                subscription.queue.put_nowait(answer)
+            except asyncio.QueueFull:
+                logger.info(
+                    "Disconnecting slow answer stream subscriber (question %d)",
+                    question_id,
+                )
+                self._disconnect_overflowed(subscription)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                connection = await self._connect()
+            except Exception:
+                logger.exception("LISTEN %s: connection failed", ANSWERS_CHANNEL)
+                await asyncio.sleep(self._reconnect_delay)
+                continue
+            try:
+                await self._hold(connection)
+            except Exception:
+                logger.exception("LISTEN %s: connection lost", ANSWERS_CHANNEL)
+            finally:
+                if not connection.is_closed():
+                    await connection.close()
+            await asyncio.sleep(self._reconnect_delay)
+
+    async def _hold(self, connection) -> None:
+        """Слушает канал, пока соединение живо."""
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+        await connection.add_listener(ANSWERS_CHANNEL, self._on_notify)
+        logger.info("LISTEN %s", ANSWERS_CHANNEL)
+        while not lost.is_set():
+            try:
+                await asyncio.wait_for(lost.wait(), self.heartbeat)
+            except TimeoutError:
+                # полуоткрытое соединение само о себе не сообщит
+                await connection.execute("SELECT 1")
+
+    async def close(self) -> None:
+        """Останавливает прослушивание и закрывает все подписки."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for subscribers in list(self._subscribers.values()):
+            for subscription in list(subscribers):
+                self._unsubscribe(subscription)
+                self._close(subscription)
+        logger.info("Answer event hub closed")
+
+
+async def iter_answer_events(
+    hub: AnswerEventHub, question_id: int
+) -> AsyncIterator[bytes]:
+    """
+    Кадры text/event-stream для подписки на ответы вопроса.
+
+    Подписка живёт, пока клиент читает: при отключении Starlette отменяет
+    генератор, и подписка снимается в finally менеджера subscribe.
+    """
+    with hub.subscribe(question_id) as subscription:
+        # первый кадр сразу отправляет заголовки ответа
+        yield b": connected\n\n"
+        while True:
+            try:
+                answer = await asyncio.wait_for(subscription.queue.get(), hub.heartbeat)
+            except TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+            if answer is None:
+                if subscription.overflowed:
+                    yield b"event: overflow\ndata: {}\n\n"
+                return
+            yield b"id: %d\nevent: answer\ndata: %s\n\n" % (
+                answer.id,
+                answer.model_dump_json().encode(),
+            )
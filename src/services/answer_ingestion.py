@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+from src.core.domain_exceptions import (
+    IngestionQueueFullException,
+    QuestionNotFoundException,
+    TicketNotFoundException,
+)
+from src.schemas.answers_schema import (
+    AnswerBatchCreateSchema,
+    AnswerTicketSchema,
+    TicketStatus,
+)
+from src.services.answers_service import AnswersService
+
+logger = logging.getLogger(__name__)
+
+# сколько последних тикетов помним для запросов статуса
+MAX_TICKETS = 100_000
+# ключ pg_advisory_lock, которым очередь занимает БД за одним процессом
+INGESTION_LOCK_KEY = 7_245_001
+
+
+class AnswerIngestionQueue:
+    """
+    Ограниченная очередь ответов с фоновой записью пачками (202 Accepted).
+
+    submit кладёт ответ в очередь и сразу возвращает тикет; воркер забирает
+    всё накопленное (до batch_size) и пишет через
+    AnswersService.add_answers_each. Переполнение очереди —
+    IngestionQueueFullException, а не ожидание: клиенту лучше получить 429,
+    чем держать соединение. drain() перестаёт принимать новые ответы и
+    дописывает принятые.
+
+    Очередь и тикеты живут в памяти процесса: статус тикета знает только
+    принявший его процесс. Поэтому очередь работает в единственном процессе
+    на БД — claim() берёт advisory lock, и второй процесс (ещё один воркер
+    uvicorn или инстанс) не стартует, а не отвечает 404 на чужие тикеты.
+    """
+
+    def __init__(
+        self, answers_service: AnswersService, max_size=10_000, batch_size=500
+    ):
+        self._answers_service = answers_service
+        self._batch_size = batch_size
+        self._queue: asyncio.Queue[tuple[str, AnswerBatchCreateSchema]] = asyncio.Queue(
+            maxsize=max_size
+        )
+        self._tickets: OrderedDict[str, AnswerTicketSchema] = OrderedDict()
+        self._worker: asyncio.Task | None = None
+        self._accepting = True
+        self._lock_connection = None
+
+    async def claim(self, connect: Callable[[], Awaitable]) -> None:
+        """
+        Закрепляет очередь за этим процессом на время его жизни.
+
+        Блокировка держится отдельным соединением и снимается при его
+        закрытии в drain() или вместе с упавшим процессом.
+        """
+        connection = await connect()
+        if not await connection.fetchval(
+            "SELECT pg_try_advisory_lock($1)", INGESTION_LOCK_KEY
+        ):
+            await connection.close()
+            raise RuntimeError(
+                "Answer ingestion is already running in another process: "
+                "tickets are kept in process memory, so run the app with a "
+                "single worker or set ANSWER_INGESTION_ENABLED=false"
+            )
+        self._lock_connection = connection
+
+    def start(self) -> None:
+        self._worker = asyncio.create_task(self._run(), name="answer-ingestion")
+
+    def submit(self, answer: AnswerBatchCreateSchema) -> AnswerTicketSchema:
+        if not self._accepting:
+            raise IngestionQueueFullException()
+        ticket = AnswerTicketSchema(
+            ticket_id=uuid.uuid4().hex, status=TicketStatus.pending
+        )
+        try:
+            self._queue.put_nowait((ticket.ticket_id, answer))
+        except asyncio.QueueFull:
+            raise IngestionQueueFullException() from None
+        self._tickets[ticket.ticket_id] = ticket
+        while len(self._tickets) > MAX_TICKETS:
+            self._tickets.popitem(last=False)
+        return ticket
+
+    def get_ticket(self, ticket_id: str) -> AnswerTicketSchema:
+        ticket = self._tickets.get(ticket_id)
+        if ticket is None:
+            raise TicketNotFoundException()
+        return ticket
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write(self, batch: list[tuple[str, AnswerBatchCreateSchema]]) -> None:
+        try:
+            results = await self._answers_service.add_answers_each(
+                [answer for _, answer in batch]
+            )
+        except Exception as e:
+            logger.exception("Queued answers write failed (%d answers)", len(batch))
+            results = [e] * len(batch)
+        for (ticket_id, _), result in zip(batch, results, strict=True):
+            ticket = self._tickets.get(ticket_id)
+            if ticket is None:
+                continue
+            if isinstance(result, QuestionNotFoundException):
+                ticket.status = TicketStatus.failed
+                ticket.detail = "Question not found"
+            elif isinstance(result, Exception):
+                ticket.status = TicketStatus.failed
+                ticket.detail = "Internal Server Error"
+            else:
+                ticket.status = TicketStatus.done
+                ticket.answer_id = result
+
+    async def drain(self) -> None:
+        """Перестаёт принимать ответы, дописывает очередь и останавливает воркер."""
+        self._accepting = False
+        if self._worker is not None:
+            if not self._worker.done():
+                await self._queue.join()
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            logger.info("Answer ingestion queue drained")
+        if self._lock_connection is not None:
+            await self._lock_connection.close()
+            self._lock_connection = None
@@ -0,0 +1,82 @@
+import asyncio
+import contextvars
+import logging
+
+from src.schemas.answers_schema import AnswerBatchCreateSchema
+from src.services.answers_service import AnswersService
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerWriteCoalescer:
+    """
+    Group commit для одиночных ответов.
+
+    Конкурентные вызовы submit в пределах окна window (или до max_batch штук)
+    записываются одним INSERT ... RETURNING и одним COMMIT через
+    AnswersService.add_answers_each. Каждый вызывающий получает свой id или
+    своё исключение: позиции с несуществующим вопросом отваливаются с
+    QuestionNotFoundException, остальные перезаписываются без них.
+
+    submit возвращает управление только после коммита пачки. Пачка пишется
+    в чистом contextvars-контексте: она общая, и её запросы не должны
+    попадать в QueryStats того запроса, который открыл окно.
+    """
+
+    def __init__(
+        self, answers_service: AnswersService, window: float = 0.002, max_batch=200
+    ):
+        self._answers_service = answers_service
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: list[tuple[AnswerBatchCreateSchema, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._writes: set[asyncio.Task] = set()
+
+    async def submit(self, answer: AnswerBatchCreateSchema) -> int:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((answer, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._window, self._flush
+            )
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        # пачки пишутся независимо: следующая копится, пока эта коммитится
+        task = asyncio.create_task(self._write(batch), context=contextvars.Context())
+        self._writes.add(task)
+        task.add_done_callback(self._writes.discard)
+
+    async def _write(
+        self, batch: list[tuple[AnswerBatchCreateSchema, asyncio.Future]]
+    ) -> None:
+        try:
+            results = await self._answers_service.add_answers_each(
+                [answer for answer, _ in batch]
+            )
+        except Exception as e:
+            logger.exception("Coalesced answer write failed")
+            results = [e] * len(batch)
+        for (_, future), result in zip(batch, results, strict=True):
+            # вызывающий мог уже уйти (отмена запроса) — строка всё равно записана
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Дописывает накопленное и дожидается всех пачек в полёте."""
+        self._flush()
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
@@ -1,43 +1,270 @@
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from typing import TYPE_CHECKING
 
 from src.core.domain_exceptions import (
     AnswerNotFoundException,
+    BatchQuestionNotFoundException,
     QuestionNotFoundException,
+    TicketNotFoundException,
 )
 from src.db.db_exceptions import ForeignKeyViolation
 from src.schemas import AnswerSchema
-from src.schemas.answers_schema import AnswerCreateSchema
-from src.utils.unitofwork import UnitOfWork
+from src.schemas.answers_schema import (
+    AnswerBatchCreateSchema,
+    AnswerCreateSchema,
+    AnswerTicketSchema,
+)
+from src.schemas.pagination_schema import PageSchema
+from src.services.idempotency import IdempotencyKeys, request_fingerprint
+from src.utils.cache import QuestionsCache
+from src.utils.pagination import decode_cursor, page_from_rows
+from src.utils.unitofwork import IUnitOfWork
+
+if TYPE_CHECKING:
+    from src.services.answer_ingestion import AnswerIngestionQueue
+    from src.services.answer_write_coalescer import AnswerWriteCoalescer
 
 
 class AnswersService:
-    def __init__(self, uow_factory: Callable[[], UnitOfWork]):
+    def __init__(
+        self,
+        uow_factory: Callable[..., IUnitOfWork],
+        questions_cache: QuestionsCache | None = None,
+        write_coalescer: "AnswerWriteCoalescer | None" = None,
+        ingestion_queue: "AnswerIngestionQueue | None" = None,
+        idempotency: IdempotencyKeys | None = None,
+        mark_write: Callable[[], None] | None = None,
+    ):
         self._uow_factory = uow_factory
+        self._questions_cache = questions_cache
+        self._write_coalescer = write_coalescer
+        self._ingestion_queue = ingestion_queue
+        self._idempotency = idempotency
+        self._mark_write = mark_write
 
-    async def add_answer(self, answer: AnswerCreateSchema, question_id: int) -> int:
+    @property
+    def accepts_async(self) -> bool:
+        return self._ingestion_queue is not None
+
+    async def add_answer(
+        self,
+        answer: AnswerCreateSchema,
+        question_id: int,
+        idempotency_key: str | None = None,
+    ) -> int:
+        if idempotency_key is not None and self._idempotency is not None:
+            return await self._add_answer_idempotent(
+                answer, question_id, idempotency_key
+            )
+        if self._write_coalescer is not None:
+            return await self._add_answer_coalesced(answer, question_id)
         try:
             answer_dict = answer.model_dump()
             async with self._uow_factory() as uow:
                 answer_dict["question_id"] = question_id
                 answer_id = await uow.answers_repo.add_one(data=answer_dict)
+                if self._questions_cache is not None:
+                    uow.after_commit(
+                        lambda: self._questions_cache.invalidate_question(question_id)
+                    )
                 return answer_id
         except ForeignKeyViolation as e:
             raise QuestionNotFoundException() from e
 
+    async def _add_answer_idempotent(
+        self, answer: AnswerCreateSchema, question_id: int, idempotency_key: str
+    ) -> int:
+        # ключ сохраняется в транзакции вставки, поэтому мимо группового коммита
+        answer_dict = {**answer.model_dump(), "question_id": question_id}
+
+        async def write(uow: IUnitOfWork) -> int:
+            answer_id = await uow.answers_repo.add_one(data=answer_dict)
+            if self._questions_cache is not None:
+                uow.after_commit(
+                    lambda: self._questions_cache.invalidate_question(question_id)
+                )
+            return answer_id
+
+        try:
+            return await self._idempotency.execute(
+                self._uow_factory,
+                scope="answers.create",
+                key=idempotency_key,
+                fingerprint=request_fingerprint(answer_dict),
+                write=write,
+            )
+        except ForeignKeyViolation as e:
+            raise QuestionNotFoundException() from e
+
+    async def _add_answer_coalesced(
+        self, answer: AnswerCreateSchema, question_id: int
+    ) -> int:
+        item = AnswerBatchCreateSchema(question_id=question_id, **answer.model_dump())
+        # запись уходит общей пачкой без UoW запроса; submit возвращается
+        # после коммита, поэтому дальше — то, что делал бы after_commit
+        answer_id = await self._write_coalescer.submit(item)
+        if self._questions_cache is not None:
+            self._questions_cache.invalidate_question(question_id)
+        if self._mark_write is not None:
+            self._mark_write()
+        return answer_id
+
+    def enqueue_answer(
+        self, answer: AnswerCreateSchema, question_id: int
+    ) -> AnswerTicketSchema:
+        """
+        Ставит ответ в очередь фоновой записи и сразу возвращает тикет.
+
+        Существование вопроса проверяется при записи: результат виден
+        в статусе тикета.
+        """
+        item = AnswerBatchCreateSchema(question_id=question_id, **answer.model_dump())
+        return self._ingestion_queue.submit(item)
+
+    def get_answer_ticket(self, ticket_id: str) -> AnswerTicketSchema:
+        if self._ingestion_queue is None:
+            raise TicketNotFoundException()
+        return self._ingestion_queue.get_ticket(ticket_id)
+
+    async def add_answers(self, answers: list[AnswerBatchCreateSchema]) -> list[int]:
+        """
+        Вставляет пачку ответов (возможно, к разным вопросам) в одной транзакции.
+
+        Батч атомарен: если хотя бы одного вопроса нет, не вставляется ничего,
+        а в исключении перечислены все проблемные позиции.
+        """
+        rows = [answer.model_dump() for answer in answers]
+        try:
+            async with self._uow_factory() as uow:
+                answer_ids = await uow.answers_repo.add_many(rows)
+                if self._questions_cache is not None:
+                    question_ids = {row["question_id"] for row in rows}
+                    uow.after_commit(
+                        lambda: self._questions_cache.invalidate_questions(question_ids)
+                    )
+                return answer_ids
+        except ForeignKeyViolation as e:
+            # разбираемся, какие позиции виноваты, только на редком пути ошибки
+            missing = await self._find_missing_questions(rows)
+            if not missing:
+                raise QuestionNotFoundException() from e
+            raise BatchQuestionNotFoundException(missing) from e
+
+    async def add_answers_each(
+        self, answers: list[AnswerBatchCreateSchema]
+    ) -> list[int | QuestionNotFoundException]:
+        """
+        Как add_answers, но без атомарности батча.
+
+        Позиции с несуществующим вопросом получают QuestionNotFoundException,
+        остальные записываются повторной вставкой без них. Результат — id или
+        исключение на каждую входную позицию, в исходном порядке.
+
+        Если вставка упала на внешнем ключе, а проверка не нашла виноватых
+        (вопрос удалили или создали между вставкой и проверкой), оставшиеся
+        позиции пишутся по одной: ошибка одной из них не роняет остальные.
+        """
+        results: list[int | QuestionNotFoundException | None] = [None] * len(answers)
+        pending = list(range(len(answers)))
+        while pending:
+            try:
+                answer_ids = await self.add_answers([answers[i] for i in pending])
+            except BatchQuestionNotFoundException as e:
+                failed = {pending[item["index"]] for item in e.items}
+                for index in failed:
+                    results[index] = QuestionNotFoundException()
+                pending = [index for index in pending if index not in failed]
+                continue
+            except QuestionNotFoundException:
+                for index in pending:
+                    results[index] = await self._add_answer_alone(answers[index])
+                break
+            for index, answer_id in zip(pending, answer_ids, strict=True):
+                results[index] = answer_id
+            break
+        return results
+
+    async def _add_answer_alone(
+        self, answer: AnswerBatchCreateSchema
+    ) -> int | QuestionNotFoundException:
+        try:
+            [answer_id] = await self.add_answers([answer])
+        except (BatchQuestionNotFoundException, QuestionNotFoundException):
+            # для одной позиции это одно и то же: вопроса нет
+            return QuestionNotFoundException()
+        return answer_id
+
+    async def _find_missing_questions(self, rows: list[dict]) -> list[dict]:
+        # с primary: отставшая реплика ещё показывала бы удалённый вопрос
+        async with self._uow_factory(read_only=True, prefer_primary=True) as uow:
+            existing = await uow.questions_repo.existing_ids(
+                {row["question_id"] for row in rows}
+            )
+        return [
+            {"index": index, "question_id": row["question_id"]}
+            for index, row in enumerate(rows)
+            if row["question_id"] not in existing
+        ]
+
     async def delete_answer(self, answer_id: int) -> bool:
         async with self._uow_factory() as uow:
             deleted = await uow.answers_repo.del_one(answer_id)
             if not deleted:
                 raise AnswerNotFoundException()
+            if self._questions_cache is not None:
+                uow.after_commit(
+                    lambda: self._questions_cache.invalidate_answer(answer_id)
+                )
             return deleted
 
     async def get_answer(self, answer_id) -> AnswerSchema:
-        async with self._uow_factory() as uow:
+        async with self._uow_factory(read_only=True) as uow:
             answer = await uow.answers_repo.find_one(answer_id)
             if answer is None:
                 raise AnswerNotFoundException()
             return answer
 
+    async def get_answers_by_ids(self, answer_ids: list[int]) -> list[AnswerSchema]:
+        """Существующие ответы из списка; удалённые просто отсутствуют."""
+        async with self._uow_factory(read_only=True) as uow:
+            return await uow.answers_repo.find_many(answer_ids)
+
     async def get_answers(self) -> list[AnswerSchema]:
-        async with self._uow_factory() as uow:
+        async with self._uow_factory(read_only=True) as uow:
             return await uow.answers_repo.find_all()
+
+    async def stream_answers(self) -> AsyncIterator[AnswerSchema]:
+        async with self._uow_factory(read_only=True) as uow:
+            async for answer in uow.answers_repo.stream_all():
+                yield answer
+
+    async def get_question_answers(
+        self, question_id: int, limit: int, cursor: str | None = None
+    ) -> PageSchema[AnswerSchema]:
+        after = decode_cursor(cursor, datetime.fromisoformat, int) if cursor else None
+        async with self._uow_factory(read_only=True) as uow:
+            rows = await uow.answers_repo.find_page(
+                limit + 1, after=after, question_id=question_id
+            )
+            # пустая первая страница — либо нет ответов, либо нет самого вопроса
+            if not rows and after is None:
+                if not await uow.questions_repo.exists(question_id):
+                    raise QuestionNotFoundException()
+        items, next_cursor = page_from_rows(
+            rows, limit, key=lambda a: (a.created_at, a.id)
+        )
+        return PageSchema[AnswerSchema](items=items, next_cursor=next_cursor)
+
+    async def get_user_answers(
+        self, user_id: str, limit: int, cursor: str | None = None
+    ) -> PageSchema[AnswerSchema]:
+        after = decode_cursor(cursor, datetime.fromisoformat, int) if cursor else None
+        async with self._uow_factory(read_only=True) as uow:
+            rows = await uow.answers_repo.find_user_page(
+                user_id, limit + 1, after=after
+            )
+        items, next_cursor = page_from_rows(
+            rows, limit, key=lambda a: (a.created_at, a.id)
+        )
+        return PageSchema[AnswerSchema](items=items, next_cursor=next_cursor)
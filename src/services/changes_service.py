@@ -0,0 +1,34 @@
+from collections.abc import Callable
+
+from src.schemas.change_schema import ChangesPageSchema
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.utils.unitofwork import IUnitOfWork
+
+
+class ChangesService:
+    def __init__(self, uow_factory: Callable[..., IUnitOfWork]):
+        self._uow_factory = uow_factory
+
+    async def get_changes(
+        self, limit: int, since: str | None = None
+    ) -> ChangesPageSchema:
+        """
+        Вставки и удаления вопросов и ответов после токена since, в порядке коммита.
+
+        next_since возвращается и на пустой странице: клиент сохраняет его
+        и продолжает с него при следующем опросе. Без since журнал читается
+        с начала — это и есть полная первоначальная синхронизация.
+        """
+        after = decode_cursor(since, int, int) if since else None
+        async with self._uow_factory(read_only=True) as uow:
+            rows = await uow.changes_repo.find_since(limit + 1, after=after)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if rows:
+            txid, change_id, _ = rows[-1]
+            since = encode_cursor(txid, change_id)
+        return ChangesPageSchema(
+            items=[change for _, _, change in rows],
+            next_since=since,
+            has_more=has_more,
+        )
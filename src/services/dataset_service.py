@@ -0,0 +1,128 @@
+import logging
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+
+from src.core.domain_exceptions import DatasetImportException
+from src.db.db_exceptions import UniqueConstraintViolation
+from src.schemas.dataset_schema import DatasetImportResultSchema
+from src.utils.dataset import DatasetFormat, decode_dataset, encode_dataset
+from src.utils.unitofwork import IUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+
+class TransferProgress:
+    """Счётчики перенесённых записей; в лог — не чаще раза в interval секунд."""
+
+    def __init__(self, operation: str, interval: float = 5.0):
+        self.operation = operation
+        self.interval = interval
+        self.counts = {"question": 0, "answer": 0}
+        self._started = self._logged = time.monotonic()
+
+    def advance(self, kind: str, records: int = 1) -> None:
+        self.counts[kind] += records
+        if time.monotonic() - self._logged >= self.interval:
+            self.log()
+
+    def log(self, done: bool = False) -> None:
+        now = time.monotonic()
+        self._logged = now
+        total = self.counts["question"] + self.counts["answer"]
+        logger.info(
+            "%s%s: %d questions, %d answers (%.0f records/s)",
+            self.operation,
+            " done" if done else "",
+            self.counts["question"],
+            self.counts["answer"],
+            total / max(now - self._started, 1e-9),
+        )
+
+
+async def _counted(
+    rows: AsyncIterable[tuple], progress: TransferProgress
+) -> AsyncIterator[tuple]:
+    async for row in rows:
+        progress.advance(row[0])
+        yield row
+
+
+class DatasetService:
+    """Выгрузка и загрузка всего набора вопросов и ответов (перенос между средами)."""
+
+    def __init__(self, uow_factory: Callable[..., IUnitOfWork], batch_size=10_000):
+        self._uow_factory = uow_factory
+        self._batch_size = batch_size
+
+    async def export_dataset(
+        self, dataset_format: DatasetFormat
+    ) -> AsyncIterator[bytes]:
+        """Чанки файла по мере чтения серверного курсора."""
+        progress = TransferProgress("Export")
+        async with self._uow_factory(read_only=True) as uow:
+            rows = _counted(uow.questions_repo.stream_dataset(), progress)
+            async for chunk in encode_dataset(rows, dataset_format):
+                yield chunk
+        progress.log(done=True)
+
+    async def import_dataset(
+        self, chunks: AsyncIterable[bytes], dataset_format: DatasetFormat
+    ) -> DatasetImportResultSchema:
+        """
+        Загружает набор в одной транзакции; вопросы и ответы получают новые id.
+
+        Файл читается потоком и пачками по batch_size копируется во временные
+        таблицы, так что память не растёт с размером файла. Ошибка в любой
+        записи, повтор id вопроса или ответ на вопрос не из набора —
+        DatasetImportException, и не загружается ничего.
+        """
+        progress = TransferProgress("Import")
+        questions: list[tuple] = []
+        answers: list[tuple] = []
+        async with self._uow_factory() as uow:
+            await uow.questions_repo.stage_import()
+            async for record in decode_dataset(chunks, dataset_format):
+                if record.type == "question":
+                    questions.append((record.id, record.text, record.created_at))
+                else:
+                    answers.append(
+                        (
+                            record.id,
+                            record.question_id,
+                            record.user_id,
+                            record.text,
+                            record.created_at,
+                        )
+                    )
+                if len(questions) + len(answers) >= self._batch_size:
+                    await self._stage(uow, questions, answers, progress)
+                    questions, answers = [], []
+            await self._stage(uow, questions, answers, progress)
+
+            try:
+                imported = await uow.questions_repo.apply_import()
+            except UniqueConstraintViolation as e:
+                raise DatasetImportException("Duplicate question id") from e
+            imported_questions, imported_answers = imported
+            orphans = progress.counts["answer"] - imported_answers
+            if orphans:
+                raise DatasetImportException(
+                    f"{orphans} answers reference questions missing from the dataset"
+                )
+        progress.log(done=True)
+        return DatasetImportResultSchema(
+            questions=imported_questions, answers=imported_answers
+        )
+
+    @staticmethod
+    async def _stage(
+        uow: IUnitOfWork,
+        questions: list[tuple],
+        answers: list[tuple],
+        progress: TransferProgress,
+    ) -> None:
+        if not questions and not answers:
+            return
+        await uow.questions_repo.copy_import_rows(questions, answers)
+        progress.advance("question", len(questions))
+        progress.advance("answer", len(answers))
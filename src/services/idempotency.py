@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from typing import Any
+
+from pydantic_core import to_json
+
+from src.core.domain_exceptions import IdempotencyKeyMismatchException
+from src.core.metrics import IDEMPOTENCY_REPLAYS
+from src.db.db_exceptions import UniqueConstraintViolation
+from src.schemas.idempotency_schema import IdempotencyRecordSchema
+from src.utils.cache import LruTtlCache
+from src.utils.unitofwork import IUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+# запись — отпечаток и короткий JSON; объём кэша ограничивает число записей
+CACHE_BYTES_PER_ENTRY = 1024
+
+
+def request_fingerprint(payload: Any) -> str:
+    return hashlib.sha256(to_json(payload)).hexdigest()
+
+
+class IdempotencyKeys:
+    """
+    Idempotency-Key для эндпоинтов создания.
+
+    Ответ сохраняется в idempotency_keys в транзакции самой вставки, поэтому
+    повтор запроса (клиент не дождался ответа) возвращает тот же результат,
+    не выполняя вставку ещё раз. Перед БД стоит короткоживущий кэш процесса:
+    повтор, пришедший в тот же процесс, обходится без запроса.
+
+    Два одновременных запроса с одним ключом оба не найдут его, но INSERT
+    ключа второго дождётся коммита первого и упадёт по первичному ключу:
+    транзакция второго откатывается вместе с его вставкой, и он отвечает
+    сохранённым результатом. Ключи старше ttl удаляет фоновая задача.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 24 * 60 * 60,
+        cache_max_entries: int = 10_000,
+        cache_ttl: float = 60.0,
+    ):
+        self.ttl = timedelta(seconds=ttl)
+        self._cache = LruTtlCache(
+            max_entries=cache_max_entries,
+            max_bytes=cache_max_entries * CACHE_BYTES_PER_ENTRY,
+            ttl=cache_ttl,
+        )
+        self._purge_task: asyncio.Task | None = None
+
+    async def execute(
+        self,
+        uow_factory: Callable[..., IUnitOfWork],
+        scope: str,
+        key: str,
+        fingerprint: str,
+        write: Callable[[IUnitOfWork], Awaitable[Any]],
+    ) -> Any:
+        """
+        Выполняет write(uow) и сохраняет его результат под ключом в той же
+        транзакции; для уже известного ключа возвращает сохранённый результат.
+        """
+        cached = self._cache.get((scope, key))
+        if cached is not None:
+            record = IdempotencyRecordSchema.model_validate_json(cached)
+            return self._replay(scope, key, fingerprint, record, source="cache")
+        # поиск ключа — чтение, но с primary: на отстающей реплике повтор
+        # не нашёл бы ключ и пошёл бы в запись ради конфликта
+        async with uow_factory(read_only=True, prefer_primary=True) as uow:
+            record = await uow.idempotency_repo.find_key(scope, key)
+        if record is not None:
+            return self._replay(scope, key, fingerprint, record, source="db")
+
+        try:
+            async with uow_factory() as uow:
+                result = await write(uow)
+                record = IdempotencyRecordSchema(
+                    fingerprint=fingerprint, response=to_json(result).decode()
+                )
+                await uow.idempotency_repo.save_key(scope, key, record)
+                uow.after_commit(lambda: self._remember(scope, key, record))
+        except UniqueConstraintViolation:
+            # читаем с primary: реплика могла ещё не получить ключ. Read-only
+            # UoW не помечает клиента как писавшего
+            async with uow_factory(read_only=True, prefer_primary=True) as uow:
+                record = await uow.idempotency_repo.find_key(scope, key)
+            if record is None:
+                raise
+            return self._replay(scope, key, fingerprint, record, source="conflict")
+        return result
+
+    def _replay(
+        self,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        record: IdempotencyRecordSchema,
+        source: str,
+    ) -> Any:
+        if record.fingerprint != fingerprint:
+            raise IdempotencyKeyMismatchException()
+        if source != "cache":
+            self._remember(scope, key, record)
+        IDEMPOTENCY_REPLAYS.inc(scope, source)
+        return json.loads(record.response)
+
+    def _remember(self, scope: str, key: str, record: IdempotencyRecordSchema):
+        self._cache.set((scope, key), record.model_dump_json().encode())
+
+    async def purge_expired(
+        self, uow_factory: Callable[..., IUnitOfWork], batch_size: int = 10_000
+    ) -> int:
+        """Удаляет ключи старше ttl пачками, по транзакции на пачку."""
+        total = 0
+        while True:
+            async with uow_factory() as uow:
+                deleted = await uow.idempotency_repo.purge_expired(self.ttl, batch_size)
+            total += deleted
+            if deleted < batch_size:
+                return total
+
+    def start_purge(
+        self,
+        uow_factory: Callable[..., IUnitOfWork],
+        interval: float,
+        batch_size: int,
+    ) -> None:
+        self._purge_task = asyncio.create_task(
+            self._purge_periodically(uow_factory, interval, batch_size),
+            name="idempotency-purge",
+        )
+
+    async def _purge_periodically(
+        self, uow_factory: Callable[..., IUnitOfWork], interval: float, batch_size
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                deleted = await self.purge_expired(uow_factory, batch_size)
+            except Exception:
+                logger.exception("Idempotency key purge failed")
+                continue
+            if deleted:
+                logger.info("Purged %d expired idempotency keys", deleted)
+
+    async def close(self) -> None:
+        if self._purge_task is not None:
+            self._purge_task.cancel()
+            await asyncio.gather(self._purge_task, return_exceptions=True)
@@ -1,36 +1,160 @@
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
 
 from src.core.domain_exceptions import QuestionNotFoundException
 from src.schemas import QuestionSchema
-from src.schemas.question_schema import QuestionCreateSchema
-from src.utils.unitofwork import UnitOfWork
+from src.schemas.pagination_schema import PageSchema
+from src.schemas.question_schema import (
+    QuestionCreateSchema,
+    QuestionSort,
+    QuestionSummarySchema,
+)
+from src.services.idempotency import IdempotencyKeys, request_fingerprint
+from src.utils.cache import QuestionsCache
+from src.utils.pagination import decode_cursor, page_from_rows
+from src.utils.unitofwork import IUnitOfWork
+
+# ключ keyset-курсора для каждой сортировки: типы значений и как их взять из вопроса
+_SORT_CURSOR_TYPES = {
+    QuestionSort.created: (datetime.fromisoformat, int),
+    QuestionSort.answers: (int, int),
+    QuestionSort.activity: (datetime.fromisoformat, int),
+}
+_SORT_KEYS = {
+    QuestionSort.created: lambda q: (q.created_at, q.id),
+    QuestionSort.answers: lambda q: (q.answer_count, q.id),
+    QuestionSort.activity: lambda q: (q.last_answered_at or q.created_at, q.id),
+}
+
+
+def _decode_sort_cursor(cursor: str | None, sort: QuestionSort) -> tuple | None:
+    return decode_cursor(cursor, *_SORT_CURSOR_TYPES[sort]) if cursor else None
 
 
 class QuestionsService:
-    def __init__(self, uow_factory: Callable[[], UnitOfWork]):
+    def __init__(
+        self,
+        uow_factory: Callable[..., IUnitOfWork],
+        cache: QuestionsCache | None = None,
+        idempotency: IdempotencyKeys | None = None,
+    ):
         self._uow_factory = uow_factory
+        self._cache = cache
+        self._idempotency = idempotency
 
-    async def add_question(self, question: QuestionCreateSchema) -> int:
+    async def add_question(
+        self, question: QuestionCreateSchema, idempotency_key: str | None = None
+    ) -> int:
+        if idempotency_key is not None and self._idempotency is not None:
+            question_dict = question.model_dump()
+            return await self._idempotency.execute(
+                self._uow_factory,
+                scope="questions.create",
+                key=idempotency_key,
+                fingerprint=request_fingerprint(question_dict),
+                write=lambda uow: uow.questions_repo.add_one(question_dict),
+            )
         async with self._uow_factory() as uow:
             question_dict = question.model_dump()
             question_id = await uow.questions_repo.add_one(question_dict)
             return question_id
 
+    async def add_questions(self, questions: list[QuestionCreateSchema]) -> list[int]:
+        async with self._uow_factory() as uow:
+            return await uow.questions_repo.add_many(
+                [question.model_dump() for question in questions]
+            )
+
     async def delete_question(self, question_id) -> bool:
         async with self._uow_factory() as uow:
             deleted = await uow.questions_repo.del_one(question_id)
             if not deleted:
                 raise QuestionNotFoundException()
+            if self._cache is not None:
+                uow.after_commit(lambda: self._cache.invalidate_question(question_id))
             return deleted
 
-    async def get_question(self, question_id: int) -> QuestionSchema | None:
-        async with self._uow_factory() as uow:
+    async def get_question(
+        self, question_id: int, include_answers: bool = True
+    ) -> QuestionSchema | QuestionSummarySchema:
+        async with self._uow_factory(read_only=True) as uow:
+            if include_answers:
+                question = await uow.questions_repo.find_one(question_id)
+            else:
+                question = await uow.questions_repo.find_one_summary(question_id)
+        if not question:
+            raise QuestionNotFoundException()
+        return question
+
+    async def get_question_payload(self, question_id: int) -> bytes:
+        """
+        Вопрос с ответами, уже сериализованный в JSON.
+
+        Попадание в кэш отдаёт сохранённые байты как есть: без валидации
+        и повторной сериализации.
+        """
+        if self._cache is not None:
+            cached = self._cache.get(question_id)
+            if cached is not None:
+                return cached
+            generation = self._cache.generation()
+        # кэш наполняем только с primary: инвалидация срабатывает на коммите,
+        # а отстающая реплика может вернуть строку до этой записи, и она
+        # осталась бы в кэше на весь TTL
+        async with self._uow_factory(
+            read_only=True, prefer_primary=self._cache is not None
+        ) as uow:
             question = await uow.questions_repo.find_one(question_id)
-            if not question:
-                raise QuestionNotFoundException()
-            return question
+        if not question:
+            raise QuestionNotFoundException()
+        payload = question.model_dump_json().encode()
+        if self._cache is not None:
+            self._cache.set(question, generation, payload)
+        return payload
 
     async def get_questions(self) -> list[QuestionSchema | None]:
-        async with self._uow_factory() as uow:
+        async with self._uow_factory(read_only=True) as uow:
             questions = await uow.questions_repo.find_all()
             return questions
+
+    async def stream_questions(self) -> AsyncIterator[QuestionSchema]:
+        async with self._uow_factory(read_only=True) as uow:
+            async for question in uow.questions_repo.stream_all():
+                yield question
+
+    async def get_questions_page(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        sort: QuestionSort = QuestionSort.created,
+    ) -> PageSchema[QuestionSchema]:
+        after = _decode_sort_cursor(cursor, sort)
+        async with self._uow_factory(read_only=True) as uow:
+            rows = await uow.questions_repo.find_page(limit + 1, after=after, sort=sort)
+        items, next_cursor = page_from_rows(rows, limit, key=_SORT_KEYS[sort])
+        return PageSchema[QuestionSchema](items=items, next_cursor=next_cursor)
+
+    async def get_question_json(self, question_id: int) -> str:
+        async with self._uow_factory(read_only=True) as uow:
+            question_json = await uow.questions_repo.find_one_json(question_id)
+        if question_json is None:
+            raise QuestionNotFoundException()
+        return question_json
+
+    async def get_questions_page_json(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        sort: QuestionSort = QuestionSort.created,
+    ) -> tuple[str, str | None]:
+        """
+        Та же страница, что get_questions_page: JSON-массив вопросов,
+        собранный Postgres, и курсор следующей страницы.
+        """
+        after = _decode_sort_cursor(cursor, sort)
+        async with self._uow_factory(read_only=True) as uow:
+            rows = await uow.questions_repo.find_page_json(
+                limit + 1, after=after, sort=sort
+            )
+        rows, next_cursor = page_from_rows(rows, limit, key=lambda row: row[:2])
+        return "[" + ",".join(row[2] for row in rows) + "]", next_cursor
@@ -0,0 +1,48 @@
+import heapq
+from collections.abc import Callable
+
+from src.schemas.pagination_schema import PageSchema
+from src.schemas.search_schema import SearchHitSchema, SearchSource
+from src.utils.pagination import decode_cursor, page_from_rows
+from src.utils.unitofwork import IUnitOfWork
+
+
+def _hit_key(hit: SearchHitSchema) -> tuple[float, str, int]:
+    return hit.rank, hit.source.value, hit.id
+
+
+class SearchService:
+    def __init__(self, uow_factory: Callable[..., IUnitOfWork]):
+        self._uow_factory = uow_factory
+
+    async def search(
+        self,
+        query: str,
+        limit: int,
+        cursor: str | None = None,
+        highlight: bool = False,
+        sources: set[SearchSource] | None = None,
+    ) -> PageSchema[SearchHitSchema]:
+        """
+        Поиск по вопросам и ответам одной выдачей, лучшие совпадения первыми.
+
+        Каждый репозиторий отдаёт до limit + 1 совпадений после курсора в общем
+        порядке (rank, source, id); слияние этих списков и есть страница.
+        """
+        after = decode_cursor(cursor, float, SearchSource, int) if cursor else None
+        if after is not None:
+            after = (after[0], after[1].value, after[2])
+        sources = sources or set(SearchSource)
+        async with self._uow_factory(read_only=True) as uow:
+            repos = {
+                SearchSource.questions: uow.questions_repo,
+                SearchSource.answers: uow.answers_repo,
+            }
+            hits = [
+                await repos[source].search(query, limit + 1, after, highlight)
+                for source in SearchSource
+                if source in sources
+            ]
+        rows = list(heapq.merge(*hits, key=_hit_key, reverse=True))[: limit + 1]
+        items, next_cursor = page_from_rows(rows, limit, key=_hit_key)
+        return PageSchema[SearchHitSchema](items=items, next_cursor=next_cursor)
@@ -0,0 +1,103 @@
+"""
+Выгрузка и загрузка всего набора вопросов и ответов (перенос между средами).
+
+Делает то же, что эндпоинты /api/v1/admin/dataset, но напрямую в базу из
+.env: выгрузка читает серверный курсор, загрузка копирует файл COPY во
+временные таблицы и переносит его в одной транзакции с новыми id.
+Формат берётся из расширения файла (.csv — CSV, иначе NDJSON) или --format.
+
+    python -m src.tools.dataset export --output dump.ndjson
+    python -m src.tools.dataset import --input dump.ndjson
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import sys
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from src.core.config import load_config
+from src.core.logging import setup_logging
+from src.db.database import Database
+from src.services.dataset_service import DatasetService
+from src.utils.dataset import DatasetFormat
+from src.utils.unitofwork import primary_uow_factory
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK = 256 * 1024
+
+
+def _format(path: str, explicit: str | None) -> DatasetFormat:
+    if explicit:
+        return DatasetFormat(explicit)
+    if Path(path).suffix.lower() == ".csv":
+        return DatasetFormat.csv
+    return DatasetFormat.ndjson
+
+
+def _open(path: str, mode: str, std):
+    # "-" — stdin/stdout, их не закрываем
+    return open(path, mode) if path != "-" else contextlib.nullcontext(std)
+
+
+async def _read_chunks(path: str) -> AsyncIterator[bytes]:
+    with _open(path, "rb", sys.stdin.buffer) as file:
+        while chunk := file.read(READ_CHUNK):
+            yield chunk
+
+
+async def export_dataset(service: DatasetService, args) -> None:
+    dataset_format = _format(args.output, args.format)
+    with _open(args.output, "wb", sys.stdout.buffer) as out:
+        async for chunk in service.export_dataset(dataset_format):
+            out.write(chunk)
+
+
+async def import_dataset(service: DatasetService, args) -> None:
+    result = await service.import_dataset(
+        _read_chunks(args.input), _format(args.input, args.format)
+    )
+    logger.info(
+        "Imported %d questions and %d answers", result.questions, result.answers
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--env", default=".env")
+    parser.add_argument("--format", choices=[f.value for f in DatasetFormat])
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export")
+    export_parser.add_argument("--output", required=True, help="файл или - (stdout)")
+    import_parser = commands.add_parser("import")
+    import_parser.add_argument("--input", required=True, help="файл или - (stdin)")
+    import_parser.add_argument("--batch", type=int, default=None)
+    args = parser.parse_args()
+
+    # stdout может быть занят выгрузкой: прогресс пишется в stderr
+    setup_logging()
+    config = load_config(path=args.env)
+    db = Database(db_config=config.db, echo=False)
+    # без statement_timeout API-чтений: выгрузка длится дольше любого запроса
+    service = DatasetService(
+        uow_factory=primary_uow_factory(db.session_maker),
+        batch_size=getattr(args, "batch", None) or config.admin.import_batch_size,
+    )
+
+    async def run() -> None:
+        try:
+            if args.command == "export":
+                await export_dataset(service, args)
+            else:
+                await import_dataset(service, args)
+        finally:
+            await db.dispose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
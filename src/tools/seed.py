@@ -0,0 +1,277 @@
+"""
+Генератор синтетических данных для нагрузочных замеров.
+
+Создаёт --questions вопросов и --answers ответов, распределённых по вопросам
+равномерно или по закону Ципфа (несколько «горячих» вопросов собирают
+основную массу ответов). Строки грузятся через COPY (asyncpg
+copy_records_to_table) на engine из Database, в одной транзакции:
+
+- пользовательские триггеры questions/answers на время загрузки выключаются:
+  построчные NOTIFY и пересчёт счётчиков на каждую пачку сделали бы загрузку
+  в разы дольше;
+- answer_count / last_answered_at и журнал изменений затем заполняются
+  по загруженным строкам одним INSERT/UPDATE ... SELECT каждый;
+- последовательности id сдвигаются за максимальный id.
+
+ALTER TABLE ... DISABLE TRIGGER берёт ACCESS EXCLUSIVE: на живой базе
+параллельные запросы к таблицам ждут конца загрузки.
+
+    python -m src.tools.seed --questions 1000000 --answers 10000000 \\
+        --distribution zipf --zipf-s 1.1
+"""
+
+import argparse
+import asyncio
+import bisect
+import itertools
+import logging
+import random
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core.config import load_config
+from src.core.logging import setup_logging
+from src.db.database import Database
+
+logger = logging.getLogger(__name__)
+
+WORDS = (
+    "как", "почему", "postgres", "индекс", "запрос", "fastapi", "транзакция",
+    "кэш", "пагинация", "ответ", "ошибка", "таймаут", "реплика", "миграция",
+    "пул", "соединение", "триггер", "курсор", "схема", "нагрузка",
+)  # fmt: skip
+# тексты берутся из заранее собранного пула: генерация строки на каждую
+# из 10M записей стоила бы больше самого COPY
+TEXT_POOL_SIZE = 4096
+QUESTION_COLUMNS = ("id", "text", "created_at")
+ANSWER_COLUMNS = ("id", "question_id", "user_id", "text", "created_at")
+
+
+def answer_counts(
+    questions: int,
+    answers: int,
+    distribution: str,
+    rng: random.Random,
+    zipf_s: float = 1.1,
+) -> list[int]:
+    """
+    Сколько ответов получит каждый из questions вопросов; сумма равна answers.
+
+    zipf: вес вопроса ранга k — 1 / k**zipf_s, ранги случайно перемешаны,
+    чтобы горячие вопросы не шли подряд по id.
+    """
+    if distribution == "uniform":
+        base, extra = divmod(answers, questions)
+        counts = [base] * questions
+        for index in rng.sample(range(questions), extra):
+            counts[index] += 1
+        return counts
+
+    ranks = list(range(1, questions + 1))
+    rng.shuffle(ranks)
+    cum_weights = list(itertools.accumulate(1 / rank**zipf_s for rank in ranks))
+    total = cum_weights[-1]
+    counts = [0] * questions
+    # по одному розыгрышу: список из 10M выбранных индексов не держим в памяти
+    for _ in range(answers):
+        counts[bisect.bisect(cum_weights, rng.random() * total)] += 1
+    return counts
+
+
+def _text_pool(rng: random.Random, min_words: int, max_words: int) -> list[str]:
+    return [
+        " ".join(rng.choices(WORDS, k=rng.randint(min_words, max_words)))
+        for _ in range(TEXT_POOL_SIZE)
+    ]
+
+
+def question_records(
+    first_id: int, questions: int, started: datetime, span: timedelta, rng
+) -> Iterator[tuple]:
+    texts = _text_pool(rng, 3, 12)
+    # время создания растёт с id, как у настоящих вставок
+    step = span / max(questions, 1)
+    for offset in range(questions):
+        yield first_id + offset, rng.choice(texts), started + step * offset
+
+
+def answer_records(
+    first_id: int,
+    first_question_id: int,
+    counts: list[int],
+    started: datetime,
+    span: timedelta,
+    users: int,
+    rng: random.Random,
+) -> Iterator[tuple]:
+    texts = _text_pool(rng, 5, 40)
+    user_ids = [f"user-{user}" for user in range(users)]
+    answer_id = first_id
+    question_step = span / max(len(counts), 1)
+    for offset, count in enumerate(counts):
+        question_created_at = started + question_step * offset
+        # ответы — между созданием вопроса и концом интервала
+        remaining = (started + span - question_created_at).total_seconds()
+        for created in sorted(rng.random() * remaining for _ in range(count)):
+            yield (
+                answer_id,
+                first_question_id + offset,
+                rng.choice(user_ids),
+                rng.choice(texts),
+                question_created_at + timedelta(seconds=created),
+            )
+            answer_id += 1
+
+
+async def _copy(
+    conn: AsyncConnection, table: str, columns: tuple, records, batch: int
+) -> int:
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    total = 0
+    started = time.perf_counter()
+    while chunk := list(itertools.islice(records, batch)):
+        await driver.copy_records_to_table(table, records=chunk, columns=columns)
+        total += len(chunk)
+        logger.info(
+            "%s: %d rows (%.0f rows/s)",
+            table,
+            total,
+            total / (time.perf_counter() - started),
+        )
+    return total
+
+
+async def _next_id(conn: AsyncConnection, table: str) -> int:
+    return await conn.scalar(text(f"SELECT coalesce(max(id), 0) + 1 FROM {table}"))
+
+
+async def seed(db: Database, args) -> None:
+    rng = random.Random(args.seed)
+    counts = answer_counts(
+        args.questions, args.answers, args.distribution, rng, zipf_s=args.zipf_s
+    )
+    span = timedelta(days=args.days)
+    started = datetime.now(UTC) - span
+
+    async with db.engine.begin() as conn:
+        for table in ("questions", "answers"):
+            await conn.execute(text(f"ALTER TABLE {table} DISABLE TRIGGER USER"))
+        first_question_id = await _next_id(conn, "questions")
+        first_answer_id = await _next_id(conn, "answers")
+
+        await _copy(
+            conn,
+            "questions",
+            QUESTION_COLUMNS,
+            question_records(first_question_id, args.questions, started, span, rng),
+            args.batch,
+        )
+        await _copy(
+            conn,
+            "answers",
+            ANSWER_COLUMNS,
+            answer_records(
+                first_answer_id,
+                first_question_id,
+                counts,
+                started,
+                span,
+                args.users,
+                rng,
+            ),
+            args.batch,
+        )
+
+        logger.info("Recomputing answer_count / last_answered_at")
+        await conn.execute(
+            text("""
+                UPDATE questions AS q
+                SET answer_count = a.answer_count,
+                    last_answered_at = a.last_answered_at
+                FROM (
+                    SELECT question_id,
+                           count(*) AS answer_count,
+                           max(created_at) AS last_answered_at
+                    FROM answers
+                    WHERE question_id >= :first_question_id
+                    GROUP BY question_id
+                ) AS a
+                WHERE q.id = a.question_id
+            """),
+            {"first_question_id": first_question_id},
+        )
+        if not args.skip_change_log:
+            logger.info("Writing change_log")
+            for entity, table, question_id, first_id in (
+                ("question", "questions", "id", first_question_id),
+                ("answer", "answers", "question_id", first_answer_id),
+            ):
+                await conn.execute(
+                    text(f"""
+                        INSERT INTO change_log
+                            (txid, entity, entity_id, question_id, op, changed_at)
+                        SELECT pg_current_xact_id()::text::bigint, '{entity}', id,
+                               {question_id}, 'insert', created_at
+                        FROM {table}
+                        WHERE id >= :first_id
+                        ORDER BY id
+                    """),
+                    {"first_id": first_id},
+                )
+        for table in ("questions", "answers"):
+            await conn.execute(
+                text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"(SELECT max(id) FROM {table}))"
+                )
+            )
+            await conn.execute(text(f"ALTER TABLE {table} ENABLE TRIGGER USER"))
+
+    # свежая статистика, иначе планировщик считает таблицы пустыми
+    async with db.engine.begin() as conn:
+        for table in ("questions", "answers", "change_log"):
+            await conn.execute(text(f"ANALYZE {table}"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--questions", type=int, default=100_000)
+    parser.add_argument("--answers", type=int, default=1_000_000)
+    parser.add_argument("--distribution", choices=("uniform", "zipf"), default="zipf")
+    parser.add_argument("--zipf-s", type=float, default=1.1)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--batch", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--skip-change-log", action="store_true")
+    parser.add_argument("--env", default=".env")
+    args = parser.parse_args()
+    if args.questions < 1 or args.answers < 0:
+        parser.error("--questions must be positive and --answers non-negative")
+
+    setup_logging()
+    db = Database(db_config=load_config(path=args.env).db, echo=False)
+
+    async def run() -> None:
+        started = time.perf_counter()
+        try:
+            await seed(db, args)
+        finally:
+            await db.dispose()
+        logger.info(
+            "Seeded %d questions and %d answers in %.1f s",
+            args.questions,
+            args.answers,
+            time.perf_counter() - started,
+        )
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import asdict, dataclass
+
+from src.schemas import QuestionSchema
+
+# Грубая оценка накладных расходов на запись (ключ, узел OrderedDict, кортеж)
+ENTRY_OVERHEAD_BYTES = 128
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+
+class LruTtlCache:
+    """
+    LRU-кэш сериализованных значений с TTL.
+
+    Ограничен и числом записей, и примерным объёмом в байтах: при переполнении
+    вытесняются самые давно использованные записи. Не потокобезопасен — рассчитан
+    на один event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+        on_remove: Callable[[Hashable], None] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._clock = clock
+        self._on_remove = on_remove
+        self._data: OrderedDict[Hashable, tuple[bytes, float]] = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable) -> bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at <= self._clock():
+            self._remove(key)
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: bytes) -> None:
+        size = len(value) + ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes:
+            # одна запись больше всего кэша — не кэшируем
+            if key in self._data:
+                self._remove(key)
+            return
+        if key in self._data:
+            self._remove(key)
+        self._data[key] = (value, self._clock() + self.ttl)
+        self._bytes += size
+        while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._data))
+            self._remove(oldest)
+            self._stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        if key in self._data:
+            self._remove(key)
+            self._stats.invalidations += 1
+
+    def stats(self) -> dict:
+        return {
+            **asdict(self._stats),
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        value, _ = self._data.pop(key)
+        self._bytes -= len(value) + ENTRY_OVERHEAD_BYTES
+        if self._on_remove is not None:
+            self._on_remove(key)
+
+
+class QuestionsCache:
+    """
+    Read-through кэш детальной карточки вопроса (QuestionSchema с ответами).
+
+    Хранит и отдаёт готовый JSON: модель валидируется только при записи,
+    попадание отправляется клиенту байтами без разбора.
+
+    Помнит, какие ответы лежат в закэшированных вопросах, чтобы удаление ответа
+    по answer_id инвалидировало нужный вопрос без лишнего запроса к БД.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float, **kwargs):
+        self._cache = LruTtlCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl=ttl,
+            on_remove=self._forget_answers,
+            **kwargs,
+        )
+        self._answers_by_question: dict[int, tuple[int, ...]] = {}
+        self._question_by_answer: dict[int, int] = {}
+        # растёт при каждой инвалидации: чтение, начатое до записи, не должно
+        # положить в кэш устаревшие данные после её коммита
+        self._generation = 0
+
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, question_id: int) -> bytes | None:
+        return self._cache.get(question_id)
+
+    def set(
+        self, question: QuestionSchema, generation: int, payload: bytes | None = None
+    ) -> None:
+        """payload — уже сериализованный question, если он есть у вызывающего."""
+        if generation != self._generation:
+            return
+        if payload is None:
+            payload = question.model_dump_json().encode()
+        self._cache.set(question.id, payload)
+        if question.id not in self._cache:
+            return
+        answer_ids = tuple(answer.id for answer in question.answers)
+        self._answers_by_question[question.id] = answer_ids
+        for answer_id in answer_ids:
+            self._question_by_answer[answer_id] = question.id
+
+    def invalidate_question(self, question_id: int) -> None:
+        self._generation += 1
+        self._cache.invalidate(question_id)
+
+    def invalidate_questions(self, question_ids: Iterable[int]) -> None:
+        for question_id in question_ids:
+            self.invalidate_question(question_id)
+
+    def invalidate_answer(self, answer_id: int) -> None:
+        self._generation += 1
+        question_id = self._question_by_answer.get(answer_id)
+        if question_id is not None:
+            self._cache.invalidate(question_id)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+    def _forget_answers(self, question_id: int) -> None:
+        for answer_id in self._answers_by_question.pop(question_id, ()):
+            self._question_by_answer.pop(answer_id, None)
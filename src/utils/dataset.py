@@ -0,0 +1,183 @@
+"""
+Кодирование набора вопросов и ответов в NDJSON/CSV и обратно, потоково.
+
+Запись набора — вопрос или ответ с полем type; id и question_id — из
+исходной базы. Порядок записей в файле не важен: при импорте ответы
+привязываются к вопросам после загрузки всего файла. В CSV одна таблица
+на оба типа, у вопроса question_id и user_id пустые.
+"""
+
+import csv
+import io
+from collections.abc import AsyncIterable, AsyncIterator
+from enum import StrEnum
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
+
+from src.core.domain_exceptions import DatasetImportException
+from src.schemas.dataset_schema import (
+    DatasetAnswerSchema,
+    DatasetQuestionSchema,
+    DatasetRecord,
+)
+from src.utils.streaming import FLUSH_BYTES
+
+CSV_COLUMNS = ("type", "id", "question_id", "user_id", "text", "created_at")
+# текст не длиннее 10 000 символов, так что запись больше мегабайта — это
+# не наш файл; без предела одна «строка» без переводов съела бы всю память
+MAX_RECORD_BYTES = 1024 * 1024
+
+_RECORD_ADAPTER = TypeAdapter(DatasetRecord)
+
+
+class DatasetFormat(StrEnum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+    @property
+    def media_type(self) -> str:
+        if self is DatasetFormat.ndjson:
+            return "application/x-ndjson"
+        return "text/csv"
+
+
+def _ndjson_line(row: tuple) -> bytes:
+    kind, record_id, question_id, user_id, text, created_at = row
+    record = {"type": kind, "id": record_id}
+    if kind == "answer":
+        record["question_id"] = question_id
+        record["user_id"] = user_id
+    record["text"] = text
+    record["created_at"] = created_at
+    return to_json(record) + b"\n"
+
+
+async def encode_dataset(
+    rows: AsyncIterable[tuple],
+    dataset_format: DatasetFormat,
+    flush_bytes: int = FLUSH_BYTES,
+) -> AsyncIterator[bytes]:
+    """Строки (type, id, question_id, user_id, text, created_at) в чанки файла."""
+    if dataset_format is DatasetFormat.ndjson:
+        buffer = bytearray()
+        async for row in rows:
+            buffer += _ndjson_line(row)
+            if len(buffer) >= flush_bytes:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+        return
+
+    text_buffer = io.StringIO()
+    writer = csv.writer(text_buffer)
+    writer.writerow(CSV_COLUMNS)
+    async for row in rows:
+        *values, created_at = row
+        writer.writerow((*values, created_at.isoformat()))
+        if text_buffer.tell() >= flush_bytes:
+            yield text_buffer.getvalue().encode()
+            text_buffer.seek(0)
+            text_buffer.truncate()
+    if text_buffer.tell():
+        yield text_buffer.getvalue().encode()
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    # режем по b"\n" до декодирования: в UTF-8 этот байт не встречается
+    # внутри многобайтных символов, а чанк может разрезать символ пополам
+    pending = b""
+    async for chunk in chunks:
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            yield line
+        if len(pending) > MAX_RECORD_BYTES:
+            raise DatasetImportException("Record is too long")
+    if pending:
+        yield pending
+
+
+async def _iter_csv_records(
+    lines: AsyncIterator[bytes],
+) -> AsyncIterator[tuple[int, bytes]]:
+    # поле в кавычках может содержать перевод строки: запись закончена,
+    # когда число кавычек чётное ("" внутри поля чётность не меняет)
+    line_number = 0
+    record = b""
+    start = 1
+    async for line in lines:
+        line_number += 1
+        if not record:
+            start = line_number
+        record = record + b"\n" + line if record else line
+        if len(record) > MAX_RECORD_BYTES:
+            raise DatasetImportException(f"Line {start}: record is too long")
+        if record.count(b'"') % 2 == 0:
+            yield start, record
+            record = b""
+    if record:
+        raise DatasetImportException(f"Line {start}: unterminated quoted field")
+
+
+def _validation_error(line_number: int, error: ValidationError):
+    first = error.errors()[0]
+    location = ".".join(str(part) for part in first["loc"])
+    return DatasetImportException(
+        f"Line {line_number}: {location}: {first['msg']}"
+        if location
+        else f"Line {line_number}: {first['msg']}"
+    )
+
+
+async def decode_dataset(
+    chunks: AsyncIterable[bytes], dataset_format: DatasetFormat
+) -> AsyncIterator[DatasetQuestionSchema | DatasetAnswerSchema]:
+    """
+    Записи файла по мере чтения чанков; память не зависит от размера файла.
+
+    Ошибка формата или валидации — DatasetImportException с номером строки.
+    """
+    lines = _iter_lines(chunks)
+    if dataset_format is DatasetFormat.ndjson:
+        line_number = 0
+        async for line in lines:
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                yield _RECORD_ADAPTER.validate_json(line)
+            except ValidationError as e:
+                raise _validation_error(line_number, e) from e
+        return
+
+    header_seen = False
+    async for line_number, record in _iter_csv_records(lines):
+        try:
+            text = record.decode().rstrip("\r")
+        except UnicodeDecodeError as e:
+            raise DatasetImportException(f"Line {line_number}: not UTF-8") from e
+        if not text:
+            continue
+        values = next(csv.reader([text]))
+        if not header_seen:
+            if tuple(values) != CSV_COLUMNS:
+                raise DatasetImportException(
+                    f"Line {line_number}: expected header {','.join(CSV_COLUMNS)}"
+                )
+            header_seen = True
+            continue
+        if len(values) != len(CSV_COLUMNS):
+            raise DatasetImportException(
+                f"Line {line_number}: expected {len(CSV_COLUMNS)} columns"
+            )
+        # пустые ячейки — отсутствующие поля (question_id/user_id у вопроса)
+        fields = {
+            column: value
+            for column, value in zip(CSV_COLUMNS, values, strict=True)
+            if value != ""
+        }
+        try:
+            yield _RECORD_ADAPTER.validate_python(fields)
+        except ValidationError as e:
+            raise _validation_error(line_number, e) from e
@@ -0,0 +1,53 @@
+import base64
+import json
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+
+from src.core.domain_exceptions import InvalidCursorException
+
+T = TypeVar("T")
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Unsupported cursor value: {value!r}")
+
+
+def encode_cursor(*values: Any) -> str:
+    """Упаковывает значения ключа сортировки в непрозрачную строку для клиента."""
+    raw = json.dumps(values, default=_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> tuple:
+    """
+    Распаковывает курсор, приводя каждое значение к ожидаемому типу.
+
+    Пустые значения (None) пропускаются без приведения.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor arity mismatch")
+        return tuple(
+            None if value is None else cast(value)
+            for cast, value in zip(types, values, strict=True)
+        )
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorException() from e
+
+
+def page_from_rows(
+    rows: Sequence[T], limit: int, key: Callable[[T], tuple]
+) -> tuple[list[T], str | None]:
+    """
+    Отрезает лишнюю строку (репозиторий запрашивается с limit + 1) и строит
+    курсор на следующую страницу, если она есть.
+    """
+    items = list(rows[:limit])
+    if len(rows) <= limit or not items:
+        return items, None
+    return items, encode_cursor(*key(items[-1]))
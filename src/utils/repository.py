@@ -1,10 +1,45 @@
 from abc import ABC, abstractmethod
+from datetime import timedelta
 
-from sqlalchemy import delete, select
+from sqlalchemy import (
+    Integer,
+    any_,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    null,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 
+from src.core.metrics import observe_repository_call
+from src.db import dataset_queries, json_queries
 from src.db.db_exceptions import map_integrity_error
+from src.db.models.search_vector import search_config
+from src.schemas.question_schema import QuestionSort
+from src.schemas.search_schema import SearchHitSchema, SearchSource
+from src.utils.serialization import construct_trusted
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20"
+# номер старейшей транзакции, ещё не завершённой на момент снимка
+SNAPSHOT_XMIN = literal_column("pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+
+
+def html_escaped(text):
+    """
+    Экранирует &, < и > в SQL: сниппет ts_headline — HTML, где текст
+    пользователя стоит рядом с нашими <mark>, и его разметка не должна
+    исполниться у клиента.
+    """
+    for char, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")):
+        text = func.replace(text, char, entity)
+    return text
 
 
 class AbstractRepository(ABC):
@@ -12,6 +47,10 @@ class AbstractRepository(ABC):
     async def add_one(self, data: dict) -> int:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_many(self, data: list[dict]) -> list[int]:
+        raise NotImplementedError
+
     @abstractmethod
     async def del_one(self, object_id: int) -> int:
         raise NotImplementedError
@@ -20,6 +59,14 @@ class AbstractRepository(ABC):
     async def find_one(self, object_id: int):
         raise NotImplementedError
 
+    @abstractmethod
+    async def exists(self, object_id: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def existing_ids(self, object_ids: set[int]) -> set[int]:
+        raise NotImplementedError
+
     @abstractmethod
     async def find_all(self):
         raise NotImplementedError
@@ -41,6 +88,7 @@ class SqlAlchemyRepository(AbstractRepository):
         return ()
 
     # методы
+    @observe_repository_call
     async def add_one(self, data: dict) -> int:
         try:
             obj = self.model(**data)
@@ -50,12 +98,30 @@ class SqlAlchemyRepository(AbstractRepository):
         except IntegrityError as e:
             raise map_integrity_error(e) from e
 
+    @observe_repository_call
+    async def add_many(self, data: list[dict]) -> list[int]:
+        """
+        Вставляет строки одним многострочным INSERT ... RETURNING id.
+
+        Идентификаторы возвращаются в порядке входных строк.
+        """
+        if not data:
+            return []
+        stmt = insert(self.model).returning(self.model.id, sort_by_parameter_order=True)
+        try:
+            res = await self.session.scalars(stmt, data)
+            return list(res.all())
+        except IntegrityError as e:
+            raise map_integrity_error(e) from e
+
+    @observe_repository_call
     async def del_one(self, object_id: int) -> bool:
         stmt = delete(self.model).where(self.model.id == object_id)
         result = await self.session.execute(stmt)
         deleted = result.rowcount or 0
         return deleted > 0
 
+    @observe_repository_call
     async def find_one(self, object_id: int):
         stmt = (
             select(self.model)
@@ -67,13 +133,261 @@ class SqlAlchemyRepository(AbstractRepository):
             return res
         return res.to_read_model()
 
+    @observe_repository_call
+    async def exists(self, object_id: int) -> bool:
+        stmt = select(exists().where(self.model.id == object_id))
+        return bool(await self.session.scalar(stmt))
+
+    @observe_repository_call
+    async def existing_ids(self, object_ids: set[int]) -> set[int]:
+        if not object_ids:
+            return set()
+        stmt = select(self.model.id).where(self.model.id.in_(object_ids))
+        res = await self.session.scalars(stmt)
+        return set(res.all())
+
+    @observe_repository_call
     async def find_all(self):
         stmt = select(self.model).options(*self._get_find_all_options)
         res = await self.session.execute(stmt)
         return [row[0].to_read_model() for row in res.all()]
 
 
-class SqlAlchemyQuestionsRepository(SqlAlchemyRepository):
+class SearchableRepository:
+    """
+    Полнотекстовый поиск для репозиториев, у модели которых есть search_vector.
+
+    Примесь к SqlAlchemyRepository: используется только вопросами и ответами.
+    """
+
+    @observe_repository_call
+    async def search(
+        self,
+        query: str,
+        limit: int,
+        after: tuple[float, str, int] | None = None,
+        highlight: bool = False,
+    ) -> list[SearchHitSchema]:
+        """
+        Полнотекстовый поиск по search_vector (GIN-индекс).
+
+        Порядок — (rank DESC, source DESC, id DESC), где source — имя таблицы:
+        так страницы разных репозиториев можно слить в одну выдачу, а after
+        работает как keyset-курсор общей выдачи. rank нормирован в [0, 1).
+        """
+        source = self.model.__tablename__
+        tsquery = func.websearch_to_tsquery(search_config(), query)
+        # нормировка 32: rank / (rank + 1), сравнимо между таблицами
+        rank = func.ts_rank(self.model.search_vector, tsquery, 32)
+        # у ответа — его вопрос, у вопроса — он сам
+        question_id = getattr(self.model, "question_id", self.model.id)
+        # текст экранируется до ts_headline: в сниппете сырыми остаются
+        # только <mark> и </mark>
+        snippet = (
+            func.ts_headline(
+                search_config(),
+                html_escaped(self.model.text),
+                tsquery,
+                HEADLINE_OPTIONS,
+            )
+            if highlight
+            else null()
+        )
+        stmt = (
+            select(
+                self.model.id,
+                question_id,
+                self.model.text,
+                self.model.created_at,
+                rank,
+                snippet,
+            )
+            .where(self.model.search_vector.bool_op("@@")(tsquery))
+            .order_by(rank.desc(), self.model.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(rank, literal(source), self.model.id) < tuple_(*after)
+            )
+        res = await self.session.execute(stmt)
+        return [
+            construct_trusted(
+                SearchHitSchema,
+                source=SearchSource(source),
+                id=row[0],
+                question_id=row[1],
+                text=row[2],
+                created_at=row[3],
+                rank=row[4],
+                snippet=row[5],
+            )
+            for row in res.all()
+        ]
+
+
+class PageableRepository:
+    """
+    Keyset-страницы и потоковое чтение всей таблицы.
+
+    Примесь к SqlAlchemyRepository для моделей с created_at и to_read_model.
+    """
+
+    @property
+    def _get_find_page_options(self) -> tuple:
+        return ()
+
+    def _get_sort_key(self, sort=None) -> tuple:
+        """Колонки keyset-ключа страницы; все сортируются по убыванию."""
+        return (self.model.created_at, self.model.id)
+
+    async def stream_all(self, chunk_size: int = 500):
+        """
+        Отдаёт все строки по одной через серверный курсор.
+
+        Строки читаются пачками по chunk_size (yield_per), поэтому память не
+        растёт вместе с таблицей. Работает только внутри открытой транзакции.
+        """
+        stmt = (
+            select(self.model)
+            .options(*self._get_find_all_options)
+            .order_by(self.model.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        res = await self.session.stream_scalars(stmt)
+        async for row in res:
+            yield row.to_read_model()
+
+    @observe_repository_call
+    async def find_page(
+        self, limit: int, after: tuple | None = None, sort=None, **filter_by
+    ):
+        """
+        Keyset-страница в порядке ключа _get_sort_key(sort), по убыванию;
+        по умолчанию (created_at DESC, id DESC).
+
+        after — ключ последней строки предыдущей страницы; стоимость запроса
+        не зависит от того, насколько глубоко листает клиент.
+        """
+        sort_key = self._get_sort_key(sort)
+        stmt = (
+            select(self.model)
+            .options(*self._get_find_page_options)
+            .filter_by(**filter_by)
+            .order_by(*(column.desc() for column in sort_key))
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(*sort_key) < after)
+        res = await self.session.scalars(stmt)
+        return [row.to_read_model() for row in res.all()]
+
+
+class SqlAlchemyAnswersRepository(
+    SearchableRepository, PageableRepository, SqlAlchemyRepository
+):
+    @observe_repository_call
+    async def find_many(self, object_ids: list[int]) -> list:
+        """
+        Ответы по списку id одним запросом (WHERE id = ANY(:ids)).
+
+        Массив — один параметр: у запроса один план на любое число id.
+        Отсутствующие id пропускаются, порядок строк не гарантирован.
+        """
+        if not object_ids:
+            return []
+        stmt = select(self.model).where(
+            self.model.id == any_(literal(object_ids, ARRAY(Integer)))
+        )
+        res = await self.session.scalars(stmt)
+        return [row.to_read_model() for row in res.all()]
+
+    @observe_repository_call
+    async def find_user_page(
+        self, user_id: str, limit: int, after: tuple | None = None
+    ) -> list:
+        """
+        Ответы пользователя, новые первыми; keyset по (created_at, id).
+
+        Читает индекс ix_answers_user_id_created_at_id, не трогая таблицу
+        сверх limit строк.
+        """
+        return await self.find_page(limit, after=after, user_id=user_id)
+
+
+class SqlAlchemyChangesRepository(SqlAlchemyRepository):
+    @observe_repository_call
+    async def find_since(self, limit: int, after: tuple | None = None) -> list[tuple]:
+        """
+        Записи журнала после ключа after в порядке (txid, id): (txid, id, модель).
+
+        Идентификаторы раздаются до коммита, поэтому запись транзакции,
+        которая ещё идёт, может закоммититься позже записи с большим ключом.
+        Отдаём только транзакции младше xmin снимка — все они уже завершены,
+        и новые записи с меньшим ключом после этого не появятся. Долгая
+        транзакция придерживает ленту, но не даёт клиенту пропустить изменение.
+        """
+        stmt = (
+            select(self.model)
+            .where(self.model.txid < SNAPSHOT_XMIN)
+            .order_by(self.model.txid, self.model.id)
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(self.model.txid, self.model.id) > after)
+        res = await self.session.scalars(stmt)
+        return [(row.txid, row.id, row.to_read_model()) for row in res.all()]
+
+
+class SqlAlchemyIdempotencyRepository(SqlAlchemyRepository):
+    @observe_repository_call
+    async def find_key(self, scope: str, key: str):
+        stmt = select(self.model).where(
+            self.model.scope == scope, self.model.key == key
+        )
+        res = await self.session.scalar(stmt)
+        if not res:
+            return res
+        return res.to_read_model()
+
+    @observe_repository_call
+    async def save_key(self, scope: str, key: str, record) -> None:
+        """
+        Сохраняет ответ под ключом в текущей транзакции.
+
+        Если ключ уже занят параллельным запросом, INSERT ждёт его коммита
+        и получает UniqueConstraintViolation.
+        """
+        stmt = insert(self.model).values(scope=scope, key=key, **record.model_dump())
+        try:
+            await self.session.execute(stmt)
+        except IntegrityError as e:
+            raise map_integrity_error(e) from e
+
+    @observe_repository_call
+    async def purge_expired(self, ttl: timedelta, limit: int) -> int:
+        """
+        Удаляет до limit ключей старше ttl; возвращает число удалённых.
+
+        Возраст считается по часам БД. Строки, которые уже удаляет другой
+        процесс, пропускаются (SKIP LOCKED), а не ждут его коммита.
+        """
+        expired = (
+            select(self.model.scope, self.model.key)
+            .where(self.model.created_at < func.now() - ttl)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(self.model).where(
+            tuple_(self.model.scope, self.model.key).in_(expired)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
+
+
+class SqlAlchemyQuestionsRepository(
+    SearchableRepository, PageableRepository, SqlAlchemyRepository
+):
     @property
     def _get_find_one_options(self) -> tuple:
         return (selectinload(self.model.answers),)
@@ -81,3 +395,114 @@ class SqlAlchemyQuestionsRepository(SqlAlchemyRepository):
     @property
     def _get_find_all_options(self) -> tuple:
         return (selectinload(self.model.answers),)
+
+    @property
+    def _get_find_page_options(self) -> tuple:
+        return (selectinload(self.model.answers),)
+
+    def _get_sort_key(self, sort: QuestionSort | None = None) -> tuple:
+        # под каждый ключ есть индекс, см. question_model
+        if sort is QuestionSort.answers:
+            return (self.model.answer_count, self.model.id)
+        if sort is QuestionSort.activity:
+            return (self.model.last_activity_at, self.model.id)
+        return super()._get_sort_key(sort)
+
+    @observe_repository_call
+    async def find_one_summary(self, object_id: int):
+        """Вопрос без ответов: ответы читаются отдельно, постранично."""
+        stmt = (
+            select(self.model)
+            .options(noload(self.model.answers))
+            .where(self.model.id == object_id)
+        )
+        res = await self.session.scalar(stmt)
+        if not res:
+            return res
+        return res.to_summary_model()
+
+    @observe_repository_call
+    async def find_one_json(self, object_id: int) -> str | None:
+        """Вопрос с ответами одним запросом; JSON собирает Postgres."""
+        return await self.session.scalar(json_queries.question_json_by_id(object_id))
+
+    @observe_repository_call
+    async def find_page_json(
+        self, limit: int, after: tuple | None = None, sort: QuestionSort | None = None
+    ) -> list[tuple]:
+        """Как find_page, но вместо моделей — (*ключ сортировки, json) на вопрос."""
+        res = await self.session.execute(
+            json_queries.questions_json_page(limit, after, self._get_sort_key(sort))
+        )
+        return [tuple(row) for row in res.all()]
+
+    async def stream_dataset(self, chunk_size: int = 5000):
+        """
+        Весь набор для выгрузки: (type, id, question_id, user_id, text, created_at).
+
+        Серверный курсор и yield_per, как в stream_all; работает только
+        внутри открытой транзакции.
+        """
+        stmt = dataset_queries.dataset_export().execution_options(yield_per=chunk_size)
+        res = await self.session.stream(stmt)
+        async for row in res:
+            yield tuple(row)
+
+    @observe_repository_call
+    async def stage_import(self) -> None:
+        """
+        Создаёт временные таблицы загрузки; они живут до конца транзакции.
+
+        Заодно помечает транзакцию как массовую загрузку: импортированные
+        ответы не рассылаются SSE-подписчикам по одному NOTIFY на строку.
+        """
+        await self.session.execute(dataset_queries.MARK_BULK_LOAD)
+        for stmt in dataset_queries.CREATE_STAGING:
+            await self.session.execute(stmt)
+
+    @observe_repository_call
+    async def copy_import_rows(
+        self, questions: list[tuple], answers: list[tuple]
+    ) -> None:
+        """
+        Копирует пачку строк во временные таблицы через COPY.
+
+        questions — (id, text, created_at), answers — (id, question_id,
+        user_id, text, created_at) с id из файла. COPY идёт по соединению
+        сессии, то есть в той же транзакции.
+        """
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        for table, columns, records in (
+            (
+                dataset_queries.STAGING_QUESTIONS,
+                dataset_queries.STAGING_QUESTION_COLUMNS,
+                questions,
+            ),
+            (
+                dataset_queries.STAGING_ANSWERS,
+                dataset_queries.STAGING_ANSWER_COLUMNS,
+                answers,
+            ),
+        ):
+            if records:
+                await raw.driver_connection.copy_records_to_table(
+                    table, records=records, columns=columns
+                )
+
+    @observe_repository_call
+    async def apply_import(self) -> tuple[int, int]:
+        """
+        Переносит загруженное в questions/answers; возвращает число вставленных.
+
+        Ответы, чей вопрос не попал в набор, не вставляются. Повтор id
+        вопроса в наборе — UniqueConstraintViolation.
+        """
+        try:
+            for stmt in dataset_queries.ALLOCATE_QUESTION_IDS:
+                await self.session.execute(stmt)
+        except IntegrityError as e:
+            raise map_integrity_error(e) from e
+        questions = await self.session.execute(dataset_queries.INSERT_QUESTIONS)
+        answers = await self.session.execute(dataset_queries.INSERT_ANSWERS)
+        return questions.rowcount, answers.rowcount
@@ -0,0 +1,82 @@
+from typing import Any, TypeVar
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from src.schemas import AnswerSchema, QuestionSchema
+from src.schemas.change_schema import ChangesPageSchema
+from src.schemas.pagination_schema import PageSchema
+from src.schemas.search_schema import SearchHitSchema
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# порядок полей схемы: кортеж строится один раз на класс
+_FIELD_ORDER: dict[type[BaseModel], tuple[str, ...]] = {}
+
+
+def construct_trusted(model_cls: type[ModelT], **values: Any) -> ModelT:
+    """
+    Собирает модель из заведомо корректных данных без валидации.
+
+    То же, что model_construct, но без его питоновского обхода полей
+    (дефолты, алиасы, private-атрибуты), который на наших схемах оказывается
+    дороже самой валидации. Годится только для схем без алиасов
+    и private-атрибутов. values должны содержать все поля схемы в порядке
+    объявления, включая поля с дефолтами: в этом порядке модель
+    и сериализуется. Иначе — TypeError, а не молча сломанный экземпляр.
+    """
+    fields = _FIELD_ORDER.get(model_cls)
+    if fields is None:
+        fields = _FIELD_ORDER[model_cls] = tuple(model_cls.model_fields)
+    if tuple(values) != fields:
+        raise TypeError(
+            f"construct_trusted({model_cls.__name__}) needs fields {fields} "
+            f"in this order, got {tuple(values)}"
+        )
+    instance = model_cls.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+# Адаптеры собираются один раз при импорте, а не на каждый запрос
+QUESTIONS_ADAPTER = TypeAdapter(list[QuestionSchema])
+QUESTIONS_PAGE_ADAPTER = TypeAdapter(PageSchema[QuestionSchema])
+ANSWERS_PAGE_ADAPTER = TypeAdapter(PageSchema[AnswerSchema])
+SEARCH_PAGE_ADAPTER = TypeAdapter(PageSchema[SearchHitSchema])
+CHANGES_PAGE_ADAPTER = TypeAdapter(ChangesPageSchema)
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON-ответ, который pydantic-core сериализует сразу в байты.
+
+    Модели пишутся своим скомпилированным сериализатором, списки и скаляры —
+    тем же to_json, без jsonable_encoder и промежуточного dict. Готовые байты
+    (например, от TypeAdapter.dump_json) отдаются как есть.
+
+    Эндпоинт, вернувший такой ответ, минует повторную валидацию
+    response_model в FastAPI; схема в OpenAPI по-прежнему берётся из
+    response_model (FastAPI строит её для подклассов JSONResponse), поэтому
+    возвращать нужно доверенное значение этой схемы.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
+
+
+def json_response(
+    adapter: TypeAdapter,
+    value: Any,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> PydanticJSONResponse:
+    """Сериализует доверенное значение по предкомпилированному адаптеру."""
+    return PydanticJSONResponse(
+        adapter.dump_json(value), status_code=status_code, headers=headers
+    )
@@ -0,0 +1,113 @@
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from enum import StrEnum
+
+import anyio
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from starlette.types import Send
+
+# Сколько байт копим перед отправкой чанка: меньше мелких записей в сокет,
+# но память всё равно ограничена одним буфером.
+FLUSH_BYTES = 64 * 1024
+
+
+class StreamFormat(StrEnum):
+    ndjson = "ndjson"
+    json = "json"
+
+    @property
+    def media_type(self) -> str:
+        if self is StreamFormat.ndjson:
+            return "application/x-ndjson"
+        return "application/json"
+
+
+async def iter_ndjson(
+    items: AsyncIterator[BaseModel], flush_bytes: int = FLUSH_BYTES
+) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    # первый чанк уходит сразу после первой строки: клиент получает первый
+    # байт, не дожидаясь, пока медленный курсор наберёт полный буфер
+    threshold = 1
+    async with aclosing(items):
+        async for item in items:
+            buffer += item.model_dump_json().encode()
+            buffer += b"\n"
+            if len(buffer) >= threshold:
+                yield bytes(buffer)
+                buffer.clear()
+                threshold = flush_bytes
+    if buffer:
+        yield bytes(buffer)
+
+
+async def iter_json_array(
+    items: AsyncIterator[BaseModel], flush_bytes: int = FLUSH_BYTES
+) -> AsyncIterator[bytes]:
+    buffer = bytearray(b"[")
+    first = True
+    threshold = 1
+    async with aclosing(items):
+        async for item in items:
+            if not first:
+                buffer += b","
+            first = False
+            buffer += item.model_dump_json().encode()
+            if len(buffer) >= threshold:
+                yield bytes(buffer)
+                buffer.clear()
+                threshold = flush_bytes
+    buffer += b"]"
+    yield bytes(buffer)
+
+
+def encode_stream(
+    items: AsyncIterator[BaseModel], stream_format: StreamFormat
+) -> AsyncIterator[bytes]:
+    """
+    Кодирует модели в чанки; закрытие результата закрывает и items
+    (вместе с их сессией и серверным курсором).
+    """
+    if stream_format is StreamFormat.ndjson:
+        return iter_ndjson(items)
+    return iter_json_array(items)
+
+
+async def start_stream(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Забирает первый чанк до отправки заголовков.
+
+    Ошибки открытия курсора (БД недоступна и т.п.) всплывают ещё в эндпоинте
+    и обрабатываются обычными exception handler'ами, а не обрывают поток 200.
+    Закрытие возвращённого итератора закрывает и chunks.
+    """
+    first = await anext(chunks, None)
+
+    async def _chained() -> AsyncIterator[bytes]:
+        try:
+            if first is not None:
+                yield first
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    return _chained()
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse, который закрывает тело, даже если клиент ушёл.
+
+    Starlette при обрыве соединения просто перестаёт читать итератор:
+    генератор с открытой сессией и серверным курсором висел бы до сборки
+    мусора. Закрытие экранировано от отмены, иначе оно само бы прервалось.
+    """
+
+    async def stream_response(self, send: Send) -> None:
+        try:
+            await super().stream_response(send)
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self.body_iterator.aclose()
@@ -1,14 +1,22 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.core.metrics import UOW_TRANSACTIONS
 from src.db.repositories.answers_rep import AnswersRepository
+from src.db.repositories.changes_rep import ChangesRepository
+from src.db.repositories.idempotency_rep import IdempotencyRepository
 from src.db.repositories.questions_rep import QuestionsRepository
 
 
 class IUnitOfWork(ABC):
     answers_repo: AnswersRepository
     questions_repo: QuestionsRepository
+    changes_repo: ChangesRepository
+    idempotency_repo: IdempotencyRepository
 
     @abstractmethod
     async def __aenter__(self) -> "IUnitOfWork": ...
@@ -22,29 +30,37 @@ class IUnitOfWork(ABC):
     @abstractmethod
     async def rollback(self): ...
 
+    @abstractmethod
+    def after_commit(self, callback: Callable[[], None]) -> None: ...
+
 
 class UnitOfWork(IUnitOfWork):
     def __init__(self, async_session_maker):
         self.session_factory = async_session_maker
         self.session: AsyncSession | None = None
+        self._after_commit: list[Callable[[], None]] = []
 
         self.answers_repo: AnswersRepository | None = None
         self.questions_repo: QuestionsRepository | None = None
+        self.changes_repo: ChangesRepository | None = None
+        self.idempotency_repo: IdempotencyRepository | None = None
 
     async def __aenter__(self) -> "IUnitOfWork":
         self.session = self.session_factory()
         # создаём репозитории на этой сессии
         self.answers_repo = AnswersRepository(self.session)
         self.questions_repo = QuestionsRepository(self.session)
+        self.changes_repo = ChangesRepository(self.session)
+        self.idempotency_repo = IdempotencyRepository(self.session)
 
         return self
 
     async def __aexit__(self, exc_type: type | None, exc, tb) -> bool | None:
         try:
             if exc:
-                await self.session.rollback()
+                await self.rollback()
             else:
-                await self.session.commit()
+                await self.commit()
         finally:
             await self.session.close()
         # не подавляем исключения
@@ -52,6 +68,94 @@ class UnitOfWork(IUnitOfWork):
 
     async def commit(self):
         await self.session.commit()
+        UOW_TRANSACTIONS.inc("commit")
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
 
     async def rollback(self):
         await self.session.rollback()
+        UOW_TRANSACTIONS.inc("rollback")
+        self._after_commit.clear()
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Регистрирует действие, которое выполнится только после успешного коммита."""
+        self._after_commit.append(callback)
+
+
+class ReadOnlyUnitOfWork(UnitOfWork):
+    """
+    UoW для чтения: транзакция открывается как READ ONLY, без flush и COMMIT.
+
+    На выходе сессия просто закрывается, а пул при возврате соединения
+    завершает транзакцию ROLLBACK (reset_on_return по умолчанию). Это тот же
+    один round trip, что и COMMIT: выигрыш не в числе запросов, а в том, что
+    на этом пути нет flush и транзакция не может ничего записать.
+    Опционально ограничивает время запросов (SET LOCAL statement_timeout),
+    что стоит одного дополнительного запроса.
+
+    С fallback соединение берётся сразу на входе: если источник (реплика)
+    недоступен, fallback получает его session_maker и возвращает тот, на
+    котором повторить попытку (primary). Битое соединение из пула так
+    замечается только с pool_pre_ping.
+    """
+
+    def __init__(
+        self,
+        async_session_maker,
+        statement_timeout_ms: int | None = None,
+        fallback: Callable[[async_sessionmaker], async_sessionmaker] | None = None,
+    ):
+        super().__init__(async_session_maker)
+        self.statement_timeout_ms = statement_timeout_ms
+        self._fallback = fallback
+
+    async def __aenter__(self) -> "IUnitOfWork":
+        await super().__aenter__()
+        if self._fallback is not None:
+            try:
+                await self.session.connection()
+            except (DBAPIError, OSError, TimeoutError):
+                await self.session.close()
+                self.session_factory = self._fallback(self.session_factory)
+                await super().__aenter__()
+        if self.statement_timeout_ms is not None:
+            await self.session.execute(
+                select(
+                    func.set_config(
+                        "statement_timeout", str(self.statement_timeout_ms), True
+                    )
+                )
+            )
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc, tb) -> bool | None:
+        await self.session.close()
+        return False
+
+    async def commit(self):
+        raise RuntimeError("ReadOnlyUnitOfWork cannot commit")
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        raise RuntimeError("ReadOnlyUnitOfWork cannot commit")
+
+
+def primary_uow_factory(
+    session_maker, read_session_maker=None
+) -> Callable[..., IUnitOfWork]:
+    """
+    Фабрика UoW для работы вне HTTP-запроса (фоновые задачи, пакетная запись).
+
+    Всё идёт на primary: у фоновой задачи нет клиента, которому нужна
+    маршрутизация чтения по репликам. prefer_primary=True отправляет чтение
+    на session_maker, даже если задан read_session_maker.
+    """
+
+    def _factory(read_only: bool = False, prefer_primary: bool = False) -> IUnitOfWork:
+        if read_only:
+            if prefer_primary:
+                return ReadOnlyUnitOfWork(session_maker)
+            return ReadOnlyUnitOfWork(read_session_maker or session_maker)
+        return UnitOfWork(session_maker)
+
+    return _factory
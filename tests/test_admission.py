@@ -0,0 +1,109 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.admission import (
+    AdmissionController,
+    AdmissionMiddleware,
+    ConcurrencyLimiter,
+)
+from src.core.config import AdmissionConfig
+from src.core.metrics import ADMISSION_QUEUED, ADMISSION_REJECTED
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_then_admits_after_release():
+    limiter = ConcurrencyLimiter("test", limit=1, max_wait=1.0, max_queue=1)
+    assert await limiter.acquire() is None
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.waiting == 1
+    # очередь заполнена: следующий отказ сразу, без ожидания
+    assert await limiter.acquire() == "queue_full"
+
+    limiter.release()
+    assert await waiter is None
+    assert limiter.stats() == {"limit": 1, "active": 1, "waiting": 0, "max_queue": 1}
+
+
+@pytest.mark.asyncio
+async def test_limiter_rejects_after_max_wait():
+    limiter = ConcurrencyLimiter("test", limit=1, max_wait=0.01, max_queue=10)
+    await limiter.acquire()
+
+    assert await limiter.acquire() == "timeout"
+    assert limiter.waiting == 0
+    assert limiter.active == 1
+
+
+@pytest.fixture
+def admission(app):
+    app.state.admission = AdmissionController(
+        AdmissionConfig(
+            enabled=True, read_limit=1, write_limit=1, max_wait_ms=10, retry_after=3
+        )
+    )
+    return app.state.admission
+
+
+@pytest.mark.asyncio
+async def test_saturated_reads_are_shed_with_retry_after(
+    client, admission, questions_repo
+):
+    async def _add_one(data):
+        return 1
+
+    questions_repo._add_one = _add_one
+    # единственный слот чтения занят «зависшим» запросом
+    await admission.limiters["read"].acquire()
+    queued = ADMISSION_QUEUED.value("read")
+    rejected = ADMISSION_REJECTED.value("read", "timeout")
+
+    r = await client.get("/api/v1/questions/1")
+    assert r.status_code == 503
+    assert r.headers["retry-after"] == "3"
+    assert r.json() == {"detail": "Server is overloaded"}
+    assert ADMISSION_QUEUED.value("read") == queued + 1
+    assert ADMISSION_REJECTED.value("read", "timeout") == rejected + 1
+
+    # записи ограничены отдельно, health — не ограничен вовсе
+    r = await client.post("/api/v1/questions", json={"text": "q"})
+    assert r.status_code == 201
+    r = await client.get("/api/health/admission")
+    assert r.status_code == 200
+    assert r.json()["read"]["active"] == 1
+    assert r.json()["write"]["active"] == 0
+
+
+@pytest.mark.asyncio
+async def test_event_stream_releases_slot_after_headers(admission):
+    limiter = admission.limiters["read"]
+    active_during_stream = []
+
+    async def sse_app(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"text/event-stream")],
+            }
+        )
+        active_during_stream.append(limiter.active)
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        pass
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/questions/1/answers/stream",
+        "headers": [],
+        "app": SimpleNamespace(state=SimpleNamespace(admission=admission)),
+    }
+    await AdmissionMiddleware(sse_app)(scope, None, send)
+
+    assert active_during_stream == [0]
+    assert limiter.active == 0
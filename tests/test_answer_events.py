@@ -0,0 +1,240 @@
+import asyncio
+from datetime import UTC, datetime
+
+import asyncpg
+import pytest
+import pytest_asyncio
+
+from src.db.triggers import ANSWERS_CHANNEL
+from src.schemas import AnswerSchema
+from src.schemas.answers_schema import AnswerCreateSchema
+from src.schemas.question_schema import QuestionCreateSchema
+from src.services.answer_events import AnswerEventHub, iter_answer_events
+from src.services.answers_service import AnswersService
+from src.services.questions_service import QuestionsService
+
+
+class FakeListenConnection:
+    def __init__(self):
+        self.listeners = {}
+        self.termination_listeners = []
+        self.closed = False
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def execute(self, query):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+    def notify(self, answer_id: int, question_id: int):
+        payload = f'{{"id": {answer_id}, "question_id": {question_id}}}'
+        self.listeners[ANSWERS_CHANNEL](self, 1, ANSWERS_CHANNEL, payload)
+
+    def terminate(self):
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+
+async def until(condition, attempts=100):
+    for _ in range(attempts):
+        if condition():
+            return
+        await asyncio.sleep(0)
+    raise AssertionError("condition not reached")
+
+
+@pytest.fixture
+def loaded_answers(answers_repo):
+    """Запросы find_many: по списку id на каждый."""
+    loaded = []
+
+    async def _find_many(answer_ids):
+        loaded.append(answer_ids)
+        return [
+            AnswerSchema(
+                id=answer_id,
+                question_id=1,
+                user_id="u",
+                text=f"ответ {answer_id}",
+                created_at=datetime(2026, 1, 1, tzinfo=UTC),
+            )
+            for answer_id in answer_ids
+        ]
+
+    answers_repo._find_many = _find_many
+    return loaded
+
+
+@pytest.fixture
+def connections():
+    return []
+
+
+@pytest_asyncio.fixture
+async def hub(uow_factory, connections):
+    async def connect():
+        connection = FakeListenConnection()
+        connections.append(connection)
+        return connection
+
+    hub = AnswerEventHub(
+        connect,
+        AnswersService(uow_factory=uow_factory),
+        buffer_size=2,
+        reconnect_delay=0,
+    )
+    hub.start()
+    await until(lambda: connections and connections[-1].listeners)
+    yield hub
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_hub_fans_out_to_question_subscribers(hub, connections, loaded_answers):
+    with (
+        hub.subscribe(1) as first,
+        hub.subscribe(1) as second,
+        hub.subscribe(2) as other,
+    ):
+        connections[-1].notify(answer_id=10, question_id=1)
+        # вопрос без подписчиков: ответ даже не читается из БД
+        connections[-1].notify(answer_id=11, question_id=3)
+        await until(lambda: not first.queue.empty())
+
+        assert first.queue.get_nowait().id == 10
+        assert second.queue.get_nowait().id == 10
+        assert other.queue.empty()
+        assert loaded_answers == [[10]]
+    assert hub.subscriber_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_hub_disconnects_slow_subscriber(hub, connections, loaded_answers):
+    with hub.subscribe(1) as slow:
+        for answer_id in (1, 2, 3):
+            connections[-1].notify(answer_id=answer_id, question_id=1)
+        await until(lambda: slow.overflowed)
+
+        assert slow.queue.get_nowait() is None
+        assert hub.subscriber_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_hub_loads_pending_answers_in_one_query(hub, connections, loaded_answers):
+    with hub.subscribe(1) as subscription:
+        # уведомления пришли, пока обработчик ещё не проснулся
+        for answer_id in (3, 4):
+            connections[-1].notify(answer_id=answer_id, question_id=1)
+        await until(lambda: subscription.queue.qsize() == 2)
+
+        assert loaded_answers == [[3, 4]]
+        assert [subscription.queue.get_nowait().id for _ in range(2)] == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_full_pending_queue_disconnects_subscribers(
+    uow_factory, connections, loaded_answers
+):
+    async def connect():
+        connection = FakeListenConnection()
+        connections.append(connection)
+        return connection
+
+    hub = AnswerEventHub(
+        connect, AnswersService(uow_factory=uow_factory), max_pending=2
+    )
+    hub.start()
+    try:
+        await until(lambda: connections and connections[-1].listeners)
+        with hub.subscribe(1) as first, hub.subscribe(2) as second:
+            for answer_id in (1, 2, 3):
+                connections[-1].notify(answer_id=answer_id, question_id=1)
+
+            # третье уведомление не влезло: подписчик вопроса 1 его пропустит
+            assert first.overflowed
+            assert not second.overflowed
+            assert hub.subscriber_count() == 1
+    finally:
+        await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_hub_reconnects_after_connection_loss(hub, connections, loaded_answers):
+    connections[-1].terminate()
+    await until(lambda: len(connections) == 2 and connections[-1].listeners)
+
+    with hub.subscribe(1) as subscription:
+        connections[-1].notify(answer_id=7, question_id=1)
+        await until(lambda: not subscription.queue.empty())
+        assert subscription.queue.get_nowait().id == 7
+
+
+@pytest.mark.asyncio
+async def test_iter_answer_events_frames(hub, connections, loaded_answers):
+    frames = iter_answer_events(hub, question_id=1)
+    assert await anext(frames) == b": connected\n\n"
+
+    connections[-1].notify(answer_id=5, question_id=1)
+    frame = await anext(frames)
+    assert frame.startswith(b"id: 5\nevent: answer\ndata: {")
+    assert frame.endswith(b"\n\n")
+
+    await frames.aclose()
+    assert hub.subscriber_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_answers_503_when_disabled(client):
+    r = await client.get("/api/v1/questions/1/answers/stream")
+    assert r.status_code == 503
+    assert r.json()["detail"] == "Answer stream is disabled"
+
+
+@pytest.mark.asyncio
+async def test_stream_answers_404(app, client, hub, questions_repo):
+    async def _find_one_summary(question_id):
+        return None
+
+    questions_repo._find_one_summary = _find_one_summary
+    app.state.answer_events = hub
+
+    r = await client.get("/api/v1/questions/999/answers/stream")
+    assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_listen_notify_roundtrip(pg_engine, pg_uow_factory):
+    url = pg_engine.url.set(drivername="postgresql")
+    answers_service = AnswersService(uow_factory=pg_uow_factory)
+    question_id = await QuestionsService(uow_factory=pg_uow_factory).add_question(
+        QuestionCreateSchema(text="вопрос")
+    )
+
+    hub = AnswerEventHub(
+        lambda: asyncpg.connect(url.render_as_string(hide_password=False)),
+        answers_service,
+    )
+    hub.start()
+    try:
+        with hub.subscribe(question_id) as subscription:
+            # LISTEN выполняется в фоне: ждём, пока соединение подпишется
+            await asyncio.sleep(0.5)
+            answer_id = await answers_service.add_answer(
+                AnswerCreateSchema(user_id="u", text="живой ответ"),
+                question_id=question_id,
+            )
+            answer = await asyncio.wait_for(subscription.queue.get(), timeout=5)
+        assert answer.id == answer_id
+        assert answer.text == "живой ответ"
+    finally:
+        await hub.close()
@@ -0,0 +1,181 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from src.core.domain_exceptions import (
+    IngestionQueueFullException,
+    QuestionNotFoundException,
+)
+from src.schemas.answers_schema import AnswerBatchCreateSchema, TicketStatus
+from src.services.answer_ingestion import AnswerIngestionQueue
+from src.services.answers_service import AnswersService
+
+
+@pytest_asyncio.fixture
+async def ingestion(app, uow_factory):
+    queue = AnswerIngestionQueue(
+        AnswersService(uow_factory=uow_factory), max_size=3, batch_size=10
+    )
+    app.state.answer_ingestion = queue
+    yield queue
+    await queue.drain()
+
+
+def answer(question_id: int) -> AnswerBatchCreateSchema:
+    return AnswerBatchCreateSchema(user_id="u", text="t", question_id=question_id)
+
+
+@pytest.mark.asyncio
+async def test_worker_writes_queued_answers_in_one_batch(ingestion, inserted_batches):
+    tickets = [ingestion.submit(answer(1)) for _ in range(2)]
+    tickets.append(ingestion.submit(answer(404)))
+    assert {t.status for t in tickets} == {TicketStatus.pending}
+
+    ingestion.start()
+    await ingestion.drain()
+
+    assert [len(batch) for batch in inserted_batches] == [2]
+    assert [t.status for t in tickets] == ["done", "done", "failed"]
+    assert [t.answer_id for t in tickets[:2]] == [1, 2]
+    assert tickets[2].detail == "Question not found"
+
+
+@pytest.mark.asyncio
+async def test_full_queue_and_drained_queue_reject(ingestion, inserted_batches):
+    for _ in range(3):
+        ingestion.submit(answer(1))
+    with pytest.raises(IngestionQueueFullException):
+        ingestion.submit(answer(1))
+
+    ingestion.start()
+    await ingestion.drain()
+    assert ingestion.qsize() == 0
+    with pytest.raises(IngestionQueueFullException):
+        ingestion.submit(answer(1))
+
+
+@pytest.mark.asyncio
+async def test_prefer_respond_async_returns_ticket(
+    client, ingestion, inserted_batches, valid_answer_payload
+):
+    ingestion.start()
+    r = await client.post(
+        "/api/v1/questions/1/answers",
+        json=valid_answer_payload,
+        headers={"Prefer": "respond-async, wait=0"},
+    )
+    assert r.status_code == 202
+    assert r.headers["preference-applied"] == "respond-async"
+    ticket = r.json()
+    assert ticket["status"] == "pending"
+    assert r.headers["location"] == f"/api/v1/answers/tickets/{ticket['ticket_id']}"
+
+    for _ in range(100):
+        status = (await client.get(r.headers["location"])).json()
+        if status["status"] != "pending":
+            break
+        await asyncio.sleep(0.01)
+    assert status == {
+        "ticket_id": ticket["ticket_id"],
+        "status": "done",
+        "answer_id": 1,
+        "detail": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_prefer_respond_async_429_when_full(
+    client, ingestion, valid_answer_payload
+):
+    # воркер не запущен — очередь только наполняется
+    for _ in range(3):
+        ingestion.submit(answer(1))
+
+    r = await client.post(
+        "/api/v1/questions/1/answers",
+        json=valid_answer_payload,
+        headers={"Prefer": "respond-async"},
+    )
+    assert r.status_code == 429
+    assert r.headers["retry-after"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_prefer_ignored_without_queue(client, answers_repo, valid_answer_payload):
+    async def _add_one(data):
+        return 7
+
+    answers_repo._add_one = _add_one
+
+    r = await client.post(
+        "/api/v1/questions/1/answers",
+        json=valid_answer_payload,
+        headers={"Prefer": "respond-async"},
+    )
+    assert r.status_code == 201
+    assert r.json() == 7
+
+
+@pytest.mark.asyncio
+async def test_unknown_ticket_404(client, ingestion):
+    r = await client.get("/api/v1/answers/tickets/nope")
+    assert r.status_code == 404
+    assert r.json() == {"detail": "Ticket not found"}
+
+
+@pytest.mark.asyncio
+async def test_batch_without_visible_culprit_is_written_item_by_item(
+    uow_factory, questions_repo, inserted_batches
+):
+    # вопрос 3 удалили между вставкой и проверкой: проверка его ещё видит
+    async def _existing_ids(ids):
+        return set(ids)
+
+    questions_repo._existing_ids = _existing_ids
+    service = AnswersService(uow_factory=uow_factory)
+
+    results = await service.add_answers_each([answer(1), answer(3), answer(2)])
+
+    assert results[0] == 1
+    assert isinstance(results[1], QuestionNotFoundException)
+    assert results[2] == 2
+    assert [len(batch) for batch in inserted_batches] == [1, 1]
+
+
+class FakeLockConnection:
+    def __init__(self, acquired: bool):
+        self.acquired = acquired
+        self.closed = False
+
+    async def fetchval(self, query, *args):
+        return self.acquired
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_second_process_cannot_claim_queue(ingestion):
+    # тикеты в памяти процесса: второй процесс отвечал бы 404 на чужие тикеты
+    taken = FakeLockConnection(acquired=False)
+
+    async def connect():
+        return taken
+
+    with pytest.raises(RuntimeError, match="single worker"):
+        await ingestion.claim(connect)
+    assert taken.closed
+
+
+@pytest.mark.asyncio
+async def test_claim_is_released_on_drain(ingestion):
+    lock = FakeLockConnection(acquired=True)
+
+    async def connect():
+        return lock
+
+    await ingestion.claim(connect)
+    ingestion.start()
+    await ingestion.drain()
+    assert lock.closed
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from src.core.domain_exceptions import QuestionNotFoundException
+from src.db.query_stats import (
+    QueryStats,
+    current_query_stats,
+    start_query_stats,
+    stop_query_stats,
+)
+from src.schemas.answers_schema import AnswerCreateSchema
+from src.schemas.question_schema import QuestionSchema
+from src.services.answer_write_coalescer import AnswerWriteCoalescer
+from src.services.answers_service import AnswersService
+from src.utils.cache import QuestionsCache
+
+
+@pytest.fixture
+def coalescer(uow_factory) -> AnswerWriteCoalescer:
+    return AnswerWriteCoalescer(
+        AnswersService(uow_factory=uow_factory), window=0.01, max_batch=100
+    )
+
+
+def add(service: AnswersService, question_id: int, text: str = "t"):
+    return service.add_answer(
+        AnswerCreateSchema(user_id="u", text=text), question_id=question_id
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_answers_share_one_insert(
+    uow_factory, coalescer, inserted_batches
+):
+    service = AnswersService(uow_factory=uow_factory, write_coalescer=coalescer)
+
+    ids = await asyncio.gather(*(add(service, 1, f"a{i}") for i in range(5)))
+
+    assert ids == [1, 2, 3, 4, 5]
+    assert len(inserted_batches) == 1
+    assert [row["text"] for row in inserted_batches[0]] == [f"a{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_missing_question_fails_only_its_caller(
+    uow_factory, coalescer, inserted_batches
+):
+    service = AnswersService(uow_factory=uow_factory, write_coalescer=coalescer)
+
+    results = await asyncio.gather(
+        add(service, 1), add(service, 999), add(service, 2), return_exceptions=True
+    )
+
+    assert results[0] == 1
+    assert isinstance(results[1], QuestionNotFoundException)
+    assert results[2] == 2
+    assert [[row["question_id"] for row in b] for b in inserted_batches] == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_max_batch_flushes_without_waiting_for_window(
+    uow_factory, inserted_batches
+):
+    coalescer = AnswerWriteCoalescer(
+        AnswersService(uow_factory=uow_factory), window=60, max_batch=3
+    )
+    service = AnswersService(uow_factory=uow_factory, write_coalescer=coalescer)
+
+    ids = await asyncio.wait_for(
+        asyncio.gather(*(add(service, 1) for _ in range(3))), timeout=1
+    )
+
+    assert ids == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_close_flushes_pending(uow_factory, inserted_batches):
+    coalescer = AnswerWriteCoalescer(
+        AnswersService(uow_factory=uow_factory), window=60, max_batch=100
+    )
+    service = AnswersService(uow_factory=uow_factory, write_coalescer=coalescer)
+
+    pending = asyncio.create_task(add(service, 1))
+    await asyncio.sleep(0)
+    await coalescer.close()
+
+    assert await pending == 1
+
+
+@pytest.mark.asyncio
+async def test_coalesced_write_invalidates_cache_after_commit(
+    uow_factory, coalescer, inserted_batches
+):
+    cache = QuestionsCache(max_entries=10, max_bytes=10_000, ttl=60)
+    cache.set(
+        QuestionSchema(id=1, text="q", created_at="2026-01-01T00:00:00Z", answers=[]),
+        cache.generation(),
+    )
+    assert cache.get(1) is not None
+    service = AnswersService(
+        uow_factory=uow_factory, questions_cache=cache, write_coalescer=coalescer
+    )
+
+    await add(service, 1)
+
+    assert cache.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_coalesced_write_opens_no_request_uow(
+    uow_factory, opened_uows, coalescer, inserted_batches
+):
+    writes = []
+    service = AnswersService(
+        uow_factory=uow_factory,
+        write_coalescer=coalescer,
+        mark_write=lambda: writes.append(True),
+    )
+
+    await asyncio.gather(*(add(service, 1) for _ in range(3)))
+
+    # единственная транзакция — общая у пачки
+    assert len(opened_uows) == 1
+    assert writes == [True, True, True]
+
+
+@pytest.mark.asyncio
+async def test_batch_not_charged_to_first_submitter(
+    coalescer, answers_repo, inserted_batches
+):
+    add_many = answers_repo._add_many
+    seen_stats = []
+
+    async def _add_many(rows):
+        seen_stats.append(current_query_stats())
+        return await add_many(rows)
+
+    answers_repo._add_many = _add_many
+    service = AnswersService(uow_factory=None, write_coalescer=coalescer)
+    token = start_query_stats(QueryStats())
+    try:
+        await add(service, 1)
+    finally:
+        stop_query_stats(token)
+
+    assert seen_stats == [None]
@@ -1,9 +1,11 @@
+import json
 from datetime import UTC, datetime
 
 import pytest
 from sqlalchemy.exc import IntegrityError
 
 from src.db.db_exceptions import map_integrity_error
+from src.schemas import AnswerSchema
 
 
 @pytest.mark.asyncio
@@ -132,3 +134,177 @@ async def test_delete_answer_500_on_exception(client, answers_repo):
     r = await client.delete("/api/v1/answers/5")
     assert r.status_code == 500
     assert r.json()["detail"] == "Internal Server Error"
+
+
+@pytest.mark.asyncio
+async def test_stream_answers_ndjson(client, answers_repo):
+    async def _stream_all():
+        for i in (1, 2):
+            yield AnswerSchema(
+                id=i,
+                question_id=1,
+                user_id="u",
+                text="ok",
+                created_at=datetime.now(UTC),
+            )
+
+    answers_repo._stream_all = _stream_all
+
+    r = await client.get("/api/v1/answers/stream")
+    assert r.status_code == 200
+    assert [json.loads(line)["id"] for line in r.text.splitlines()] == [1, 2]
+
+
+def _answer(answer_id: int, created_at: datetime) -> AnswerSchema:
+    return AnswerSchema(
+        id=answer_id, question_id=1, user_id="u", text="ok", created_at=created_at
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_question_answers_200(client, answers_repo):
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    async def _find_page(limit, after, **filter_by):
+        assert filter_by == {"question_id": 1}
+        assert limit == 3
+        return [_answer(i, created_at) for i in (5, 4, 3)]
+
+    answers_repo._find_page = _find_page
+
+    r = await client.get("/api/v1/questions/1/answers", params={"limit": 2})
+    assert r.status_code == 200
+    body = r.json()
+    assert [a["id"] for a in body["items"]] == [5, 4]
+    assert body["next_cursor"]
+
+
+@pytest.mark.asyncio
+async def test_list_question_answers_empty_for_existing_question(
+    client, answers_repo, questions_repo
+):
+    async def _find_page(limit, after, **filter_by):
+        return []
+
+    async def _exists(question_id):
+        return True
+
+    answers_repo._find_page = _find_page
+    questions_repo._exists = _exists
+
+    r = await client.get("/api/v1/questions/1/answers")
+    assert r.status_code == 200
+    assert r.json() == {"items": [], "next_cursor": None}
+
+
+@pytest.mark.asyncio
+async def test_list_user_answers_cursor_roundtrip(client, answers_repo):
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    seen = []
+
+    async def _find_user_page(user_id, limit, after):
+        seen.append((user_id, limit, after))
+        return [_answer(i, created_at) for i in (5, 4, 3)]
+
+    answers_repo._find_user_page = _find_user_page
+
+    r = await client.get("/api/v1/users/u-1/answers", params={"limit": 2})
+    assert r.status_code == 200
+    body = r.json()
+    assert [a["id"] for a in body["items"]] == [5, 4]
+
+    r = await client.get(
+        "/api/v1/users/u-1/answers", params={"limit": 2, "cursor": body["next_cursor"]}
+    )
+    assert r.status_code == 200
+    assert seen == [("u-1", 3, None), ("u-1", 3, (created_at, 4))]
+
+
+@pytest.mark.asyncio
+async def test_list_user_answers_empty(client, answers_repo):
+    async def _find_user_page(user_id, limit, after):
+        return []
+
+    answers_repo._find_user_page = _find_user_page
+
+    r = await client.get("/api/v1/users/nobody/answers")
+    assert r.status_code == 200
+    assert r.json() == {"items": [], "next_cursor": None}
+
+
+@pytest.mark.asyncio
+async def test_list_user_answers_400_on_invalid_cursor(client, answers_repo):
+    r = await client.get("/api/v1/users/u-1/answers", params={"cursor": "nope"})
+    assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_question_answers_404(client, answers_repo, questions_repo):
+    async def _find_page(limit, after, **filter_by):
+        return []
+
+    async def _exists(question_id):
+        return False
+
+    answers_repo._find_page = _find_page
+    questions_repo._exists = _exists
+
+    r = await client.get("/api/v1/questions/999/answers")
+    assert r.status_code == 404
+    assert r.json()["detail"] == "Question not found"
+
+
+@pytest.mark.asyncio
+async def test_create_answers_batch_201(client, answers_repo, valid_answer_payload):
+    async def _add_many(rows: list[dict]) -> list[int]:
+        assert [row["question_id"] for row in rows] == [1, 2]
+        return [10, 11]
+
+    answers_repo._add_many = _add_many
+
+    payload = [
+        {**valid_answer_payload, "question_id": 1},
+        {**valid_answer_payload, "question_id": 2},
+    ]
+    r = await client.post("/api/v1/answers/batch", json=payload)
+    assert r.status_code == 201
+    assert r.json() == [10, 11]
+
+
+@pytest.mark.asyncio
+async def test_create_answers_batch_404_lists_failed_items(
+    client, answers_repo, questions_repo, valid_answer_payload
+):
+    async def _add_many(rows: list[dict]) -> list[int]:
+        try:
+            raise IntegrityError("insert", "params", "violates foreign key constraint")
+        except IntegrityError as e:
+            raise map_integrity_error(e) from e
+
+    async def _existing_ids(question_ids: set[int]) -> set[int]:
+        assert question_ids == {1, 999}
+        return {1}
+
+    answers_repo._add_many = _add_many
+    questions_repo._existing_ids = _existing_ids
+
+    payload = [
+        {**valid_answer_payload, "question_id": 1},
+        {**valid_answer_payload, "question_id": 999},
+        {**valid_answer_payload, "question_id": 999},
+    ]
+    r = await client.post("/api/v1/answers/batch", json=payload)
+    assert r.status_code == 404
+    assert r.json() == {
+        "detail": "Question not found",
+        "items": [
+            {"index": 1, "question_id": 999},
+            {"index": 2, "question_id": 999},
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_create_answers_batch_422_on_empty(client):
+    r = await client.post("/api/v1/answers/batch", json=[])
+    assert r.status_code == 422
@@ -0,0 +1,189 @@
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from src.schemas import AnswerSchema, QuestionSchema
+from src.schemas.answers_schema import AnswerCreateSchema
+from src.services.answers_service import AnswersService
+from src.services.questions_service import QuestionsService
+from src.utils.cache import ENTRY_OVERHEAD_BYTES, LruTtlCache, QuestionsCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _question(question_id: int, answer_ids=()) -> QuestionSchema:
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    return QuestionSchema(
+        id=question_id,
+        text="q",
+        created_at=created_at,
+        answers=[
+            AnswerSchema(
+                id=answer_id,
+                question_id=question_id,
+                user_id="u",
+                text="a",
+                created_at=created_at,
+            )
+            for answer_id in answer_ids
+        ],
+    )
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LruTtlCache(max_entries=2, max_bytes=10_000, ttl=60)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    assert cache.get("a") == b"1"
+    cache.set("c", b"3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_bounded_by_bytes():
+    cache = LruTtlCache(
+        max_entries=100, max_bytes=2 * (ENTRY_OVERHEAD_BYTES + 10), ttl=60
+    )
+    cache.set("a", b"x" * 10)
+    cache.set("b", b"x" * 10)
+    cache.set("c", b"x" * 10)
+
+    assert len(cache) == 2
+    assert "a" not in cache
+    assert cache.stats()["bytes"] == 2 * (ENTRY_OVERHEAD_BYTES + 10)
+
+
+def test_lru_skips_value_larger_than_cache():
+    cache = LruTtlCache(max_entries=100, max_bytes=ENTRY_OVERHEAD_BYTES, ttl=60)
+    cache.set("a", b"x")
+    assert len(cache) == 0
+
+
+def test_ttl_expiration():
+    clock = FakeClock()
+    cache = LruTtlCache(max_entries=10, max_bytes=10_000, ttl=5, clock=clock)
+    cache.set("a", b"1")
+    clock.now = 5
+    assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 0
+
+
+def test_questions_cache_invalidate_by_answer():
+    cache = QuestionsCache(max_entries=10, max_bytes=100_000, ttl=60)
+    cache.set(_question(1, answer_ids=(10, 11)), cache.generation())
+
+    assert json.loads(cache.get(1))["answers"][1]["id"] == 11
+    cache.invalidate_answer(11)
+    assert cache.get(1) is None
+
+
+def test_questions_cache_ignores_stale_read():
+    cache = QuestionsCache(max_entries=10, max_bytes=100_000, ttl=60)
+    generation = cache.generation()
+    # запись закоммитилась, пока читатель ходил в БД
+    cache.invalidate_question(1)
+    cache.set(_question(1), generation)
+    assert cache.get(1) is None
+
+
+@pytest.fixture
+def questions_cache():
+    return QuestionsCache(max_entries=10, max_bytes=100_000, ttl=60)
+
+
+@pytest.mark.asyncio
+async def test_get_question_read_through(uow_factory, questions_repo, questions_cache):
+    calls = []
+
+    async def _find_one(question_id):
+        calls.append(question_id)
+        return _question(question_id)
+
+    questions_repo._find_one = _find_one
+    service = QuestionsService(uow_factory=uow_factory, cache=questions_cache)
+
+    first = await service.get_question_payload(1)
+    second = await service.get_question_payload(1)
+
+    assert calls == [1]
+    # попадание — те же байты, без разбора и повторной сериализации
+    assert second == first
+    assert QuestionSchema.model_validate_json(second) == _question(1)
+    assert questions_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_add_answer_invalidates_after_commit(
+    uow_factory, answers_repo, questions_cache
+):
+    async def _add_one(data):
+        return 5
+
+    answers_repo._add_one = _add_one
+    questions_cache.set(_question(1), questions_cache.generation())
+    service = AnswersService(uow_factory=uow_factory, questions_cache=questions_cache)
+
+    await service.add_answer(AnswerCreateSchema(user_id="u", text="t"), question_id=1)
+    assert questions_cache.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_failed_delete_keeps_cache(uow_factory, answers_repo, questions_cache):
+    async def _boom(answer_id):
+        raise RuntimeError("db fail")
+
+    answers_repo._del_one = _boom
+    questions_cache.set(_question(1, answer_ids=(10,)), questions_cache.generation())
+    service = AnswersService(uow_factory=uow_factory, questions_cache=questions_cache)
+
+    with pytest.raises(RuntimeError):
+        await service.delete_answer(10)
+    assert questions_cache.get(1) is not None
+
+
+@pytest.mark.asyncio
+async def test_delete_question_invalidates(
+    uow_factory, questions_repo, questions_cache
+):
+    async def _del_one(question_id):
+        return True
+
+    questions_repo._del_one = _del_one
+    questions_cache.set(_question(1), questions_cache.generation())
+    service = QuestionsService(uow_factory=uow_factory, cache=questions_cache)
+
+    await service.delete_question(1)
+    assert questions_cache.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_filled_only_from_primary(
+    uow_factory, opened_uows, questions_repo, questions_cache
+):
+    async def _find_one(question_id):
+        if opened_uows[-1].prefer_primary:
+            return _question(question_id, answer_ids=(10,))
+        # отстающая реплика ещё не видит ответ 10, уже закоммиченный на primary
+        return _question(question_id)
+
+    questions_repo._find_one = _find_one
+    service = QuestionsService(uow_factory=uow_factory, cache=questions_cache)
+
+    await service.get_question_payload(1)
+    cached = json.loads(await service.get_question_payload(1))
+
+    assert [answer["id"] for answer in cached["answers"]] == [10]
+    assert questions_cache.stats()["hits"] == 1
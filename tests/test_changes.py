@@ -0,0 +1,99 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from src.schemas.answers_schema import AnswerCreateSchema
+from src.schemas.change_schema import ChangeEntity, ChangeOp, ChangeSchema
+from src.schemas.question_schema import QuestionCreateSchema
+from src.services.answers_service import AnswersService
+from src.services.changes_service import ChangesService
+from src.services.questions_service import QuestionsService
+from src.utils.pagination import decode_cursor
+
+
+def _change(entity_id: int, op: ChangeOp = ChangeOp.insert) -> ChangeSchema:
+    return ChangeSchema(
+        entity=ChangeEntity.answer,
+        entity_id=entity_id,
+        question_id=1,
+        op=op,
+        changed_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio
+async def test_changes_page_and_resume_token(client, changes_repo):
+    seen_after = []
+
+    async def _find_since(limit, after):
+        seen_after.append(after)
+        if after is None:
+            return [(100, i, _change(i)) for i in (1, 2, 3)]
+        return []
+
+    changes_repo._find_since = _find_since
+
+    r = await client.get("/api/v1/changes", params={"limit": 2})
+    assert r.status_code == 200
+    body = r.json()
+    assert [c["entity_id"] for c in body["items"]] == [1, 2]
+    assert body["has_more"] is True
+
+    # пустая страница возвращает тот же токен: клиент опрашивает с него дальше
+    r = await client.get("/api/v1/changes", params={"since": body["next_since"]})
+    assert r.status_code == 200
+    assert r.json() == {
+        "items": [],
+        "next_since": body["next_since"],
+        "has_more": False,
+    }
+    assert seen_after == [None, (100, 2)]
+
+
+@pytest.mark.asyncio
+async def test_changes_400_on_invalid_since(client, changes_repo):
+    r = await client.get("/api/v1/changes", params={"since": "nope"})
+    assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_changes_reads_in_read_only_uow(uow_factory, changes_repo, opened_uows):
+    async def _find_since(limit, after):
+        return []
+
+    changes_repo._find_since = _find_since
+
+    page = await ChangesService(uow_factory=uow_factory).get_changes(limit=10)
+    assert page.items == [] and page.next_since is None
+    assert [uow.read_only for uow in opened_uows] == [True]
+
+
+@pytest.mark.asyncio
+async def test_change_log_records_cascade_tombstones(pg_uow_factory):
+    questions_service = QuestionsService(uow_factory=pg_uow_factory)
+    answers_service = AnswersService(uow_factory=pg_uow_factory)
+    changes_service = ChangesService(uow_factory=pg_uow_factory)
+
+    question_id = await questions_service.add_question(
+        QuestionCreateSchema(text="вопрос")
+    )
+    answer_id = await answers_service.add_answer(
+        AnswerCreateSchema(user_id="u", text="ответ"), question_id=question_id
+    )
+    start = await changes_service.get_changes(limit=100)
+
+    await questions_service.delete_question(question_id)
+
+    page = await changes_service.get_changes(limit=100, since=start.next_since)
+    assert [(c.entity, c.entity_id, c.op) for c in start.items] == [
+        (ChangeEntity.question, question_id, ChangeOp.insert),
+        (ChangeEntity.answer, answer_id, ChangeOp.insert),
+    ]
+    # удаление вопроса и каскадное удаление его ответа — одна транзакция
+    assert {(c.entity, c.entity_id, c.op) for c in page.items} == {
+        (ChangeEntity.question, question_id, ChangeOp.delete),
+        (ChangeEntity.answer, answer_id, ChangeOp.delete),
+    }
+    assert decode_cursor(page.next_since, int, int) > decode_cursor(
+        start.next_since, int, int
+    )
@@ -0,0 +1,243 @@
+import asyncio
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import asyncpg
+import pytest
+
+from src.api.v1 import deps
+from src.core.config import AdminConfig
+from src.core.domain_exceptions import DatasetImportException
+from src.db.db_exceptions import UniqueConstraintViolation
+from src.db.triggers import ANSWERS_CHANNEL
+from src.schemas.answers_schema import AnswerCreateSchema
+from src.schemas.question_schema import QuestionCreateSchema
+from src.services.answers_service import AnswersService
+from src.services.dataset_service import DatasetService
+from src.services.questions_service import QuestionsService
+from src.utils.dataset import DatasetFormat, decode_dataset, encode_dataset
+from src.utils.unitofwork import ReadOnlyUnitOfWork
+
+CREATED = datetime(2026, 1, 1, 10, 0, tzinfo=UTC)
+ROWS = [
+    ("question", 1, None, None, 'вопрос, "с кавычками"\nи переводом строки', CREATED),
+    ("question", 2, None, None, "второй", CREATED),
+    ("answer", 10, 1, "u1", "ответ", CREATED),
+    ("answer", 11, 2, "u2", "ещё ответ\r\n", CREATED),
+]
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(chunks):
+    return b"".join([chunk async for chunk in chunks])
+
+
+def _split(data: bytes, size: int) -> list[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def _as_row(record) -> tuple:
+    return (
+        record.type,
+        record.id,
+        getattr(record, "question_id", None),
+        getattr(record, "user_id", None),
+        record.text,
+        record.created_at,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("dataset_format", list(DatasetFormat))
+async def test_encode_decode_roundtrip(dataset_format):
+    data = await _collect(encode_dataset(_aiter(ROWS), dataset_format, flush_bytes=16))
+    # чанки режут и записи, и многобайтные символы
+    records = [
+        record
+        async for record in decode_dataset(_aiter(_split(data, 7)), dataset_format)
+    ]
+    assert [_as_row(record) for record in records] == ROWS
+
+
+@pytest.mark.asyncio
+async def test_decode_reports_line_of_invalid_record():
+    data = (
+        b'{"type":"question","id":1,"text":"q","created_at":"2026-01-01T00:00:00Z"}\n'
+    )
+    data += b'{"type":"answer","id":2,"text":"a","created_at":"2026-01-01T00:00:00Z"}\n'
+    with pytest.raises(DatasetImportException) as exc_info:
+        async for _ in decode_dataset(_aiter([data]), DatasetFormat.ndjson):
+            pass
+    assert exc_info.value.detail.startswith("Line 2: answer.")
+
+
+@pytest.mark.asyncio
+async def test_decode_csv_requires_header():
+    data = b"question,1,,,q,2026-01-01T00:00:00+00:00\r\n"
+    with pytest.raises(DatasetImportException, match="Line 1: expected header"):
+        async for _ in decode_dataset(_aiter([data]), DatasetFormat.csv):
+            pass
+
+
+@pytest.fixture
+def admin_enabled(app):
+    app.state.admin_config = AdminConfig(enabled=True, import_batch_size=2)
+
+
+def test_admin_export_reads_primary_without_statement_timeout():
+    # выгрузка через API не должна попадать под DB_READ_STATEMENT_TIMEOUT_MS
+    # и читать с отстающей реплики
+    session_maker = object()
+    request = SimpleNamespace(
+        app=SimpleNamespace(
+            state=SimpleNamespace(db=SimpleNamespace(session_maker=session_maker))
+        )
+    )
+    uow = deps.get_primary_uow_factory(request)(read_only=True)
+    assert isinstance(uow, ReadOnlyUnitOfWork)
+    assert uow.session_factory is session_maker
+    assert uow.statement_timeout_ms is None
+
+
+@pytest.mark.asyncio
+async def test_admin_disabled_by_default(client):
+    r = await client.get("/api/v1/admin/dataset")
+    assert r.status_code == 403
+    assert r.json()["detail"] == "Admin endpoints are disabled"
+
+
+@pytest.mark.asyncio
+async def test_export_endpoint_csv(client, admin_enabled, questions_repo):
+    async def _stream_dataset():
+        for row in ROWS:
+            yield row
+
+    questions_repo._stream_dataset = _stream_dataset
+
+    r = await client.get("/api/v1/admin/dataset", params={"format": "csv"})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/csv")
+    assert 'filename="dataset.csv"' in r.headers["content-disposition"]
+    assert r.content.startswith(b"type,id,question_id,user_id,text,created_at\r\n")
+
+
+@pytest.fixture
+def staged(questions_repo):
+    staged = {"questions": [], "answers": [], "batches": 0}
+
+    async def _stage_import():
+        pass
+
+    async def _copy_import_rows(questions, answers):
+        staged["questions"] += questions
+        staged["answers"] += answers
+        staged["batches"] += 1
+
+    async def _apply_import():
+        known = {row[0] for row in staged["questions"]}
+        answers = [row for row in staged["answers"] if row[1] in known]
+        return len(staged["questions"]), len(answers)
+
+    questions_repo._stage_import = _stage_import
+    questions_repo._copy_import_rows = _copy_import_rows
+    questions_repo._apply_import = _apply_import
+    return staged
+
+
+@pytest.mark.asyncio
+async def test_import_endpoint_copies_in_batches(client, admin_enabled, staged):
+    body = await _collect(encode_dataset(_aiter(ROWS), DatasetFormat.ndjson))
+
+    r = await client.post("/api/v1/admin/dataset", content=body)
+    assert r.status_code == 200
+    assert r.json() == {"questions": 2, "answers": 2}
+    # import_batch_size=2: четыре записи — две пачки COPY
+    assert staged["batches"] == 2
+    assert [row[0] for row in staged["answers"]] == [10, 11]
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_answers_without_question(client, admin_enabled, staged):
+    body = await _collect(encode_dataset(_aiter(ROWS[1:]), DatasetFormat.ndjson))
+
+    r = await client.post("/api/v1/admin/dataset", content=body)
+    assert r.status_code == 422
+    assert r.json()["detail"] == (
+        "1 answers reference questions missing from the dataset"
+    )
+
+
+@pytest.mark.asyncio
+async def test_import_rejects_duplicate_question_id(
+    client, admin_enabled, staged, questions_repo
+):
+    async def _apply_import():
+        raise UniqueConstraintViolation()
+
+    questions_repo._apply_import = _apply_import
+    body = await _collect(encode_dataset(_aiter(ROWS), DatasetFormat.ndjson))
+
+    r = await client.post("/api/v1/admin/dataset", content=body)
+    assert r.status_code == 422
+    assert r.json()["detail"] == "Duplicate question id"
+
+
+@pytest.mark.asyncio
+async def test_pg_dataset_roundtrip(pg_uow_factory):
+    questions_service = QuestionsService(uow_factory=pg_uow_factory)
+    answers_service = AnswersService(uow_factory=pg_uow_factory)
+    question_id = await questions_service.add_question(
+        QuestionCreateSchema(text="исходный")
+    )
+    await answers_service.add_answer(
+        AnswerCreateSchema(user_id="u", text="ответ"), question_id=question_id
+    )
+    service = DatasetService(uow_factory=pg_uow_factory, batch_size=1)
+
+    exported = await _collect(service.export_dataset(DatasetFormat.csv))
+    result = await service.import_dataset(_aiter([exported]), DatasetFormat.csv)
+    assert (result.questions, result.answers) == (1, 1)
+
+    questions = (await questions_service.get_questions_page(limit=10)).items
+    assert len(questions) == 2
+    copy = next(question for question in questions if question.id != question_id)
+    # ответ перенесён на новый id вопроса, а счётчик обновлён триггером
+    assert copy.text == "исходный"
+    assert copy.answer_count == 1
+    assert [answer.text for answer in copy.answers] == ["ответ"]
+
+
+@pytest.mark.asyncio
+async def test_pg_import_sends_no_answer_notifications(pg_engine, pg_uow_factory):
+    url = pg_engine.url.set(drivername="postgresql")
+    listener = await asyncpg.connect(url.render_as_string(hide_password=False))
+    received = []
+    await listener.add_listener(
+        ANSWERS_CHANNEL, lambda *args: received.append(json.loads(args[-1]))
+    )
+    try:
+        service = DatasetService(uow_factory=pg_uow_factory, batch_size=2)
+        chunks = encode_dataset(_aiter(ROWS), DatasetFormat.ndjson)
+        result = await service.import_dataset(chunks, DatasetFormat.ndjson)
+        assert result.answers == 2
+
+        # обычная вставка после импорта по-прежнему уведомляет
+        question_id = await QuestionsService(uow_factory=pg_uow_factory).add_question(
+            QuestionCreateSchema(text="после импорта")
+        )
+        answer_id = await AnswersService(uow_factory=pg_uow_factory).add_answer(
+            AnswerCreateSchema(user_id="u", text="живой"), question_id=question_id
+        )
+        for _ in range(50):
+            if received:
+                break
+            await asyncio.sleep(0.02)
+        await asyncio.sleep(0.1)
+        assert [event["id"] for event in received] == [answer_id]
+    finally:
+        await listener.close()
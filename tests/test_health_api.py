@@ -6,3 +6,10 @@ async def test_health_ok(client):
     r = await client.get("/api/health")
     assert r.status_code == 200
     assert r.json() == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_cache_stats_disabled(client):
+    r = await client.get("/api/health/cache")
+    assert r.status_code == 200
+    assert r.json() == {"enabled": False}
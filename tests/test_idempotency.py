@@ -0,0 +1,192 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from src.core.metrics import IDEMPOTENCY_REPLAYS
+from src.db.db_exceptions import UniqueConstraintViolation
+from src.schemas.idempotency_schema import IdempotencyRecordSchema
+from src.schemas.question_schema import QuestionCreateSchema
+from src.services.idempotency import IdempotencyKeys
+from src.services.questions_service import QuestionsService
+
+
+class StoredKeys:
+    """Таблица ключей фейкового репозитория и журнал обращений к ней."""
+
+    def __init__(self):
+        self.records = {}
+        self.lookups = []
+
+    async def find_key(self, scope, key):
+        self.lookups.append((scope, key))
+        return self.records.get((scope, key))
+
+    async def save_key(self, scope, key, record):
+        if (scope, key) in self.records:
+            raise UniqueConstraintViolation()
+        self.records[(scope, key)] = record
+
+
+@pytest.fixture
+def stored_keys(idempotency_repo):
+    stored = StoredKeys()
+    idempotency_repo._find_key = stored.find_key
+    idempotency_repo._save_key = stored.save_key
+    return stored
+
+
+@pytest.fixture
+def inserted_questions(questions_repo):
+    inserted = []
+
+    async def _add_one(data):
+        inserted.append(data)
+        return len(inserted)
+
+    questions_repo._add_one = _add_one
+    return inserted
+
+
+@pytest.fixture
+def idempotency(app):
+    app.state.idempotency = IdempotencyKeys()
+    return app.state.idempotency
+
+
+@pytest.mark.asyncio
+async def test_retry_returns_original_id_without_insert(
+    client, idempotency, stored_keys, inserted_questions
+):
+    headers = {"Idempotency-Key": "k-1"}
+    first = await client.post("/api/v1/questions", json={"text": "q"}, headers=headers)
+    retry = await client.post("/api/v1/questions", json={"text": "q"}, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert first.json() == retry.json() == 1
+    assert len(inserted_questions) == 1
+    # повтор в тот же процесс отвечается из кэша, без запроса ключа в БД
+    assert stored_keys.lookups == [("questions.create", "k-1")]
+
+
+@pytest.mark.asyncio
+async def test_retry_in_other_process_replays_from_db(
+    app, client, idempotency, stored_keys, inserted_questions
+):
+    headers = {"Idempotency-Key": "k-1"}
+    await client.post("/api/v1/questions", json={"text": "q"}, headers=headers)
+    # другой процесс: свой, пустой кэш
+    app.state.idempotency = IdempotencyKeys()
+    before = IDEMPOTENCY_REPLAYS.value("questions.create", "db")
+
+    r = await client.post("/api/v1/questions", json={"text": "q"}, headers=headers)
+    assert r.json() == 1
+    assert len(inserted_questions) == 1
+    assert IDEMPOTENCY_REPLAYS.value("questions.create", "db") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_key_reused_with_other_body(
+    client, idempotency, stored_keys, inserted_questions
+):
+    headers = {"Idempotency-Key": "k-1"}
+    await client.post("/api/v1/questions", json={"text": "q"}, headers=headers)
+
+    r = await client.post("/api/v1/questions", json={"text": "x"}, headers=headers)
+    assert r.status_code == 422
+    assert r.json()["detail"] == "Idempotency-Key was used with a different request"
+    assert len(inserted_questions) == 1
+
+
+@pytest.mark.asyncio
+async def test_without_key_every_request_inserts(
+    client, idempotency, inserted_questions
+):
+    for _ in range(2):
+        await client.post("/api/v1/questions", json={"text": "q"})
+    assert len(inserted_questions) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_request_with_same_key_replays_winner(
+    uow_factory, opened_uows, idempotency_repo, inserted_questions
+):
+    winner = IdempotencyRecordSchema(fingerprint="", response="42")
+    found = iter([None, winner])
+
+    async def _find_key(scope, key):
+        return next(found)
+
+    async def _save_key(scope, key, record):
+        # параллельный запрос закоммитил ключ первым
+        winner.fingerprint = record.fingerprint
+        raise UniqueConstraintViolation()
+
+    idempotency_repo._find_key = _find_key
+    idempotency_repo._save_key = _save_key
+    service = QuestionsService(uow_factory=uow_factory, idempotency=IdempotencyKeys())
+
+    question_id = await service.add_question(
+        QuestionCreateSchema(text="q"), idempotency_key="k-1"
+    )
+    assert question_id == 42
+    # вставка была выполнена, но в транзакции, которая откатилась
+    assert len(inserted_questions) == 1
+    # поиски ключа читают с primary, не помечая клиента как писавшего
+    assert [(uow.read_only, uow.prefer_primary) for uow in opened_uows] == [
+        (True, True),
+        (False, False),
+        (True, True),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_answer_with_key_is_written_synchronously(
+    app, client, idempotency, stored_keys, answers_repo
+):
+    async def _add_one(data):
+        return 7
+
+    answers_repo._add_one = _add_one
+    # очередь включена, но запрос с ключом в неё не попадает
+    app.state.answer_ingestion = object()
+
+    r = await client.post(
+        "/api/v1/questions/1/answers",
+        json={"user_id": "u", "text": "a"},
+        headers={"Idempotency-Key": "k-1", "Prefer": "respond-async"},
+    )
+    assert r.status_code == 201
+    assert r.json() == 7
+    assert ("answers.create", "k-1") in stored_keys.records
+
+
+@pytest.mark.asyncio
+async def test_purge_deletes_in_batches(uow_factory, idempotency_repo):
+    calls = []
+    remaining = [3, 3, 1]
+
+    async def _purge_expired(ttl, limit):
+        calls.append((ttl, limit))
+        return remaining.pop(0)
+
+    idempotency_repo._purge_expired = _purge_expired
+    keys = IdempotencyKeys(ttl=60)
+
+    assert await keys.purge_expired(uow_factory, batch_size=3) == 7
+    assert calls == [(timedelta(seconds=60), 3)] * 3
+
+
+@pytest.mark.asyncio
+async def test_pg_concurrent_retries_insert_once(pg_uow_factory):
+    service = QuestionsService(
+        uow_factory=pg_uow_factory, idempotency=IdempotencyKeys()
+    )
+    question = QuestionCreateSchema(text="вопрос")
+
+    ids = await asyncio.gather(
+        *(service.add_question(question, idempotency_key="k-1") for _ in range(5))
+    )
+    assert len(set(ids)) == 1
+    page = await service.get_questions_page(limit=10)
+    assert [item.id for item in page.items] == ids[:1]
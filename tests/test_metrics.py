@@ -0,0 +1,102 @@
+import pytest
+
+from src.core.metrics import (
+    APP_ERRORS,
+    HTTP_REQUESTS,
+    REPOSITORY_CALL_DURATION,
+    Registry,
+)
+from src.db.models.question_model import QuestionOrm
+from src.schemas.question_schema import QuestionSchema
+from src.utils.repository import SqlAlchemyRepository
+
+
+def test_histogram_exposition_is_cumulative():
+    registry = Registry()
+    histogram = registry.histogram(
+        "db_latency_seconds", "Latency.", ("op",), buckets=(0.1, 1.0)
+    )
+    counter = registry.counter("db_calls", "Calls.", ("op",))
+    histogram.observe(0.05, "read")
+    histogram.observe(0.1, "read")
+    histogram.observe(3, "read")
+    counter.inc("read", amount=2)
+
+    assert registry.render().splitlines() == [
+        "# HELP db_latency_seconds Latency.",
+        "# TYPE db_latency_seconds histogram",
+        'db_latency_seconds_bucket{op="read",le="0.1"} 2',
+        'db_latency_seconds_bucket{op="read",le="1"} 2',
+        'db_latency_seconds_bucket{op="read",le="+Inf"} 3',
+        'db_latency_seconds_sum{op="read"} 3.15',
+        'db_latency_seconds_count{op="read"} 3',
+        "# HELP db_calls Calls.",
+        "# TYPE db_calls counter",
+        'db_calls_total{op="read"} 2',
+    ]
+
+
+def test_label_values_are_escaped():
+    registry = Registry()
+    registry.counter("c", "C.", ("error",)).inc('a"b\\c')
+    assert 'c_total{error="a\\"b\\\\c"} 1' in registry.render()
+
+
+@pytest.mark.asyncio
+async def test_requests_labelled_by_route_template(client, questions_repo):
+    async def _find_one(question_id: int):
+        return QuestionSchema(
+            id=question_id, text="q", created_at="2025-01-01T00:00:00Z", answers=[]
+        )
+
+    questions_repo._find_one = _find_one
+    route = "/api/v1/questions/{question_id}"
+    before = HTTP_REQUESTS.value("GET", route, "200")
+
+    await client.get("/api/v1/questions/1")
+    await client.get("/api/v1/questions/2")
+
+    assert HTTP_REQUESTS.value("GET", route, "200") == before + 2
+
+    r = await client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/api/v1/questions/{question_id}"}' in r.text
+    )
+
+
+@pytest.mark.asyncio
+async def test_unmatched_route_and_error_counters(client, questions_repo):
+    async def _find_one(question_id: int):
+        return None
+
+    questions_repo._find_one = _find_one
+    before_unmatched = HTTP_REQUESTS.value("GET", "unmatched", "404")
+    before_errors = APP_ERRORS.value("QuestionNotFoundException")
+
+    await client.get("/no/such/path/12345")
+    r = await client.get("/api/v1/questions/999")
+
+    assert r.status_code == 404
+    assert HTTP_REQUESTS.value("GET", "unmatched", "404") == before_unmatched + 1
+    assert APP_ERRORS.value("QuestionNotFoundException") == before_errors + 1
+
+
+class _Session:
+    async def scalar(self, stmt):
+        return True
+
+
+class _StubRepository(SqlAlchemyRepository):
+    model = QuestionOrm
+
+
+@pytest.mark.asyncio
+async def test_repository_calls_are_timed():
+    repo = _StubRepository(_Session())
+    before = REPOSITORY_CALL_DURATION.count("_StubRepository", "exists")
+
+    assert await repo.exists(1) is True
+    assert REPOSITORY_CALL_DURATION.count("_StubRepository", "exists") == before + 1
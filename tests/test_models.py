@@ -0,0 +1,91 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from src.db.models.answer_model import AnswerOrm
+from src.db.models.change_model import ChangeOrm
+from src.db.models.idempotency_model import IdempotencyKeyOrm
+from src.db.models.question_model import QuestionOrm
+from src.schemas import AnswerSchema, QuestionSchema
+from src.schemas.change_schema import ChangeSchema
+from src.schemas.idempotency_schema import IdempotencyRecordSchema
+from src.schemas.question_schema import QuestionSummarySchema
+from src.utils.serialization import construct_trusted
+
+
+def _question_orm() -> QuestionOrm:
+    created_at = datetime(2026, 1, 1, 12, 0, 0, 5, tzinfo=UTC)
+    question = QuestionOrm(
+        id=1,
+        text="q",
+        created_at=created_at,
+        answer_count=1,
+        last_answered_at=created_at,
+    )
+    question.answers.append(
+        AnswerOrm(id=2, question_id=1, user_id="u", text="a", created_at=created_at)
+    )
+    return question
+
+
+def test_to_read_model_matches_validated_schema():
+    question = _question_orm()
+    validated = QuestionSchema.model_validate(question)
+
+    trusted = question.to_read_model()
+
+    assert isinstance(trusted, QuestionSchema)
+    assert isinstance(trusted.answers[0], AnswerSchema)
+    assert trusted == validated
+    assert trusted.model_dump_json() == validated.model_dump_json()
+    assert trusted.model_fields_set == validated.model_fields_set
+
+
+def test_to_summary_model_matches_validated_schema():
+    question = _question_orm()
+    summary = question.to_summary_model()
+    assert summary == QuestionSummarySchema.model_validate(question)
+    assert summary.model_dump_json() == (
+        QuestionSummarySchema.model_validate(question).model_dump_json()
+    )
+
+
+def test_change_to_read_model_matches_validated_schema():
+    change = ChangeOrm(
+        id=1,
+        txid=100,
+        entity="answer",
+        entity_id=2,
+        question_id=1,
+        op="insert",
+        changed_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+    trusted = change.to_read_model()
+    validated = ChangeSchema.model_validate(change, from_attributes=True)
+    assert trusted.model_dump_json() == validated.model_dump_json()
+
+
+def test_idempotency_to_read_model_matches_validated_schema():
+    record = IdempotencyKeyOrm(scope="s", key="k", fingerprint="f", response="1")
+    trusted = record.to_read_model()
+    validated = IdempotencyRecordSchema.model_validate(record, from_attributes=True)
+    assert trusted.model_dump_json() == validated.model_dump_json()
+
+
+def test_construct_trusted_rejects_incomplete_or_reordered_values():
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    values = {
+        "user_id": "u",
+        "text": "a",
+        "id": 1,
+        "question_id": 1,
+        "created_at": created_at,
+    }
+    assert construct_trusted(AnswerSchema, **values).id == 1
+
+    missing = dict(values)
+    del missing["created_at"]
+    with pytest.raises(TypeError):
+        construct_trusted(AnswerSchema, **missing)
+    with pytest.raises(TypeError):
+        construct_trusted(AnswerSchema, **dict(reversed(values.items())))
@@ -0,0 +1,30 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from src.core.domain_exceptions import InvalidCursorException
+from src.utils.pagination import decode_cursor, encode_cursor, page_from_rows
+
+
+def test_cursor_roundtrip():
+    created_at = datetime(2026, 10, 18, 12, 30, 1, 123456, tzinfo=UTC)
+    cursor = encode_cursor(created_at, 42)
+    assert decode_cursor(cursor, datetime.fromisoformat, int) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "!!!", encode_cursor(1, 2, 3), "bnVsbA"])
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, datetime.fromisoformat, int)
+
+
+def test_page_from_rows_without_next_page():
+    items, next_cursor = page_from_rows([3, 2], limit=2, key=lambda x: (x,))
+    assert items == [3, 2]
+    assert next_cursor is None
+
+
+def test_page_from_rows_with_next_page():
+    items, next_cursor = page_from_rows([3, 2, 1], limit=2, key=lambda x: (x,))
+    assert items == [3, 2]
+    assert decode_cursor(next_cursor, int) == (2,)
@@ -0,0 +1,52 @@
+"""
+Триггеры answer_count / last_answered_at на живом Postgres.
+
+Нужен живой Postgres: см. фикстуру pg_engine в conftest.py.
+"""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from src.schemas.answers_schema import AnswerBatchCreateSchema
+from src.schemas.question_schema import QuestionCreateSchema, QuestionSort
+from src.services.answers_service import AnswersService
+from src.services.questions_service import QuestionsService
+
+
+@pytest.mark.asyncio
+async def test_answer_stats_follow_inserts_and_deletes(pg_uow_factory):
+    questions_service = QuestionsService(uow_factory=pg_uow_factory)
+    answers_service = AnswersService(uow_factory=pg_uow_factory)
+    first, second = await questions_service.add_questions(
+        [QuestionCreateSchema(text="первый"), QuestionCreateSchema(text="второй")]
+    )
+
+    # одна пачка на два вопроса — один срабатывающий statement-level триггер
+    answer_ids = await answers_service.add_answers(
+        [
+            AnswerBatchCreateSchema(
+                question_id=question_id,
+                user_id="e2b50b32-76ae-42f9-a012-4e5ae315645b",
+                text="ответ",
+            )
+            for question_id in (first, first, second)
+        ]
+    )
+
+    page = await questions_service.get_questions_page(
+        limit=10, sort=QuestionSort.answers
+    )
+    assert [(q.id, q.answer_count) for q in page.items] == [(first, 2), (second, 1)]
+    assert all(q.last_answered_at is not None for q in page.items)
+
+    await answers_service.delete_answer(answer_ids[2])
+    question = await questions_service.get_question(second)
+    assert question.answer_count == 0
+    assert question.last_answered_at is None
+
+    activity = await questions_service.get_questions_page(
+        limit=10, sort=QuestionSort.activity
+    )
+    assert [q.id for q in activity.items] == [first, second]
+    assert activity.items[0].last_answered_at <= datetime.now(UTC)
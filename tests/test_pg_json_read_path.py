@@ -0,0 +1,72 @@
+"""
+Сверка JSON, собранного в Postgres, с обычным путём ORM -> pydantic.
+
+Нужен живой Postgres: см. фикстуру pg_engine в conftest.py.
+"""
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+import pytest_asyncio
+
+from src.db.models.answer_model import AnswerOrm
+from src.db.models.question_model import QuestionOrm
+from src.services.questions_service import QuestionsService
+
+
+@pytest_asyncio.fixture
+async def seeded(pg_session_maker):
+    async with pg_session_maker() as session:
+        questions = [
+            # без микросекунд pydantic не пишет дробную часть
+            QuestionOrm(
+                text="без ответов", created_at=datetime(2026, 1, 1, tzinfo=UTC)
+            ),
+            QuestionOrm(
+                text='кавычки " и \\ слеш, \n перевод строки, эмодзи 🚀',
+                created_at=datetime(2026, 1, 2, 3, 4, 5, 600, tzinfo=UTC),
+            ),
+        ]
+        session.add_all(questions)
+        await session.flush()
+        session.add_all(
+            AnswerOrm(
+                question_id=questions[1].id,
+                user_id=f"user-{i}",
+                text=f"ответ {i}\t",
+                created_at=datetime(2026, 1, 3, 0, 0, i, i * 1000, tzinfo=UTC),
+            )
+            for i in range(3)
+        )
+        await session.commit()
+        return [question.id for question in questions]
+
+
+@pytest.fixture
+def questions_service(pg_uow_factory):
+    return QuestionsService(uow_factory=pg_uow_factory)
+
+
+@pytest.mark.asyncio
+async def test_question_json_matches_schema(questions_service, seeded):
+    for question_id in seeded:
+        orm = await questions_service.get_question(question_id)
+        db = await questions_service.get_question_json(question_id)
+        assert json.loads(db) == json.loads(orm.model_dump_json())
+
+
+@pytest.mark.asyncio
+async def test_questions_page_json_matches_schema(questions_service, seeded):
+    orm = await questions_service.get_questions_page(limit=1)
+    db, db_cursor = await questions_service.get_questions_page_json(limit=1)
+    assert json.loads(db) == json.loads(orm.model_dump_json())["items"]
+    assert db_cursor == orm.next_cursor
+
+    cursor = orm.next_cursor
+    orm = await questions_service.get_questions_page(limit=1, cursor=cursor)
+    db, db_cursor = await questions_service.get_questions_page_json(
+        limit=1, cursor=cursor
+    )
+    assert json.loads(db) == json.loads(orm.model_dump_json())["items"]
+    assert db_cursor == orm.next_cursor
@@ -0,0 +1,76 @@
+import pytest
+
+from src.core.config import DbConfig
+from src.db.database import Database
+from src.db.pool_metrics import InstrumentedAsyncQueuePool, PoolStats
+
+
+def make_db(**config) -> Database:
+    # движки создаются лениво, соединений здесь не открывается
+    return Database(
+        DbConfig(host="primary", password="p", user="u", database="d", **config),
+        echo=False,
+    )
+
+
+def test_wait_percentiles():
+    stats = PoolStats()
+    assert stats.wait_percentiles() == {"samples": 0}
+
+    stats.wait_times.extend(i / 1000 for i in range(1, 101))
+    assert stats.wait_percentiles() == {
+        "samples": 100,
+        "p50_ms": 51.0,
+        "p95_ms": 95.0,
+        "p99_ms": 99.0,
+        "max_ms": 100.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_pool_configured_from_db_config():
+    db = make_db(
+        pool_size=3,
+        max_overflow=2,
+        pool_timeout=1.5,
+        replica_urls=["postgresql+asyncpg://u:p@replica-1/d"],
+    )
+    try:
+        for engine in (db.engine, *db.replica_engines):
+            pool = engine.sync_engine.pool
+            assert isinstance(pool, InstrumentedAsyncQueuePool)
+            assert pool.size() == 3
+            assert pool._max_overflow == 2
+            assert pool._timeout == 1.5
+            assert pool.stats is db.pool_stats[engine]
+
+        status = db.pool_status()
+        assert status["primary"]["size"] == 3
+        assert status["primary"]["checked_out"] == 0
+        assert status["primary"]["overflow"] == 0
+        assert status["primary"]["timeouts"] == 0
+        assert [r["host"] for r in status["replicas"]] == ["replica-1"]
+    finally:
+        await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_stats_survive_dispose():
+    db = make_db()
+    stats = db.pool_stats[db.engine]
+    await db.dispose()
+    assert db.engine.sync_engine.pool.stats is stats
+
+
+@pytest.mark.asyncio
+async def test_pool_endpoint(app, client):
+    app.state.db = make_db(pool_size=4)
+    try:
+        r = await client.get("/api/health/pool")
+        assert r.status_code == 200
+        body = r.json()
+        assert body["primary"]["size"] == 4
+        assert body["primary"]["wait"] == {"samples": 0}
+        assert body["replicas"] == []
+    finally:
+        await app.state.db.dispose()
@@ -0,0 +1,122 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.core.config import QueryStatsConfig
+from src.db.db_exceptions import RepeatedStatementError
+from src.db.models.answer_model import AnswerOrm
+from src.db.models.question_model import QuestionOrm
+from src.db.query_stats import (
+    QueryStats,
+    current_query_stats,
+    instrument_engine,
+    start_query_stats,
+    statement_shape,
+    stop_query_stats,
+)
+from src.services.questions_service import QuestionsService
+
+
+def test_statement_shape_collapses_parameter_lists():
+    assert statement_shape("SELECT * FROM t WHERE id IN ($1, $2, $3)") == (
+        "SELECT * FROM t WHERE id IN (?)"
+    )
+    assert statement_shape("SELECT *\n  FROM t WHERE id = $7") == (
+        "SELECT * FROM t WHERE id = ?"
+    )
+
+
+def test_engine_hooks_count_statements_of_current_context():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    stats = QueryStats()
+    token = start_query_stats(stats)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+    finally:
+        stop_query_stats(token)
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 3"))
+
+    assert stats.count == 2
+    assert stats.duration > 0
+
+
+def test_repeated_statement_warns_once(caplog):
+    stats = QueryStats(repeat_threshold=2)
+    for _ in range(5):
+        stats.record("SELECT * FROM answers WHERE question_id = $1", 0.001)
+
+    warnings = [r for r in caplog.records if "N+1" in r.getMessage()]
+    assert len(warnings) == 1
+
+
+def test_repeated_statement_raises_when_configured():
+    stats = QueryStats(repeat_threshold=2, raise_on_repeat=True)
+    stats.record("SELECT $1", 0.001)
+    stats.record("SELECT $1", 0.001)
+    with pytest.raises(RepeatedStatementError):
+        stats.record("SELECT $1", 0.001)
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header(client, questions_repo):
+    async def _find_page(limit, after, **filter_by):
+        # фейковый репозиторий не ходит в БД — отмечаем запросы вручную
+        stats = current_query_stats()
+        stats.record("SELECT q FROM questions", 0.002)
+        stats.record("SELECT a FROM answers WHERE question_id IN ($1, $2)", 0.003)
+        return []
+
+    questions_repo._find_page = _find_page
+
+    r = await client.get("/api/v1/questions")
+    assert r.status_code == 200
+    assert r.headers["server-timing"].endswith('desc="2 queries"')
+    assert r.headers["server-timing"].startswith("db;dur=5.")
+
+
+@pytest.mark.asyncio
+async def test_repeated_statement_fails_request_in_raise_mode(
+    app, client, questions_repo
+):
+    app.state.query_stats_config = QueryStatsConfig(
+        repeat_threshold=1, raise_on_repeat=True
+    )
+
+    async def _find_page(limit, after, **filter_by):
+        stats = current_query_stats()
+        stats.record("SELECT a FROM answers WHERE question_id = $1", 0.001)
+        stats.record("SELECT a FROM answers WHERE question_id = $1", 0.001)
+        return []
+
+    questions_repo._find_page = _find_page
+
+    r = await client.get("/api/v1/questions")
+    assert r.status_code == 500
+
+
+@pytest.mark.asyncio
+async def test_questions_page_has_no_n_plus_one(pg_session_maker, pg_uow_factory):
+    async with pg_session_maker() as session:
+        questions = [QuestionOrm(text=f"q{i}") for i in range(20)]
+        session.add_all(questions)
+        await session.flush()
+        session.add_all(
+            AnswerOrm(question_id=q.id, user_id="u", text="a") for q in questions
+        )
+        await session.commit()
+
+    service = QuestionsService(uow_factory=pg_uow_factory)
+    stats = QueryStats(repeat_threshold=1, raise_on_repeat=True)
+    token = start_query_stats(stats)
+    try:
+        page = await service.get_questions_page(limit=20)
+    finally:
+        stop_query_stats(token)
+
+    assert len(page.items) == 20
+    # вопросы + один selectinload для ответов
+    assert stats.count == 2
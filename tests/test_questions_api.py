@@ -1,31 +1,91 @@
+import asyncio
+import json
 from datetime import UTC, datetime
 
 import pytest
+from starlette.requests import ClientDisconnect
+
+from src.schemas import QuestionSchema
+from src.schemas.question_schema import QuestionSummarySchema
+from src.utils.streaming import (
+    ClosingStreamingResponse,
+    StreamFormat,
+    encode_stream,
+    start_stream,
+)
+
+
+def _question(question_id: int, created_at: datetime) -> QuestionSchema:
+    return QuestionSchema(
+        id=question_id, text="test", created_at=created_at, answers=[]
+    )
 
 
 @pytest.mark.asyncio
 async def test_list_questions_200(client, questions_repo):
-    async def _find_all():
+    async def _find_page(limit, after, sort):
+        assert after is None
         return [
-            {"id": 1, "text": "test", "created_at": datetime.now(UTC), "answers": []},
-            {"id": 2, "text": "test2", "created_at": datetime.now(UTC), "answers": []},
+            _question(2, datetime.now(UTC)),
+            _question(1, datetime.now(UTC)),
         ]
 
-    questions_repo._find_all = _find_all
+    questions_repo._find_page = _find_page
 
     r = await client.get("/api/v1/questions")
     assert r.status_code == 200
-    body = r.json()
-    assert isinstance(body, list)
-    assert {q["id"] for q in body} == {1, 2}
+    # тело — массив, как до пагинации; последней странице курсор не нужен
+    assert {q["id"] for q in r.json()} == {1, 2}
+    assert "link" not in r.headers
+    assert "x-next-cursor" not in r.headers
+
+
+@pytest.mark.asyncio
+async def test_list_questions_next_cursor_roundtrip(client, questions_repo):
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+    seen_after = []
+
+    async def _find_page(limit, after, sort):
+        # сервис запрашивает на одну строку больше, чтобы понять, есть ли ещё
+        assert limit == 3
+        seen_after.append(after)
+        return [_question(i, created_at) for i in (9, 8, 7)]
+
+    questions_repo._find_page = _find_page
+
+    r = await client.get("/api/v1/questions", params={"limit": 2})
+    assert r.status_code == 200
+    assert [q["id"] for q in r.json()] == [9, 8]
+    next_cursor = r.headers["x-next-cursor"]
+    next_url = r.links["next"]["url"]
+    assert next_url == (
+        f"http://testserver/api/v1/questions?limit=2&cursor={next_cursor}"
+    )
+
+    r = await client.get(next_url)
+    assert r.status_code == 200
+    assert seen_after == [None, (created_at, 8)]
+
+
+@pytest.mark.asyncio
+async def test_list_questions_400_on_invalid_cursor(client, questions_repo):
+    r = await client.get("/api/v1/questions", params={"cursor": "not-a-cursor"})
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.asyncio
+async def test_list_questions_422_on_limit_out_of_range(client, questions_repo):
+    r = await client.get("/api/v1/questions", params={"limit": 0})
+    assert r.status_code == 422
 
 
 @pytest.mark.asyncio
 async def test_list_questions_500(client, questions_repo):
-    async def _boom():
+    async def _boom(limit, after, sort):
         raise RuntimeError("db down")
 
-    questions_repo._find_all = _boom
+    questions_repo._find_page = _boom
 
     r = await client.get("/api/v1/questions")
     assert r.status_code == 500
@@ -61,12 +121,7 @@ async def test_create_question_500(client, questions_repo, valid_question_payloa
 @pytest.mark.asyncio
 async def test_get_question_with_answers_200(client, questions_repo):
     async def _find_one(question_id: int):
-        return {
-            "id": question_id,
-            "text": "test",
-            "created_at": datetime.now(UTC),
-            "answers": [],
-        }
+        return _question(question_id, datetime.now(UTC))
 
     questions_repo._find_one = _find_one
 
@@ -133,3 +188,243 @@ async def test_delete_question_500(client, questions_repo):
     r = await client.delete("/api/v1/questions/10")
     assert r.status_code == 500
     assert r.json()["detail"] == "Internal Server Error"
+
+
+@pytest.mark.asyncio
+async def test_stream_questions_ndjson(client, questions_repo):
+    async def _stream_all():
+        for i in (1, 2, 3):
+            yield _question(i, datetime.now(UTC))
+
+    questions_repo._stream_all = _stream_all
+
+    r = await client.get("/api/v1/questions/stream")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    lines = r.text.splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_stream_questions_json_array(client, questions_repo):
+    async def _stream_all():
+        for i in (1, 2):
+            yield _question(i, datetime.now(UTC))
+
+    questions_repo._stream_all = _stream_all
+
+    r = await client.get("/api/v1/questions/stream", params={"format": "json"})
+    assert r.status_code == 200
+    assert [q["id"] for q in r.json()] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_stream_questions_empty_json_array(client, questions_repo):
+    async def _stream_all():
+        return
+        yield
+
+    questions_repo._stream_all = _stream_all
+
+    r = await client.get("/api/v1/questions/stream", params={"format": "json"})
+    assert r.status_code == 200
+    assert r.json() == []
+
+
+@pytest.mark.asyncio
+async def test_stream_questions_500_before_first_row(client, questions_repo):
+    async def _boom():
+        raise RuntimeError("db down")
+        yield
+
+    questions_repo._stream_all = _boom
+
+    r = await client.get("/api/v1/questions/stream")
+    assert r.status_code == 500
+    assert r.json()["detail"] == "Internal Server Error"
+
+
+@pytest.fixture
+def slow_cursor():
+    """Источник: одна строка, затем курсор «зависает»; closed — закрыт ли он."""
+    state = {"closed": False}
+
+    async def _rows():
+        try:
+            yield _question(1, datetime.now(UTC))
+            await asyncio.Event().wait()
+        finally:
+            state["closed"] = True
+
+    state["rows"] = _rows()
+    return state
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream_format", list(StreamFormat))
+async def test_stream_first_row_sent_without_filling_buffer(slow_cursor, stream_format):
+    chunks = await asyncio.wait_for(
+        start_stream(encode_stream(slow_cursor["rows"], stream_format)), timeout=1
+    )
+    first = await anext(chunks)
+    assert b'"id":1' in first
+
+    await chunks.aclose()
+    assert slow_cursor["closed"]
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_when_client_disconnects(slow_cursor):
+    chunks = await start_stream(encode_stream(slow_cursor["rows"], StreamFormat.ndjson))
+    response = ClosingStreamingResponse(chunks)
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            raise OSError("connection reset")
+
+    scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+    with pytest.raises(ClientDisconnect):
+        await response(scope, None, send)
+    assert slow_cursor["closed"]
+
+
+@pytest.mark.asyncio
+async def test_get_question_without_answers_200(client, questions_repo):
+    async def _find_one_summary(question_id: int):
+        return QuestionSummarySchema(
+            id=question_id, text="test", created_at=datetime.now(UTC)
+        )
+
+    questions_repo._find_one_summary = _find_one_summary
+
+    r = await client.get("/api/v1/questions/42", params={"include_answers": False})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["id"] == 42
+    assert "answers" not in body
+
+
+@pytest.mark.asyncio
+async def test_get_question_without_answers_404(client, questions_repo):
+    async def _find_one_summary(question_id: int):
+        return None
+
+    questions_repo._find_one_summary = _find_one_summary
+
+    r = await client.get("/api/v1/questions/42", params={"include_answers": False})
+    assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_questions_batch_201(
+    client, questions_repo, valid_question_payload
+):
+    async def _add_many(rows: list[dict]) -> list[int]:
+        assert len(rows) == 3
+        return [7, 8, 9]
+
+    questions_repo._add_many = _add_many
+
+    r = await client.post("/api/v1/questions/batch", json=[valid_question_payload] * 3)
+    assert r.status_code == 201
+    assert r.json() == [7, 8, 9]
+
+
+@pytest.mark.asyncio
+async def test_create_questions_batch_422_on_too_many(client, valid_question_payload):
+    r = await client.post(
+        "/api/v1/questions/batch", json=[valid_question_payload] * 1001
+    )
+    assert r.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_get_question_render_db(client, questions_repo):
+    payload = '{"text":"test","id":42,"created_at":"2026-01-01T00:00:00Z","answers":[]}'
+
+    async def _find_one_json(question_id: int):
+        return payload
+
+    questions_repo._find_one_json = _find_one_json
+
+    r = await client.get("/api/v1/questions/42", params={"render": "db"})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    assert r.text == payload
+
+
+@pytest.mark.asyncio
+async def test_get_question_render_db_404(client, questions_repo):
+    async def _find_one_json(question_id: int):
+        return None
+
+    questions_repo._find_one_json = _find_one_json
+
+    r = await client.get("/api/v1/questions/42", params={"render": "db"})
+    assert r.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_questions_render_db(client, questions_repo):
+    created_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+    async def _find_page_json(limit, after, sort):
+        return [
+            (created_at, i, f'{{"id":{i},"answers":[]}}') for i in range(limit, 0, -1)
+        ]
+
+    questions_repo._find_page_json = _find_page_json
+
+    r = await client.get("/api/v1/questions", params={"render": "db", "limit": 2})
+    assert r.status_code == 200
+    assert [q["id"] for q in r.json()] == [3, 2]
+    assert r.headers["x-next-cursor"]
+
+
+@pytest.mark.asyncio
+async def test_list_questions_sort_by_answers_cursor(client, questions_repo):
+    seen = []
+
+    async def _find_page(limit, after, sort):
+        seen.append((after, sort))
+        return [
+            QuestionSchema(
+                id=i,
+                text="test",
+                created_at=datetime(2026, 1, 1, tzinfo=UTC),
+                answer_count=i * 10,
+                answers=[],
+            )
+            for i in (3, 2, 1)
+        ]
+
+    questions_repo._find_page = _find_page
+
+    r = await client.get("/api/v1/questions", params={"limit": 2, "sort": "answers"})
+    assert r.status_code == 200
+    assert [q["answer_count"] for q in r.json()] == [30, 20]
+
+    # ссылка на следующую страницу сохраняет sort
+    r = await client.get(r.links["next"]["url"])
+    assert r.status_code == 200
+    assert seen == [(None, "answers"), ((20, 2), "answers")]
+
+
+@pytest.mark.asyncio
+async def test_list_questions_422_on_unknown_sort(client, questions_repo):
+    r = await client.get("/api/v1/questions", params={"sort": "votes"})
+    assert r.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_fast_json_responses_keep_openapi_schema(app):
+    paths = app.openapi()["paths"]
+    schema = paths["/api/v1/questions/{question_id}"]["get"]["responses"]["200"]
+    assert schema["content"]["application/json"]["schema"]["anyOf"] == [
+        {"$ref": "#/components/schemas/QuestionSchema"},
+        {"$ref": "#/components/schemas/QuestionSummarySchema"},
+    ]
+    schema = paths["/api/v1/questions/batch"]["post"]["responses"]["201"]
+    assert schema["content"]["application/json"]["schema"]["items"] == {
+        "type": "integer"
+    }
@@ -0,0 +1,246 @@
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from starlette.requests import Request
+
+from src.api.v1.deps import get_client_key
+from src.core.config import DbConfig
+from src.db.database import Database
+from src.db.routing import ReadRouter, ReplicaStrategy
+from src.utils.unitofwork import ReadOnlyUnitOfWork
+
+
+class FakePool:
+    def __init__(self, checked_out: int):
+        self._checked_out = checked_out
+
+    def checkedout(self) -> int:
+        return self._checked_out
+
+
+class FakeEngine:
+    def __init__(self, checked_out: int = 0):
+        self.pool = FakePool(checked_out)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _router(**kwargs) -> ReadRouter:
+    replicas = kwargs.pop(
+        "replicas", [(FakeEngine(), "replica-1"), (FakeEngine(), "replica-2")]
+    )
+    return ReadRouter(primary="primary", replicas=replicas, **kwargs)
+
+
+def test_without_replicas_reads_go_to_primary():
+    router = ReadRouter(primary="primary", replicas=[])
+    assert router.choose("client") == "primary"
+    assert not router.tracks_writes
+
+
+def test_round_robin():
+    router = _router()
+    assert [router.choose() for _ in range(4)] == [
+        "replica-1",
+        "replica-2",
+        "replica-1",
+        "replica-2",
+    ]
+
+
+def test_least_busy():
+    router = _router(
+        replicas=[(FakeEngine(5), "busy"), (FakeEngine(1), "idle")],
+        strategy=ReplicaStrategy.least_busy,
+    )
+    assert router.choose() == "idle"
+
+
+def test_read_your_writes_window():
+    clock = FakeClock()
+    router = _router(sticky_seconds=2, clock=clock)
+
+    router.mark_write("writer")
+    assert router.choose("writer") == "primary"
+    assert router.choose("someone-else").startswith("replica")
+
+    clock.now = 2
+    assert router.choose("writer").startswith("replica")
+
+
+def test_mark_write_ignored_without_window():
+    router = _router()
+    router.mark_write("writer")
+    assert router.choose("writer").startswith("replica")
+
+
+def test_replica_marked_down_leaves_rotation():
+    clock = FakeClock()
+    router = _router(retry_seconds=10, clock=clock)
+
+    router.mark_down("replica-1")
+    assert [router.choose() for _ in range(3)] == ["replica-2"] * 3
+
+    clock.now = 10
+    assert {router.choose() for _ in range(2)} == {"replica-1", "replica-2"}
+
+
+def test_all_replicas_down_reads_go_to_primary():
+    router = _router(strategy=ReplicaStrategy.least_busy, clock=FakeClock())
+    router.mark_down("replica-1")
+    assert router.choose() == "replica-2"
+
+    router.mark_down("replica-2")
+    assert router.choose() == "primary"
+
+    router.mark_up("replica-1")
+    assert router.choose() == "replica-1"
+
+
+def test_fallback_returns_primary():
+    router = _router(clock=FakeClock())
+    assert router.fallback("replica-1") == "primary"
+    assert not router.is_available("replica-1")
+
+
+def test_client_key_ignores_peer_address():
+    # за прокси или NAT у всех клиентов один адрес
+    def request(headers):
+        return Request(
+            {"type": "http", "headers": headers, "client": ("10.0.0.1", 1234)}
+        )
+
+    assert get_client_key(request([])) is None
+    assert get_client_key(request([(b"x-client-id", b"abc")])) == "abc"
+
+
+class FakeSession:
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+        self.closed = False
+
+    async def connection(self):
+        if self.error is not None:
+            raise self.error
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_read_only_uow_falls_back_when_replica_is_down():
+    dead = FakeSession(ConnectionRefusedError())
+    alive = FakeSession()
+    failed = []
+
+    def fallback(session_maker):
+        failed.append(session_maker)
+        return lambda: alive
+
+    replica = lambda: dead  # noqa: E731
+    async with ReadOnlyUnitOfWork(replica, fallback=fallback) as uow:
+        assert uow.session is alive
+    assert failed == [replica]
+    assert dead.closed and alive.closed
+
+
+@pytest.mark.asyncio
+async def test_check_replicas_marks_lagging_and_unreachable(monkeypatch):
+    db = Database(
+        DbConfig(
+            host="primary",
+            password="p",
+            user="u",
+            database="d",
+            replica_urls=[
+                "postgresql+asyncpg://u:p@replica-1/d",
+                "postgresql+asyncpg://u:p@replica-2/d",
+                "postgresql+asyncpg://u:p@replica-3/d",
+            ],
+            replica_max_lag_seconds=5,
+        ),
+        echo=False,
+    )
+
+    async def replica_lag(engine):
+        if engine.url.host == "replica-3":
+            raise OSError("connection refused")
+        return {"replica-1": 0.0, "replica-2": 30.0}[engine.url.host]
+
+    monkeypatch.setattr(db, "_replica_lag", replica_lag)
+    try:
+        await db.check_replicas()
+        available = [
+            engine.url.host
+            for engine, session_maker in db.read_router.replicas
+            if db.read_router.is_available(session_maker)
+        ]
+        assert available == ["replica-1"]
+    finally:
+        await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_database_routes_reads_to_replica():
+    # тот же Postgres под двумя DSN тоже подходит
+    primary_url = os.getenv("TEST_DATABASE_URL")
+    if not primary_url:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    replica_url = os.getenv("TEST_REPLICA_DATABASE_URL", primary_url)
+    url = make_url(primary_url)
+    db = Database(
+        DbConfig(
+            host=url.host,
+            password=url.password,
+            user=url.username,
+            database=url.database,
+            port=url.port or 5432,
+            replica_urls=[replica_url],
+            read_your_writes_seconds=5,
+        ),
+        echo=False,
+    )
+    try:
+        replica_pool = db.replica_engines[0].pool
+        async with db.read_router.choose("client")() as session:
+            read_only = await session.scalar(
+                text("SELECT current_setting('transaction_read_only')")
+            )
+            assert read_only == "on"
+            assert replica_pool.checkedout() == 1
+
+        db.read_router.mark_write("client")
+        assert db.read_router.choose("client") is db.read_session_maker
+    finally:
+        await db.dispose()
+
+
+@pytest.mark.asyncio
+async def test_database_builds_engine_per_replica():
+    # движки создаются лениво, соединений здесь не открывается
+    db = Database(
+        DbConfig(
+            host="primary",
+            password="p",
+            user="u",
+            database="d",
+            replica_urls=[
+                "postgresql+asyncpg://u:p@replica-1/d",
+                "postgresql+asyncpg://u:p@replica-2/d",
+            ],
+        ),
+        echo=False,
+    )
+    try:
+        assert [e.url.host for e in db.replica_engines] == ["replica-1", "replica-2"]
+        assert db.read_router.choose() is not db.read_session_maker
+    finally:
+        await db.dispose()
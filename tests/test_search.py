@@ -0,0 +1,172 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from src.db.models.answer_model import AnswerOrm
+from src.db.models.question_model import QuestionOrm
+from src.db.repositories.answers_rep import AnswersRepository
+from src.db.repositories.changes_rep import ChangesRepository
+from src.db.repositories.idempotency_rep import IdempotencyRepository
+from src.db.repositories.questions_rep import QuestionsRepository
+from src.schemas.search_schema import SearchHitSchema, SearchSource
+from src.services.search_service import SearchService
+from src.utils.repository import SearchableRepository
+
+CREATED_AT = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def fake_search(source: SearchSource, ranks: dict[int, float]):
+    """search фейкового репозитория: тот же порядок и keyset, что в SQL."""
+    hits = [
+        SearchHitSchema(
+            source=source,
+            id=hit_id,
+            question_id=hit_id,
+            text=f"{source} {hit_id}",
+            created_at=CREATED_AT,
+            rank=rank,
+        )
+        for hit_id, rank in ranks.items()
+    ]
+    hits.sort(key=lambda h: (h.rank, h.id), reverse=True)
+
+    async def _search(query, limit, after, highlight):
+        rows = [
+            h for h in hits if after is None or (h.rank, source.value, h.id) < after
+        ]
+        return rows[:limit]
+
+    return _search
+
+
+def test_only_text_repositories_are_searchable():
+    # у журнала изменений и ключей идемпотентности нет search_vector
+    assert issubclass(QuestionsRepository, SearchableRepository)
+    assert issubclass(AnswersRepository, SearchableRepository)
+    assert not hasattr(ChangesRepository, "search")
+    assert not hasattr(IdempotencyRepository, "search")
+
+
+@pytest.fixture
+def search_service(uow_factory, questions_repo, answers_repo) -> SearchService:
+    questions_repo._search = fake_search(
+        SearchSource.questions, {1: 0.5, 2: 0.2, 3: 0.2}
+    )
+    answers_repo._search = fake_search(SearchSource.answers, {10: 0.5, 11: 0.3})
+    return SearchService(uow_factory=uow_factory)
+
+
+def keys(page):
+    return [(hit.source.value, hit.id) for hit in page.items]
+
+
+@pytest.mark.asyncio
+async def test_search_merges_sources_by_rank(search_service, opened_uows):
+    page = await search_service.search("q", limit=10)
+
+    assert keys(page) == [
+        ("questions", 1),
+        ("answers", 10),
+        ("answers", 11),
+        ("questions", 3),
+        ("questions", 2),
+    ]
+    assert page.next_cursor is None
+    assert [uow.read_only for uow in opened_uows] == [True]
+
+
+@pytest.mark.asyncio
+async def test_search_keyset_pages_cover_everything_once(search_service):
+    seen = []
+    cursor = None
+    while True:
+        page = await search_service.search("q", limit=2, cursor=cursor)
+        seen.extend(keys(page))
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == [
+        ("questions", 1),
+        ("answers", 10),
+        ("answers", 11),
+        ("questions", 3),
+        ("questions", 2),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_search_single_source(search_service):
+    page = await search_service.search("q", limit=10, sources={SearchSource.answers})
+    assert keys(page) == [("answers", 10), ("answers", 11)]
+
+
+@pytest.mark.asyncio
+async def test_search_endpoint(client, questions_repo, answers_repo):
+    calls = []
+
+    async def _search(query, limit, after, highlight):
+        calls.append((query, limit, highlight))
+        return []
+
+    questions_repo._search = _search
+    answers_repo._search = _search
+
+    r = await client.get(
+        "/api/v1/search",
+        params={"q": "postgres индекс", "limit": 5, "highlight": True},
+    )
+    assert r.status_code == 200
+    assert r.json() == {"items": [], "next_cursor": None}
+    assert calls == [("postgres индекс", 6, True)] * 2
+
+
+@pytest.mark.asyncio
+async def test_search_endpoint_validation(client):
+    assert (await client.get("/api/v1/search")).status_code == 422
+    r = await client.get("/api/v1/search", params={"q": "x", "cursor": "garbage"})
+    assert r.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_in_postgres(pg_session_maker, pg_uow_factory):
+    async with pg_session_maker() as session:
+        question = QuestionOrm(text="Как настроить GIN индекс в Postgres?")
+        other = QuestionOrm(text="Что почитать про Python?")
+        session.add_all([question, other])
+        await session.flush()
+        session.add(
+            AnswerOrm(
+                question_id=question.id,
+                user_id="u",
+                text="GIN индекс строится по tsvector колонке",
+            )
+        )
+        await session.commit()
+
+    service = SearchService(uow_factory=pg_uow_factory)
+    page = await service.search("gin индекс", limit=1, highlight=True)
+    assert len(page.items) == 1
+    assert "<mark>" in page.items[0].snippet
+    rest = await service.search("gin индекс", limit=10, cursor=page.next_cursor)
+
+    found = {(hit.source, hit.id) for hit in page.items + rest.items}
+    assert {source for source, _ in found} == {"questions", "answers"}
+    assert len(found) == 2
+    assert rest.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_search_snippet_escapes_markup(pg_session_maker, pg_uow_factory):
+    async with pg_session_maker() as session:
+        session.add(QuestionOrm(text="Почему <script>alert(1)</script> & индекс?"))
+        await session.commit()
+
+    service = SearchService(uow_factory=pg_uow_factory)
+    page = await service.search("индекс", limit=1, highlight=True)
+
+    snippet = page.items[0].snippet
+    assert "<script>" not in snippet
+    assert "&lt;script&gt;" in snippet
+    assert "&amp;" in snippet
+    assert "<mark>индекс</mark>" in snippet
@@ -0,0 +1,40 @@
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.tools.seed import answer_counts, answer_records, question_records
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "zipf"])
+def test_answer_counts_sum(distribution):
+    counts = answer_counts(100, 1000, distribution, random.Random(1))
+    assert len(counts) == 100
+    assert sum(counts) == 1000
+
+
+def test_answer_counts_uniform_is_flat():
+    counts = answer_counts(100, 1050, "uniform", random.Random(1))
+    assert set(counts) == {10, 11}
+
+
+def test_answer_counts_zipf_is_skewed():
+    counts = sorted(answer_counts(1000, 100_000, "zipf", random.Random(1)))
+    # горячий вопрос собирает на порядки больше медианного
+    assert counts[-1] > 100 * counts[len(counts) // 2]
+
+
+def test_records_are_contiguous_and_ordered():
+    rng = random.Random(1)
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    span = timedelta(days=10)
+    questions = list(question_records(5, 3, started, span, rng))
+    answers = list(answer_records(20, 5, [2, 0, 3], started, span, 10, rng))
+
+    assert [row[0] for row in questions] == [5, 6, 7]
+    assert [row[0] for row in answers] == list(range(20, 25))
+    assert [row[1] for row in answers] == [5, 5, 7, 7, 7]
+    question_created = {row[0]: row[2] for row in questions}
+    for _, question_id, user_id, text, created_at in answers:
+        assert user_id.startswith("user-") and text
+        assert question_created[question_id] <= created_at <= started + span
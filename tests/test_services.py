@@ -109,3 +109,36 @@ async def test_questions_service_get_list(questions_service, questions_repo):
 
     questions = await questions_service.get_questions()
     assert [q["id"] for q in questions] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_questions_service_reads_use_read_only_uow(
+    questions_service, questions_repo, opened_uows
+):
+    async def _find_one(question_id):
+        return {"id": question_id}
+
+    async def _find_page(limit, after, sort):
+        return []
+
+    questions_repo._find_one = _find_one
+    questions_repo._find_page = _find_page
+
+    await questions_service.get_question(1)
+    await questions_service.get_questions_page(limit=10)
+    assert [uow.read_only for uow in opened_uows] == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_answers_service_writes_use_read_write_uow(
+    answers_service, answers_repo, opened_uows
+):
+    async def _add_one(data: dict):
+        return 1
+
+    answers_repo._add_one = _add_one
+
+    await answers_service.add_answer(
+        AnswerCreateSchema(user_id="u", text="t"), question_id=1
+    )
+    assert [uow.read_only for uow in opened_uows] == [False]
@@ -0,0 +1,74 @@
+import pytest
+
+from src.utils.unitofwork import ReadOnlyUnitOfWork, UnitOfWork
+
+
+class FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, stmt):
+        self.calls.append(("execute", str(stmt)))
+
+    async def commit(self):
+        self.calls.append("commit")
+
+    async def rollback(self):
+        self.calls.append("rollback")
+
+    async def close(self):
+        self.calls.append("close")
+
+
+@pytest.fixture
+def session():
+    return FakeSession()
+
+
+@pytest.mark.asyncio
+async def test_uow_commits_and_runs_after_commit(session):
+    done = []
+    async with UnitOfWork(lambda: session) as uow:
+        uow.after_commit(lambda: done.append(True))
+        assert done == []
+
+    assert session.calls == ["commit", "close"]
+    assert done == [True]
+
+
+@pytest.mark.asyncio
+async def test_uow_rollback_drops_after_commit(session):
+    done = []
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(lambda: session) as uow:
+            uow.after_commit(lambda: done.append(True))
+            raise RuntimeError("boom")
+
+    assert session.calls == ["rollback", "close"]
+    assert done == []
+
+
+@pytest.mark.asyncio
+async def test_read_only_uow_never_commits(session):
+    async with ReadOnlyUnitOfWork(lambda: session):
+        pass
+
+    assert session.calls == ["close"]
+
+
+@pytest.mark.asyncio
+async def test_read_only_uow_sets_local_statement_timeout(session):
+    async with ReadOnlyUnitOfWork(lambda: session, statement_timeout_ms=1500):
+        pass
+
+    (kind, sql), close = session.calls
+    assert kind == "execute"
+    assert "set_config" in sql
+    assert close == "close"
+
+
+@pytest.mark.asyncio
+async def test_read_only_uow_rejects_writes(session):
+    async with ReadOnlyUnitOfWork(lambda: session) as uow:
+        with pytest.raises(RuntimeError):
+            uow.after_commit(lambda: None)